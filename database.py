@@ -1,7 +1,219 @@
 import os
-from sqlalchemy import create_engine
+import time
+import logging
+import threading
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.requests import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
\ No newline at end of file
+
+# 커넥션 풀 설정 (환경 변수로 조정 가능)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+# Supabase 풀러가 유휴 연결을 끊기 전에 재연결하도록 재활용 주기 설정
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# 이 시간(초) 이상 커넥션을 기다리면 경고 로그 출력
+DB_POOL_WAIT_WARN_SECONDS = float(os.getenv("DB_POOL_WAIT_WARN_SECONDS", "0.5"))
+
+# 비동기 엔진 설정 (미지정 시 DATABASE_URL을 asyncpg 드라이버 URL로 변환)
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+ASYNC_DB_POOL_SIZE = int(os.getenv("ASYNC_DB_POOL_SIZE", str(DB_POOL_SIZE)))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv("ASYNC_DB_MAX_OVERFLOW", str(DB_MAX_OVERFLOW)))
+# Supabase 풀러(pgbouncer transaction 모드)는 prepared statement를 지원하지 않으므로 기본 0
+ASYNC_DB_STATEMENT_CACHE_SIZE = int(os.getenv("ASYNC_DB_STATEMENT_CACHE_SIZE", "0"))
+
+
+class PoolStats:
+    """커넥션 풀 사용 현황 (체크아웃 대기 시간, 사용 중 연결 수, 오버플로)
+
+    카운터는 여러 스레드의 풀 이벤트에서 갱신되므로 모두 잠금 안에서 증가시킨다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.connect_errors = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_count = 0
+        self.wait_total_seconds = 0.0
+        self.wait_max_seconds = 0.0
+        self.pool = None
+
+    def increment(self, field: str):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def record_wait(self, seconds: float, timed_out: bool = False, connect_failed: bool = False):
+        with self._lock:
+            self.wait_count += 1
+            self.wait_total_seconds += seconds
+            if seconds > self.wait_max_seconds:
+                self.wait_max_seconds = seconds
+            if timed_out:
+                self.timeouts += 1
+            if connect_failed:
+                self.connect_errors += 1
+        if seconds >= DB_POOL_WAIT_WARN_SECONDS:
+            logger.warning(f"DB 커넥션 대기 지연: {seconds * 1000:.1f}ms ({self.pool.status() if self.pool else ''})")
+
+    def snapshot(self) -> dict:
+        """현재 풀 상태 조회"""
+        pool = self.pool
+        with self._lock:
+            return {
+                "pool_size": pool.size() if pool else 0,
+                "in_use": pool.checkedout() if pool else 0,
+                "idle": pool.checkedin() if pool else 0,
+                # QueuePool.overflow()는 풀이 덜 찼을 때 음수를 반환하므로 0 이상으로 보정
+                "overflow": max(pool.overflow(), 0) if pool else 0,
+                "max_overflow": DB_MAX_OVERFLOW,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "connect_errors": self.connect_errors,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "wait_count": self.wait_count,
+                "wait_avg_ms": round(self.wait_total_seconds / self.wait_count * 1000, 3) if self.wait_count else 0,
+                "wait_max_ms": round(self.wait_max_seconds * 1000, 3),
+            }
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """체크아웃 대기 시간을 측정하는 QueuePool
+
+    풀 대기 타임아웃(sqlalchemy.exc.TimeoutError)과 새 연결 생성 실패는 따로 집계한다.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        connect_failed = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        except Exception:
+            connect_failed = True
+            raise
+        finally:
+            pool_stats.record_wait(time.perf_counter() - started, timed_out=timed_out, connect_failed=connect_failed)
+
+
+def _register_pool_events(engine):
+    """풀 이벤트 훅 등록 (체크아웃/체크인/연결/무효화 카운트)"""
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        pool_stats.increment("connects")
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        pool_stats.increment("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        pool_stats.increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        pool_stats.increment("invalidations")
+        logger.warning(f"DB 커넥션 무효화: {exception}")
+
+
+def create_db_engine(database_url: str = DATABASE_URL):
+    """커넥션 풀 설정과 계측 훅이 적용된 엔진 생성"""
+    engine = create_engine(
+        database_url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+    pool_stats.pool = engine.pool
+    _register_pool_events(engine)
+    return engine
+
+
+engine = create_db_engine()
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def get_db(request: Request):
+    """요청 단위 DB 세션 의존성 (모든 라우터 공용)
+
+    /batch 하위 요청은 배치 요청의 세션을 함께 사용한다 (하위 요청은 하나씩 실행되며 세션은 배치 요청이 닫음).
+    """
+    batch_db = getattr(request.state, "batch_db", None)
+    if batch_db is not None:
+        yield batch_db
+        return
+
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def to_async_database_url(database_url: str) -> str:
+    """동기 드라이버 URL을 asyncpg 드라이버 URL로 변환"""
+    if not database_url:
+        return database_url
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if database_url.startswith(prefix):
+            return "postgresql+asyncpg://" + database_url[len(prefix):]
+    return database_url
+
+
+def create_async_db_engine(database_url: str = None):
+    """채팅/WebSocket 등 비동기 엔드포인트용 asyncpg 엔진 생성
+
+    이벤트 루프를 막지 않도록 별도의 비동기 풀을 사용하며, 풀 크기/재활용 설정은 동기 엔진과 동일한 규칙을 따른다.
+    """
+    database_url = database_url or ASYNC_DATABASE_URL or to_async_database_url(DATABASE_URL)
+    return create_async_engine(
+        database_url,
+        pool_size=ASYNC_DB_POOL_SIZE,
+        max_overflow=ASYNC_DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": ASYNC_DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": ASYNC_DB_STATEMENT_CACHE_SIZE,
+        },
+    )
+
+
+async_engine = create_async_db_engine()
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    # 커밋 후 속성 접근 시 암묵적 I/O(lazy refresh)가 일어나지 않도록 만료하지 않음
+    expire_on_commit=False,
+)
+
+
+async def get_async_db():
+    """요청 단위 비동기 DB 세션 의존성 (async 엔드포인트 공용)"""
+    async with AsyncSessionLocal() as db:
+        yield db
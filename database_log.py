@@ -1,9 +1,42 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from models import DatabaseLog
 from datetime import datetime
 import uuid
 import json
 
+def build_database_log_entry(
+    table_name: str,
+    record_id: str,
+    action: str,
+    user_id: str = None,
+    old_values: dict = None,
+    new_values: dict = None,
+    changed_fields: list = None,
+    note: str = None,
+    ip_address: str = None,
+    user_agent: str = None
+) -> DatabaseLog:
+    """DatabaseLog 레코드 생성 (동기/비동기 세션 공용)"""
+    # dict와 list를 JSON 문자열로 변환
+    old_values_json = json.dumps(old_values, ensure_ascii=False, default=str) if old_values else None
+    new_values_json = json.dumps(new_values, ensure_ascii=False, default=str) if new_values else None
+    changed_fields_json = json.dumps(changed_fields, ensure_ascii=False, default=str) if changed_fields else None
+    
+    return DatabaseLog(
+        id=str(uuid.uuid4()),
+        table_name=table_name,
+        record_id=record_id,
+        action=action,
+        user_id=user_id,
+        old_values=old_values_json,
+        new_values=new_values_json,
+        changed_fields=changed_fields_json,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        note=note,
+    )
+
 def create_database_log(
     db: Session,
     table_name: str,
@@ -39,24 +72,9 @@ def create_database_log(
             print(f"DatabaseLog 생성 실패: 데이터베이스 세션이 올바르지 않습니다.")
             return
         
-        # dict와 list를 JSON 문자열로 변환
-        old_values_json = json.dumps(old_values, ensure_ascii=False, default=str) if old_values else None
-        new_values_json = json.dumps(new_values, ensure_ascii=False, default=str) if new_values else None
-        changed_fields_json = json.dumps(changed_fields, ensure_ascii=False, default=str) if changed_fields else None
-        
-        # 로그 레코드 생성
-        log_entry = DatabaseLog(
-            id=str(uuid.uuid4()),
-            table_name=table_name,
-            record_id=record_id,
-            action=action,
-            user_id=user_id,
-            old_values=old_values_json,
-            new_values=new_values_json,
-            changed_fields=changed_fields_json,
-            ip_address=ip_address,
-            user_agent=user_agent,
-            note=note,
+        log_entry = build_database_log_entry(
+            table_name, record_id, action, user_id, old_values, new_values,
+            changed_fields, note, ip_address, user_agent
         )
         
         db.add(log_entry)
@@ -70,4 +88,39 @@ def create_database_log(
         try:
             db.rollback()
         except:
-            pass 
\ No newline at end of file
+            pass
+
+async def create_database_log_async(
+    db: AsyncSession,
+    table_name: str,
+    record_id: str,
+    action: str,
+    user_id: str = None,
+    old_values: dict = None,
+    new_values: dict = None,
+    changed_fields: list = None,
+    note: str = None,
+    ip_address: str = None,
+    user_agent: str = None
+):
+    """
+    데이터베이스 로그 생성 (AsyncSession용, 인자는 create_database_log와 동일)
+    """
+    try:
+        log_entry = build_database_log_entry(
+            table_name, record_id, action, user_id, old_values, new_values,
+            changed_fields, note, ip_address, user_agent
+        )
+        
+        db.add(log_entry)
+        await db.commit()
+        
+        print(f"DatabaseLog 생성 완료: {action} on {table_name} - {record_id}")
+        
+    except Exception as e:
+        print(f"DatabaseLog 생성 중 오류 발생: {str(e)}")
+        # 로그 생성 실패 시에도 메인 기능은 계속 진행
+        try:
+            await db.rollback()
+        except:
+            pass
@@ -1,8 +1,12 @@
+import time
+
+# 워커 콜드 스타트 측정 기준 시각 (모듈 임포트 시작)
+STARTUP_STARTED = time.perf_counter()
+
 from fastapi import FastAPI, Depends, HTTPException, Query, status, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, Response
 from fastapi import Request
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
@@ -40,20 +44,29 @@ logger = logging.getLogger(__name__)
 logger.info("=== Sousei System Backend 시작 ===")
 
 # 데이터베이스 및 모델 임포트
-from database import SessionLocal, engine
-from models import Base, Company, Student, BillingMonthlyItem, Grade
+from database import SessionLocal, engine, async_engine, get_db, pool_stats
+from models import Company, Student, BillingMonthlyItem, Grade
 from utils.dependencies import get_current_user
+from utils.sql_profiler import SQLProfilerMiddleware, install_sql_profiler
+from utils.slow_query_log import slow_query_log
+from utils.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, register_runtime_collectors, render_metrics
+from utils.loop_monitor import loop_monitor
+from utils.responses import FastJSONResponse
+from utils.etag import ETagMiddleware
+from utils.compression import CompressionMiddleware
+from utils.cache import cached
 
 # 라우터 임포트
 from routers import auth, contact, residents, students, billing, elderly, companies, grades, buildings, rooms
 from routers import users, upload, room_operations, room_charges, room_utilities, monthly_billing, elderly_care, database_logs
-from routers import invoices, monthly_utilities, chat, websocket, building_permissions
+from routers import invoices, monthly_utilities, chat, websocket, building_permissions, batch, sync
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="Sousei System Backend",
     description="Sousei System의 백엔드 API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # CORS 미들웨어 설정
@@ -77,19 +90,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# 요청 단위 SQL 계측 (쿼리 수/DB 시간 → Server-Timing 헤더, 반복 쿼리 → N+1 의심 경고 로그)
+app.add_middleware(SQLProfilerMiddleware)
+install_sql_profiler(engine)
+install_sql_profiler(async_engine.sync_engine)
+# 느린 쿼리 링 버퍼 (EXPLAIN 샘플링은 동기 엔진 쿼리만 대상)
+slow_query_log.install(engine, explain=True)
+slow_query_log.install(async_engine.sync_engine)
+
+# 운영 메트릭 (/metrics): 라우트별 응답 시간, 동시 처리 수, DB 풀, WebSocket 연결 수
+app.add_middleware(MetricsMiddleware)
+register_runtime_collectors(pool_stats, async_pool=async_engine.pool, ws_manager=ws_manager)
+# 설정 시 /metrics 요청에 Authorization: Bearer <METRICS_TOKEN> 필요
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+# 조건부 GET (약한 ETag, If-None-Match → 304)과 응답 압축 (brotli/gzip)
+# 나중에 추가한 미들웨어가 바깥쪽이므로 ETag는 압축 전 본문으로 계산된다
+app.add_middleware(ETagMiddleware)
+app.add_middleware(CompressionMiddleware)
+
 
-# 정적 파일 및 템플릿 설정
+@app.on_event("startup")
+async def start_loop_monitor():
+    loop_monitor.bind_routes(app)
+    loop_monitor.start()
+
+
+@app.on_event("shutdown")
+async def stop_loop_monitor():
+    await loop_monitor.stop()
+
+
+# 정적 파일 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 데이터베이스 스키마는 Alembic 마이그레이션으로 관리 (alembic upgrade head)
+# 워커 기동 시 create_all로 전체 테이블을 조회하지 않음
 
 # 라우터 등록
 app.include_router(auth.router)
@@ -124,6 +160,15 @@ app.include_router(chat.router)
 # WebSocket 라우터 추가
 app.include_router(websocket.router)
 
+# 대시보드 일괄 조회 (/batch)
+app.include_router(batch.router)
+
+# 마스터 데이터 델타 동기화 (/sync)
+app.include_router(sync.router)
+
+STARTUP_SECONDS = time.perf_counter() - STARTUP_STARTED
+logger.info(f"앱 초기화 완료: {STARTUP_SECONDS * 1000:.1f}ms")
+
 # 루트 엔드포인트
 @app.get("/")
 async def root():
@@ -132,7 +177,14 @@ async def root():
 # 헬스 체크
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
+    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat() + "Z", "db_pool": pool_stats.snapshot()}
+
+# Prometheus 메트릭
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    if METRICS_TOKEN and request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="認証が必要です")
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
 
 # @app.get("/companies/{company_id}")
 # def get_company(company_id: str, db: Session = Depends(get_db)):
@@ -170,9 +222,11 @@ async def health_check():
 
 # 등급 관련 엔드포인트들 (main_newnew.py와 동일한 로직)
 @app.get("/grades")
+@cached("grades.all", tags=("grades",))
 def get_grades(db: Session = Depends(get_db)):
     grades = db.query(Grade).all()
-    return grades
+    # 캐시에는 ORM 객체 대신 컬럼 값만 저장
+    return [{column.key: getattr(grade, column.key) for column in Grade.__table__.columns} for grade in grades]
 
 # PDF 생성 관련 엔드포인트들
 @app.get("/generate-company-invoice-pdf")
@@ -750,6 +804,45 @@ async def debug_websocket_all():
         }
     }
 
+@app.get("/debug/slow-queries")
+async def debug_slow_queries(
+    limit: int = Query(50, ge=1, le=500),
+    min_duration_ms: float = Query(0, ge=0),
+    path: Optional[str] = Query(None, description="경로 또는 라우트 템플릿으로 필터링"),
+    current_user: dict = Depends(get_current_user)
+):
+    """최근 느린 쿼리 조회 (관리자 전용)"""
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="管理者権限が必要です")
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "explain_sample_rate": slow_query_log.explain_sample_rate,
+        "total_recorded": slow_query_log.total,
+        "buffered": len(slow_query_log.entries),
+        "items": slow_query_log.recent(limit=limit, min_duration_ms=min_duration_ms, path=path),
+    }
+
+@app.delete("/debug/slow-queries")
+async def clear_slow_queries(current_user: dict = Depends(get_current_user)):
+    """느린 쿼리 버퍼 비우기 (관리자 전용)"""
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="管理者権限が必要です")
+    slow_query_log.clear()
+    return {"message": "スロークエリログをクリアしました"}
+
+@app.get("/debug/loop-stalls")
+async def debug_loop_stalls(
+    limit: int = Query(50, ge=1, le=500),
+    current_user: dict = Depends(get_current_user)
+):
+    """최근 이벤트 루프 정지 기록 (관리자 전용)"""
+    if current_user.get("role") != "admin":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="管理者権限が必要です")
+    return {
+        "stall_threshold_seconds": loop_monitor.stall_threshold,
+        "items": loop_monitor.recent_stalls(limit),
+    }
+
 @app.post("/api/notify-update")
 async def notify_update(
     request: Request,
@@ -0,0 +1,59 @@
+import os
+from logging.config import fileConfig
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, pool
+
+from alembic import context
+
+load_dotenv()
+
+from models import Base
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# autogenerate 비교 대상 (models.py)
+target_metadata = Base.metadata
+
+
+def get_url() -> str:
+    """마이그레이션 대상 DB URL (-x db_url=... 로 덮어쓰기 가능)"""
+    return context.get_x_argument(as_dictionary=True).get("db_url") or os.getenv("DATABASE_URL")
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        compare_type=True,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """DB에 직접 마이그레이션 적용 (앱 커넥션 풀을 쓰지 않도록 NullPool 사용)"""
+    connectable = create_engine(get_url(), poolclass=pool.NullPool)
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            compare_type=True,
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
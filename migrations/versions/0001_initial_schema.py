@@ -0,0 +1,625 @@
+"""initial schema
+
+models.py 기준 초기 스키마 (기존 create_all로 생성된 DB는 `alembic stamp 0001` 후 upgrade)
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('billing_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('unit', sa.Integer(), nullable=False),
+    sa.Column('billing_type', sa.String(), nullable=False),
+    sa.Column('qna', sa.Integer(), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.Column('group_type', sa.String(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('buildings',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('address', sa.String(), nullable=True),
+    sa.Column('total_rooms', sa.Integer(), nullable=True),
+    sa.Column('note', sa.String(), nullable=True),
+    sa.Column('resident_type', sa.String(), nullable=True),
+    sa.Column('building_type', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('care_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.Text(), nullable=False),
+    sa.Column('category', sa.Text(), nullable=True),
+    sa.Column('price', sa.Integer(), nullable=True),
+    sa.Column('unit', sa.Text(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('care_meal_prices',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('meal_type', sa.Text(), nullable=False),
+    sa.Column('price', sa.Integer(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('care_utility_prices',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('utility_type', sa.Text(), nullable=False),
+    sa.Column('price_per_unit', sa.Integer(), nullable=False),
+    sa.Column('unit', sa.Text(), nullable=False),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('companies',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('address', sa.String(), nullable=True),
+    sa.Column('billing_scope', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('contact',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('creator_id', sa.String(), nullable=False),
+    sa.Column('occurrence_date', sa.Date(), nullable=False),
+    sa.Column('contact_type', sa.String(), nullable=False),
+    sa.Column('contact_content', sa.Text(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('conversations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('title', sa.Text(), nullable=True),
+    sa.Column('is_group', sa.Boolean(), nullable=False),
+    sa.Column('created_by', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('database_logs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('record_id', sa.String(), nullable=False),
+    sa.Column('action', sa.String(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=True),
+    sa.Column('old_values', sa.Text(), nullable=True),
+    sa.Column('new_values', sa.Text(), nullable=True),
+    sa.Column('changed_fields', sa.Text(), nullable=True),
+    sa.Column('ip_address', sa.String(), nullable=True),
+    sa.Column('user_agent', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly_categories',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('category', sa.String(), nullable=False),
+    sa.Column('label', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('grades',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('profiles',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('avatar', sa.String(), nullable=True),
+    sa.Column('department', sa.String(), nullable=True),
+    sa.Column('position', sa.String(), nullable=True),
+    sa.Column('role', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_profiles_id'), 'profiles', ['id'], unique=False)
+    op.create_table('push_subscriptions',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('endpoint', sa.Text(), nullable=False),
+    sa.Column('p256dh', sa.String(), nullable=False),
+    sa.Column('auth', sa.String(), nullable=False),
+    sa.Column('expiration_time', sa.BigInteger(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_push_subscriptions_user_id'), 'push_subscriptions', ['user_id'], unique=False)
+    op.create_table('users',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.Column('password', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('role', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
+    op.create_table('billing_invoices',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('company_id', sa.UUID(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('invoice_date', sa.Date(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(), nullable=False),
+    sa.Column('memo', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('building_categories_rents',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('building_id', sa.UUID(), nullable=False),
+    sa.Column('categories_id', sa.UUID(), nullable=False),
+    sa.Column('monthly_rent', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['building_id'], ['buildings.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['categories_id'], ['elderly_categories.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('contact_comments',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('contact_id', sa.UUID(), nullable=False),
+    sa.Column('operator_id', sa.String(), nullable=True),
+    sa.Column('comment', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['contact_id'], ['contact.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('contact_photos',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('contact_id', sa.UUID(), nullable=False),
+    sa.Column('photo_url', sa.Text(), nullable=False),
+    sa.Column('uploaded_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['contact_id'], ['contact.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('conversation_members',
+    sa.Column('conversation_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('role', sa.String(), nullable=False),
+    sa.Column('joined_at', sa.DateTime(), nullable=True),
+    sa.Column('last_read_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('conversation_id', 'user_id')
+    )
+    op.create_table('departments',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('company_id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['company_id'], ['companies.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('messages',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('conversation_id', sa.UUID(), nullable=False),
+    sa.Column('sender_id', sa.String(), nullable=False),
+    sa.Column('body', sa.Text(), nullable=True),
+    sa.Column('parent_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('edited_at', sa.DateTime(), nullable=True),
+    sa.Column('deleted_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['conversation_id'], ['conversations.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['parent_id'], ['messages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('rooms',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('building_id', sa.UUID(), nullable=False),
+    sa.Column('room_number', sa.String(), nullable=False),
+    sa.Column('rent', sa.Integer(), nullable=True),
+    sa.Column('maintenance', sa.Integer(), nullable=True),
+    sa.Column('service', sa.Integer(), nullable=True),
+    sa.Column('floor', sa.Integer(), nullable=True),
+    sa.Column('capacity', sa.Integer(), nullable=True),
+    sa.Column('is_available', sa.Boolean(), nullable=True),
+    sa.Column('deposit', sa.Integer(), nullable=True),
+    sa.Column('note', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['building_id'], ['buildings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('user_building_permissions',
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('building_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('created_by', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['building_id'], ['buildings.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'building_id')
+    )
+    op.create_table('attachments',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('message_id', sa.UUID(), nullable=False),
+    sa.Column('bucket', sa.String(), nullable=False),
+    sa.Column('file_url', sa.Text(), nullable=False),
+    sa.Column('original_filename', sa.Text(), nullable=True),
+    sa.Column('mime_type', sa.String(), nullable=True),
+    sa.Column('size_bytes', sa.BigInteger(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('phone', sa.String(), nullable=True),
+    sa.Column('avatar', sa.String(), nullable=True),
+    sa.Column('name_katakana', sa.String(), nullable=True),
+    sa.Column('gender', sa.String(), nullable=True),
+    sa.Column('birth_date', sa.Date(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('current_room_id', sa.UUID(), nullable=True),
+    sa.Column('care_level', sa.String(), nullable=True),
+    sa.Column('categories_id', sa.UUID(), nullable=True),
+    sa.Column('note', sa.String(), nullable=True),
+    sa.Column('contract_date', sa.Date(), nullable=True),
+    sa.ForeignKeyConstraint(['categories_id'], ['elderly_categories.id'], ),
+    sa.ForeignKeyConstraint(['current_room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('message_mentions',
+    sa.Column('message_id', sa.UUID(), nullable=False),
+    sa.Column('mentioned_user_id', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('message_id', 'mentioned_user_id')
+    )
+    op.create_table('message_reads',
+    sa.Column('message_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('read_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('message_id', 'user_id')
+    )
+    op.create_table('reactions',
+    sa.Column('message_id', sa.UUID(), nullable=False),
+    sa.Column('user_id', sa.String(), nullable=False),
+    sa.Column('emoji', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['message_id'], ['messages.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('message_id', 'user_id', 'emoji')
+    )
+    op.create_table('residents',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('room_id', sa.UUID(), nullable=False),
+    sa.Column('resident_id', sa.UUID(), nullable=False),
+    sa.Column('resident_type', sa.Text(), nullable=False),
+    sa.Column('check_in_date', sa.Date(), nullable=False),
+    sa.Column('check_out_date', sa.Date(), nullable=True),
+    sa.Column('is_active', sa.Boolean(), nullable=True),
+    sa.Column('note', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('room_id', 'resident_id', 'is_active', name='unique_active_resident_per_room')
+    )
+    op.create_table('room_utilities',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('room_id', sa.UUID(), nullable=False),
+    sa.Column('utility_type', sa.Text(), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('period_end', sa.Date(), nullable=False),
+    sa.Column('usage', sa.Numeric(), nullable=True),
+    sa.Column('unit_price', sa.Numeric(), nullable=True),
+    sa.Column('total_amount', sa.Numeric(), nullable=True),
+    sa.Column('charge_month', sa.Date(), nullable=False),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('students',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('company_id', sa.String(), nullable=True),
+    sa.Column('consultant', sa.SmallInteger(), nullable=True),
+    sa.Column('phone', sa.String(), nullable=True),
+    sa.Column('avatar', sa.String(), nullable=True),
+    sa.Column('grade_id', sa.String(), nullable=True),
+    sa.Column('cooperation_submitted_date', sa.Date(), nullable=True),
+    sa.Column('cooperation_submitted_place', sa.String(), nullable=True),
+    sa.Column('assignment_date', sa.Date(), nullable=True),
+    sa.Column('ward', sa.String(), nullable=True),
+    sa.Column('name_katakana', sa.String(), nullable=True),
+    sa.Column('gender', sa.String(), nullable=True),
+    sa.Column('birth_date', sa.Date(), nullable=True),
+    sa.Column('nationality', sa.String(), nullable=True),
+    sa.Column('has_spouse', sa.Boolean(), nullable=True),
+    sa.Column('japanese_level', sa.String(), nullable=True),
+    sa.Column('passport_number', sa.String(), nullable=True),
+    sa.Column('residence_card_number', sa.String(), nullable=True),
+    sa.Column('residence_card_start', sa.Date(), nullable=True),
+    sa.Column('residence_card_expiry', sa.Date(), nullable=True),
+    sa.Column('resignation_date', sa.Date(), nullable=True),
+    sa.Column('local_address', sa.String(), nullable=True),
+    sa.Column('address', sa.String(), nullable=True),
+    sa.Column('experience_over_2_years', sa.Boolean(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('arrival_type', sa.String(), nullable=True),
+    sa.Column('entry_date', sa.Date(), nullable=True),
+    sa.Column('interview_date', sa.Date(), nullable=True),
+    sa.Column('pre_guidance_date', sa.Date(), nullable=True),
+    sa.Column('orientation_date', sa.Date(), nullable=True),
+    sa.Column('certification_application_date', sa.Date(), nullable=True),
+    sa.Column('visa_application_date', sa.Date(), nullable=True),
+    sa.Column('passport_expiration_date', sa.Date(), nullable=True),
+    sa.Column('student_type', sa.String(), nullable=True),
+    sa.Column('current_room_id', sa.UUID(), nullable=True),
+    sa.Column('facebook_name', sa.String(), nullable=True),
+    sa.Column('visa_year', sa.String(), nullable=True),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.Column('department_id', sa.UUID(), nullable=True),
+    sa.ForeignKeyConstraint(['current_room_id'], ['rooms.id'], ),
+    sa.ForeignKeyConstraint(['department_id'], ['departments.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('billing_monthly_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('item_name', sa.String(), nullable=False),
+    sa.Column('amount', sa.Numeric(), nullable=False),
+    sa.Column('memo', sa.String(), nullable=True),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly_contracts',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('elderly_id', sa.UUID(), nullable=True),
+    sa.Column('room_id', sa.UUID(), nullable=True),
+    sa.Column('rent', sa.Integer(), nullable=False),
+    sa.Column('maintenance', sa.Integer(), nullable=True),
+    sa.Column('service', sa.Integer(), nullable=True),
+    sa.Column('deposit', sa.Integer(), nullable=True),
+    sa.Column('contract_start', sa.Date(), nullable=False),
+    sa.Column('contract_end', sa.Date(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['elderly_id'], ['elderly.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly_hospitalizations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('elderly_id', sa.UUID(), nullable=False),
+    sa.Column('hospital_name', sa.String(), nullable=False),
+    sa.Column('admission_date', sa.Date(), nullable=False),
+    sa.Column('discharge_date', sa.Date(), nullable=True),
+    sa.Column('last_meal_date', sa.Date(), nullable=True),
+    sa.Column('last_meal_type', sa.String(), nullable=True),
+    sa.Column('meal_resume_date', sa.Date(), nullable=True),
+    sa.Column('meal_resume_type', sa.String(), nullable=True),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('created_by', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['elderly_id'], ['elderly.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly_meal_records',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('resident_id', sa.UUID(), nullable=False),
+    sa.Column('skip_date', sa.Date(), nullable=False),
+    sa.Column('meal_type', sa.String(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['resident_id'], ['residents.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('resident_id', 'skip_date', 'meal_type', name='unique_skip_per_meal_per_day')
+    )
+    op.create_table('invoices',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.String(), nullable=False),
+    sa.Column('invoice_number', sa.String(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('total_amount', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('student_id', 'year', 'month', name='unique_invoice_per_month')
+    )
+    op.create_table('residence_card_histories',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('card_number', sa.String(), nullable=False),
+    sa.Column('start_date', sa.Date(), nullable=False),
+    sa.Column('expiry_date', sa.Date(), nullable=False),
+    sa.Column('registered_at', sa.DateTime(), nullable=True),
+    sa.Column('application_date', sa.Date(), nullable=False),
+    sa.Column('year', sa.String(), nullable=True),
+    sa.Column('note', sa.String(), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('room_charges',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('room_id', sa.UUID(), nullable=False),
+    sa.Column('charge_month', sa.Date(), nullable=False),
+    sa.Column('total_amount', sa.Numeric(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('room_logs',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('room_id', sa.UUID(), nullable=True),
+    sa.Column('student_id', sa.UUID(), nullable=True),
+    sa.Column('action', sa.String(), nullable=False),
+    sa.Column('action_date', sa.Date(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('note', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['room_id'], ['rooms.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('utility_allocations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('utility_id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('days_used', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Numeric(), nullable=False),
+    sa.Column('usage_ratio', sa.Numeric(), nullable=True),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ),
+    sa.ForeignKeyConstraint(['utility_id'], ['room_utilities.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('billing_invoice_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('invoice_id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('item_name', sa.String(), nullable=False),
+    sa.Column('amount', sa.Numeric(), nullable=False),
+    sa.Column('memo', sa.String(), nullable=True),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('original_item_id', sa.UUID(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['invoice_id'], ['billing_invoices.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['original_item_id'], ['billing_monthly_items.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('charge_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('room_charge_id', sa.UUID(), nullable=False),
+    sa.Column('charge_type', sa.Text(), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=True),
+    sa.Column('period_end', sa.Date(), nullable=True),
+    sa.Column('amount', sa.Numeric(), nullable=True),
+    sa.Column('unit_price', sa.Numeric(), nullable=True),
+    sa.Column('quantity', sa.Numeric(), nullable=True),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['room_charge_id'], ['room_charges.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly_invoices',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('elderly_contract_id', sa.UUID(), nullable=True),
+    sa.Column('invoice_date', sa.Date(), nullable=False),
+    sa.Column('due_date', sa.Date(), nullable=True),
+    sa.Column('total_amount', sa.Integer(), nullable=True),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['elderly_contract_id'], ['elderly_contracts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('invoice_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('invoice_id', sa.UUID(), nullable=False),
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('unit_price', sa.Integer(), nullable=False),
+    sa.Column('quantity', sa.Integer(), nullable=False),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('memo', sa.String(), nullable=True),
+    sa.Column('type', sa.String(), nullable=False),
+    sa.ForeignKeyConstraint(['invoice_id'], ['invoices.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('charge_item_allocations',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('charge_item_id', sa.UUID(), nullable=False),
+    sa.Column('student_id', sa.UUID(), nullable=False),
+    sa.Column('amount', sa.Numeric(), nullable=False),
+    sa.Column('days_used', sa.Integer(), nullable=True),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['charge_item_id'], ['charge_items.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('elderly_invoices_items',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('elderly_invoice_id', sa.UUID(), nullable=True),
+    sa.Column('name', sa.Text(), nullable=False),
+    sa.Column('usage_quantity', sa.Numeric(), nullable=True),
+    sa.Column('amount', sa.Integer(), nullable=False),
+    sa.Column('sort_order', sa.Integer(), nullable=True),
+    sa.Column('memo', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['elderly_invoice_id'], ['elderly_invoices.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('elderly_invoices_items')
+    op.drop_table('charge_item_allocations')
+    op.drop_table('invoice_items')
+    op.drop_table('elderly_invoices')
+    op.drop_table('charge_items')
+    op.drop_table('billing_invoice_items')
+    op.drop_table('utility_allocations')
+    op.drop_table('room_logs')
+    op.drop_table('room_charges')
+    op.drop_table('residence_card_histories')
+    op.drop_table('invoices')
+    op.drop_table('elderly_meal_records')
+    op.drop_table('elderly_hospitalizations')
+    op.drop_table('elderly_contracts')
+    op.drop_table('billing_monthly_items')
+    op.drop_table('students')
+    op.drop_table('room_utilities')
+    op.drop_table('residents')
+    op.drop_table('reactions')
+    op.drop_table('message_reads')
+    op.drop_table('message_mentions')
+    op.drop_table('elderly')
+    op.drop_table('attachments')
+    op.drop_table('user_building_permissions')
+    op.drop_table('rooms')
+    op.drop_table('messages')
+    op.drop_table('departments')
+    op.drop_table('conversation_members')
+    op.drop_table('contact_photos')
+    op.drop_table('contact_comments')
+    op.drop_table('building_categories_rents')
+    op.drop_table('billing_invoices')
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_index(op.f('ix_push_subscriptions_user_id'), table_name='push_subscriptions')
+    op.drop_table('push_subscriptions')
+    op.drop_index(op.f('ix_profiles_id'), table_name='profiles')
+    op.drop_table('profiles')
+    op.drop_table('grades')
+    op.drop_table('elderly_categories')
+    op.drop_table('database_logs')
+    op.drop_table('conversations')
+    op.drop_table('contact')
+    op.drop_table('companies')
+    op.drop_table('care_utility_prices')
+    op.drop_table('care_meal_prices')
+    op.drop_table('care_items')
+    op.drop_table('buildings')
+    op.drop_table('billing_items')
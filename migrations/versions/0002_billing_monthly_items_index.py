@@ -0,0 +1,32 @@
+"""billing_monthly_items (student_id, year, month) index
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # create_all은 기존 테이블에 인덱스를 추가하지 않으므로 수동으로 생성된 경우를 고려
+    op.create_index(
+        'idx_billing_monthly_items_student_year_month',
+        'billing_monthly_items',
+        ['student_id', 'year', 'month'],
+        unique=False,
+        if_not_exists=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_billing_monthly_items_student_year_month', table_name='billing_monthly_items')
@@ -0,0 +1,48 @@
+"""residency / room utility indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003'
+down_revision: Union[str, None] = '0002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스명, 테이블, 컬럼, 부분 인덱스 조건)
+INDEXES = [
+    ('idx_residents_resident_period', 'residents', ['resident_id', 'check_in_date', 'check_out_date'], None),
+    ('idx_residents_room_active_check_out', 'residents', ['room_id', 'is_active', 'check_out_date'], None),
+    ('idx_residents_current_by_resident', 'residents', ['resident_id', 'resident_type'], 'check_out_date IS NULL'),
+    ('idx_room_utilities_room_charge_month', 'room_utilities', ['room_id', 'charge_month'], None),
+]
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블의 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
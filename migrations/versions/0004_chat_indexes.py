@@ -0,0 +1,47 @@
+"""chat message / read / member indexes
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004'
+down_revision: Union[str, None] = '0003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (인덱스명, 테이블, 컬럼, 부분 인덱스 조건)
+INDEXES = [
+    ('idx_messages_conversation_created_live', 'messages', ['conversation_id', sa.text('created_at DESC')], 'deleted_at IS NULL'),
+    ('idx_message_reads_user_message', 'message_reads', ['user_id', 'message_id'], None),
+    ('idx_conversation_members_user_id', 'conversation_members', ['user_id'], None),
+]
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블의 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,65 @@
+"""align varchar foreign keys to uuid
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 00:00:00
+
+students.company_id / students.grade_id / invoices.student_id는 UUID 기본키를 참조하지만
+varchar로 생성되어 있어 Postgres가 FK를 만들 수 없고, 비교 시 캐스팅 때문에 인덱스를 사용하지 못했다.
+컬럼을 uuid로 변환하고 FK와 조회용 인덱스를 추가한다.
+(참조 대상이 없는 값이 있으면 FK 생성 단계에서 실패하므로 적용 전에 정리해야 한다)
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005'
+down_revision: Union[str, None] = '0004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (테이블, 컬럼, 참조 테이블, FK 이름, ON DELETE, NULL 허용)
+COLUMNS = [
+    ('students', 'company_id', 'companies', 'students_company_id_fkey', None, True),
+    ('students', 'grade_id', 'grades', 'students_grade_id_fkey', None, True),
+    ('invoices', 'student_id', 'students', 'invoices_student_id_fkey', 'CASCADE', False),
+]
+
+
+def upgrade() -> None:
+    for table, column, referent, fk_name, ondelete, nullable in COLUMNS:
+        op.execute(f'ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {fk_name}')
+        # 빈 문자열은 NULL로 변환 (이미 uuid인 경우에도 동작하도록 text를 거쳐 변환)
+        op.alter_column(
+            table,
+            column,
+            existing_type=sa.String(),
+            existing_nullable=nullable,
+            type_=postgresql.UUID(as_uuid=True),
+            postgresql_using=f"NULLIF({column}::text, '')::uuid"
+        )
+        op.create_foreign_key(fk_name, table, referent, [column], ['id'], ondelete=ondelete)
+
+    # 회사별 학생 조회용 (invoices.student_id는 unique_invoice_per_month가 선두 컬럼으로 커버)
+    op.create_index('idx_students_company_id', 'students', ['company_id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_students_company_id', table_name='students', if_exists=True)
+
+    for table, column, referent, fk_name, ondelete, nullable in reversed(COLUMNS):
+        op.drop_constraint(fk_name, table, type_='foreignkey')
+        op.alter_column(
+            table,
+            column,
+            existing_type=postgresql.UUID(as_uuid=True),
+            existing_nullable=nullable,
+            type_=sa.String(),
+            postgresql_using=f'{column}::text'
+        )
@@ -0,0 +1,71 @@
+"""student search pg_trgm indexes
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006'
+down_revision: Union[str, None] = '0005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# 가타카나(ァ..ヶ) → 히라가나(ぁ..ゖ) 변환표 (utils/student_search.normalize_search_text와 동일한 규칙)
+KATAKANA = ''.join(chr(code) for code in range(0x30A1, 0x30F7))
+HIRAGANA = ''.join(chr(code - 0x60) for code in range(0x30A1, 0x30F7))
+
+# 검색 정규화 함수: NFKC(반각/전각 통일) → 가타카나를 히라가나로 → 소문자
+# 식 인덱스에 사용하므로 IMMUTABLE로 선언 (search_path에 의존하지 않도록 함수 호출은 스키마를 명시)
+FUNCTIONS = [
+    f"""
+    CREATE OR REPLACE FUNCTION search_normalize(value text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT lower(translate(normalize(coalesce(value, ''), NFKC), '{KATAKANA}', '{HIRAGANA}'))
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION students_search_document(
+        name text, name_katakana text, nationality text, email text
+    ) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT public.search_normalize(
+            coalesce(name, '') || ' ' || coalesce(name_katakana, '') || ' ' ||
+            coalesce(nationality, '') || ' ' || coalesce(email, '')
+        )
+    $$
+    """,
+]
+
+# (인덱스명, 테이블, 인덱스 식) - grades는 행 수가 적어 인덱스 없이 조회
+INDEXES = [
+    ('idx_students_search_trgm', 'students',
+     'students_search_document(name, name_katakana, nationality, email) gin_trgm_ops'),
+    ('idx_rooms_room_number_trgm', 'rooms', 'search_normalize(room_number) gin_trgm_ops'),
+    ('idx_buildings_name_trgm', 'buildings', 'search_normalize(name) gin_trgm_ops'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for statement in FUNCTIONS:
+        op.execute(statement)
+
+    # 운영 중인 테이블의 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for name, table, expression in INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} USING gin ({expression})")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+    op.execute("DROP FUNCTION IF EXISTS students_search_document(text, text, text, text)")
+    op.execute("DROP FUNCTION IF EXISTS search_normalize(text)")
@@ -0,0 +1,104 @@
+"""master data updated_at and sync tombstones
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 00:00:00
+
+/sync 델타 동기화를 위해 students/rooms/buildings/companies/elderly에 updated_at을 추가하고,
+삭제된 행을 기록하는 sync_tombstones 테이블을 만든다.
+
+- updated_at은 ORM 쓰기에서는 모델의 onupdate로, 그 외(Supabase 대시보드, SQL 직접 실행)에서는
+  BEFORE UPDATE 트리거로 갱신된다. 기존 행은 마이그레이션 시각으로 채워진다.
+- 삭제는 AFTER DELETE 트리거가 sync_tombstones에 기록하므로 ORM 일괄 삭제와 ON DELETE CASCADE도 포함된다.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0007'
+down_revision: Union[str, None] = '0006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ['students', 'rooms', 'buildings', 'companies', 'elderly']
+
+FUNCTIONS = [
+    """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.updated_at = now();
+        RETURN NEW;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION record_sync_tombstone() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO public.sync_tombstones (table_name, row_id) VALUES (TG_TABLE_NAME, OLD.id);
+        RETURN OLD;
+    END
+    $$
+    """,
+]
+
+
+def upgrade() -> None:
+    # now()는 STABLE이므로 테이블을 다시 쓰지 않고 기존 행에 마이그레이션 시각이 채워진다 (PostgreSQL 11+)
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True)
+        )
+
+    op.create_table(
+        'sync_tombstones',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('row_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_sync_tombstones_deleted_at', 'sync_tombstones', ['deleted_at'], unique=False)
+
+    for statement in FUNCTIONS:
+        op.execute(statement)
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+        op.execute(
+            f"CREATE TRIGGER {table}_sync_tombstone AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_sync_tombstone()"
+        )
+
+    # 운영 중인 테이블의 쓰기를 막지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{table}_updated_at ON {table} (updated_at)")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS idx_{table}_updated_at")
+
+    for table in reversed(TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_sync_tombstone ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_sync_tombstone()")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    op.drop_index('idx_sync_tombstones_deleted_at', table_name='sync_tombstones')
+    op.drop_table('sync_tombstones')
+
+    for table in reversed(TABLES):
+        op.drop_column(table, 'updated_at')
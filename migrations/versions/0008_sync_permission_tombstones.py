@@ -0,0 +1,51 @@
+"""sync tombstones for building permission removal
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 00:00:00
+
+/sync의 건물 삭제 기록은 권한 필터를 적용해야 하지만, 건물이 삭제되면 user_building_permissions 행도
+ON DELETE CASCADE로 함께 삭제되어 현재 권한만으로는 삭제된 건물을 걸러낼 수 없다.
+권한 행이 삭제될 때(권한 회수, 건물 삭제) 사용자 ID와 건물 ID를 sync_tombstones에 기록하여
+해당 사용자에게만 건물 삭제로 전달한다.
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0008'
+down_revision: Union[str, None] = '0007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FUNCTION = """
+CREATE OR REPLACE FUNCTION record_permission_tombstone() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO public.sync_tombstones (table_name, row_id, user_id)
+    VALUES (TG_TABLE_NAME, OLD.building_id, OLD.user_id);
+    RETURN OLD;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.add_column('sync_tombstones', sa.Column('user_id', sa.String(), nullable=True))
+    op.execute(FUNCTION)
+    op.execute(
+        "CREATE TRIGGER user_building_permissions_sync_tombstone AFTER DELETE ON user_building_permissions "
+        "FOR EACH ROW EXECUTE FUNCTION record_permission_tombstone()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS user_building_permissions_sync_tombstone ON user_building_permissions")
+    op.execute("DROP FUNCTION IF EXISTS record_permission_tombstone()")
+    op.execute("DELETE FROM sync_tombstones WHERE table_name = 'user_building_permissions'")
+    op.drop_column('sync_tombstones', 'user_id')
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, BigInteger, Integer, DateTime, ForeignKey, Boolean, Date, SmallInteger, UniqueConstraint, func, Text, Numeric
+from sqlalchemy import Column, String, BigInteger, Integer, DateTime, ForeignKey, Boolean, Date, SmallInteger, UniqueConstraint, Index, func, Text, Numeric, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
@@ -34,11 +34,11 @@ class Student(Base):
     name = Column(String)
     email = Column(String)
     created_at = Column(DateTime, default=datetime.utcnow)
-    company_id = Column(String, ForeignKey("companies.id"))
+    company_id = Column(UUID(as_uuid=True), ForeignKey("companies.id"))
     consultant = Column(SmallInteger)
     phone = Column(String)
     avatar = Column(String, default="/src/assets/images/avatars/avatar-1.png")
-    grade_id = Column(String, ForeignKey("grades.id"))
+    grade_id = Column(UUID(as_uuid=True), ForeignKey("grades.id"))
     cooperation_submitted_date = Column(Date)
     cooperation_submitted_place = Column(String)
     assignment_date = Column(Date)
@@ -72,6 +72,8 @@ class Student(Base):
     visa_year = Column(String)
     note = Column(Text)
     department_id = Column(UUID(as_uuid=True), ForeignKey("departments.id"))
+    # 델타 동기화(/sync)용 변경 시각 (ORM 외 UPDATE는 마이그레이션 0007의 트리거가 갱신)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # 관계 설정
     company = relationship("Company", back_populates="students")
@@ -81,6 +83,12 @@ class Student(Base):
     residence_card_histories = relationship("ResidenceCardHistory", back_populates="student", cascade="all, delete-orphan")
     department = relationship("Department", back_populates="students")
 
+    # 검색용 pg_trgm 식 인덱스(idx_students_search_trgm)는 마이그레이션 0006에서 관리
+    __table_args__ = (
+        Index('idx_students_company_id', 'company_id'),
+        Index('idx_students_updated_at', 'updated_at'),
+    )
+
 class Company(Base):
     __tablename__ = "companies"
 
@@ -89,12 +97,17 @@ class Company(Base):
     address = Column(String)
     billing_scope = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Student와의 관계 설정
     students = relationship("Student", back_populates="company")
     # Department와의 관계 설정
     departments = relationship("Department", back_populates="company")
 
+    __table_args__ = (
+        Index('idx_companies_updated_at', 'updated_at'),
+    )
+
 class Department(Base):
     __tablename__ = "departments"
 
@@ -122,7 +135,7 @@ class Invoice(Base):
     __tablename__ = "invoices"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    student_id = Column(String, ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
+    student_id = Column(UUID(as_uuid=True), ForeignKey("students.id", ondelete="CASCADE"), nullable=False)
     invoice_number = Column(String, nullable=False)
     year = Column(Integer, nullable=False)
     month = Column(Integer, nullable=False)
@@ -178,11 +191,16 @@ class Building(Base):
     note = Column(String)
     resident_type = Column(String)
     building_type = Column(String)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # 관계 설정
     rooms = relationship("Room", back_populates="building", cascade="all, delete-orphan")
     user_permissions = relationship("UserBuildingPermission", back_populates="building", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_buildings_updated_at', 'updated_at'),
+    )
+
 class UserBuildingPermission(Base):
     """유저별 빌딩 접근 권한"""
     __tablename__ = "user_building_permissions"
@@ -209,12 +227,17 @@ class Room(Base):
     is_available = Column(Boolean, default=True)
     deposit = Column(Integer)
     note = Column(String)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # 관계 설정
     building = relationship("Building", back_populates="rooms")
     current_residents = relationship("Student", back_populates="current_room")
     residents = relationship("Resident", back_populates="room")
 
+    __table_args__ = (
+        Index('idx_rooms_updated_at', 'updated_at'),
+    )
+
 class Resident(Base):
     __tablename__ = "residents"
 
@@ -242,6 +265,13 @@ class Resident(Base):
 
     __table_args__ = (
         UniqueConstraint('room_id', 'resident_id', 'is_active', name='unique_active_resident_per_room'),
+        # 거주자별 기간 겹침 조회 (resident_id = ? AND check_in_date <= ? AND (check_out_date IS NULL OR check_out_date >= ?))
+        Index('idx_residents_resident_period', 'resident_id', 'check_in_date', 'check_out_date'),
+        # 방별 현재/기간 거주자 조회 (room_id = ? AND is_active AND check_out_date ...)
+        Index('idx_residents_room_active_check_out', 'room_id', 'is_active', 'check_out_date'),
+        # 현재 거주 중인 방 조회 (퇴실하지 않은 거주 기록만 포함하는 부분 인덱스)
+        Index('idx_residents_current_by_resident', 'resident_id', 'resident_type',
+              postgresql_where=text('check_out_date IS NULL')),
     )
 
 class RoomLog(Base):
@@ -324,6 +354,10 @@ class RoomUtility(Base):
     # 관계 설정
     room = relationship("Room", foreign_keys=[room_id])
 
+    __table_args__ = (
+        Index('idx_room_utilities_room_charge_month', 'room_id', 'charge_month'),
+    )
+
 class UtilityAllocation(Base):
     __tablename__ = "utility_allocations"
 
@@ -393,12 +427,17 @@ class Elderly(Base):
     categories_id = Column(UUID(as_uuid=True), ForeignKey("elderly_categories.id"), nullable=True)
     note = Column(String)
     contract_date = Column(Date)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # 관계 설정
     current_room = relationship("Room", foreign_keys=[current_room_id])
     category = relationship("ElderlyCategories", foreign_keys=[categories_id])
     hospitalizations = relationship("ElderlyHospitalization", back_populates="elderly", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('idx_elderly_updated_at', 'updated_at'),
+    )
+
 
 
 class ElderlyCategories(Base):
@@ -515,6 +554,10 @@ class BillingMonthlyItem(Base):
     # 관계 설정
     student = relationship("Student", foreign_keys=[student_id])
 
+    __table_args__ = (
+        Index('idx_billing_monthly_items_student_year_month', 'student_id', 'year', 'month'),
+    )
+
 class BillingInvoice(Base):
     __tablename__ = "billing_invoices"
 
@@ -667,6 +710,11 @@ class ConversationMember(Base):
     # 관계 설정
     conversation = relationship("Conversation", back_populates="members")
     
+    # 복합 PK는 conversation_id가 선두이므로 사용자별 참여 대화방 조회용 인덱스를 별도로 둠
+    __table_args__ = (
+        Index('idx_conversation_members_user_id', 'user_id'),
+    )
+    
     # Supabase auth.users와의 가상 관계
     @property
     def user_info(self):
@@ -692,6 +740,12 @@ class Message(Base):
     reads = relationship("MessageRead", back_populates="message", cascade="all, delete-orphan")
     mentions = relationship("MessageMention", back_populates="message", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # 대화방별 최신 메시지 조회 (삭제되지 않은 메시지만 포함하는 부분 인덱스)
+        Index('idx_messages_conversation_created_live', 'conversation_id', created_at.desc(),
+              postgresql_where=text('deleted_at IS NULL')),
+    )
+    
     # Supabase auth.users와의 가상 관계
     @property
     def sender_info(self):
@@ -707,6 +761,11 @@ class MessageRead(Base):
     # 관계 설정
     message = relationship("Message", back_populates="reads")
     
+    # 복합 PK는 message_id가 선두이므로 사용자별 읽음 여부 조회 (user_id = ? AND message_id IN ...)용 인덱스
+    __table_args__ = (
+        Index('idx_message_reads_user_message', 'user_id', 'message_id'),
+    )
+    
     # Supabase auth.users와의 가상 관계
     @property
     def user_info(self):
@@ -776,3 +835,24 @@ class PushSubscription(Base):
     @property
     def user_info(self):
         return None  # 실제 구현에서는 Supabase 클라이언트로 조회
+
+
+class SyncTombstone(Base):
+    """델타 동기화(/sync)용 삭제 기록
+
+    students/rooms/buildings/companies/elderly 행이 삭제되면 마이그레이션 0007의 AFTER DELETE 트리거가 기록한다
+    (ORM 삭제, 일괄 삭제, ON DELETE CASCADE 모두 포함).
+    user_building_permissions 행이 삭제되면(권한 회수, 건물 삭제) 0008의 트리거가 row_id=건물 ID, user_id와 함께 기록한다.
+    SYNC_TOMBSTONE_RETENTION_DAYS보다 오래된 행은 /sync에서 주기적으로 삭제된다.
+    """
+    __tablename__ = "sync_tombstones"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    table_name = Column(String, nullable=False)
+    row_id = Column(UUID(as_uuid=True), nullable=False)
+    user_id = Column(String, nullable=True)  # user_building_permissions 삭제 기록의 사용자
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index('idx_sync_tombstones_deleted_at', 'deleted_at'),
+    )
@@ -0,0 +1,200 @@
+"""
+월 마감 일괄 작업
+
+지정한 (year, month)에 대해 모든 회사의 청구 데이터를 한 번만 계산하고,
+회사(또는 billing_scope 회사의 부서)별 청구서 PDF와 청구 상세 엑셀을
+프로세스 풀에서 병렬 렌더링하여 하나의 ZIP 파일로 디스크에 기록한다.
+
+사용법:
+    python month_close.py 2025 7 --output month_close_2025_07.zip --workers 8
+"""
+import argparse
+import logging
+import os
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy.orm import Session
+
+from database import SessionLocal
+from models import Company, Department
+from routers.buildings import get_monthly_invoice_preview_by_students_company, build_company_invoice_pdf_data
+from utils.excel_export import write_invoice_detail_sheet
+from utils.monthly_items import fetch_invoice_detail_rows
+from utils.pdf_renderer import render_chunked_pdf
+
+logger = logging.getLogger(__name__)
+
+
+def _safe_filename(name: str) -> str:
+    """ZIP 내부 파일명에 사용할 수 없는 문자 제거"""
+    return "".join("_" if c in '\\/:*?"<>|' else c for c in (name or "")).strip() or "unknown"
+
+
+def collect_invoice_jobs(db: Session, year: int, month: int) -> Tuple[List[dict], Dict[str, float], Dict[str, str]]:
+    """모든 회사의 청구 데이터를 계산하여 렌더링 작업 목록 생성
+
+    회사 이름은 중복될 수 있으므로 회사별 집계는 회사 ID로 구분한다.
+
+    Returns:
+        (렌더링 작업 목록, 회사 ID별 계산 시간(초), 회사 ID별 회사 이름)
+    """
+    jobs = []
+    compute_seconds = {}
+    company_names = {}
+
+    companies = db.query(Company).order_by(Company.name).all()
+    for company in companies:
+        started = time.perf_counter()
+        company_id = str(company.id)
+        company_names[company_id] = company.name
+        company_name = _safe_filename(company.name)
+
+        # billing_scope 회사는 부서별로, 그 외에는 회사 전체로 청구서 작성
+        if company.billing_scope:
+            scopes = [
+                (department.id, f"{company_name}_{_safe_filename(department.name)}")
+                for department in db.query(Department).filter(Department.company_id == company.id).all()
+            ]
+        else:
+            scopes = [(None, company_name)]
+
+        for department_id, label in scopes:
+            preview_data = get_monthly_invoice_preview_by_students_company(
+                year=year,
+                month=month,
+                company_id=str(company.id),
+                department_id=str(department_id) if department_id else None,
+                db=db
+            )
+            if not preview_data.get("students"):
+                continue
+
+            jobs.append({
+                "company_id": company_id,
+                "kind": "pdf",
+                "archive_name": f"pdf/{label}_{year}_{month:02d}.pdf",
+                "payload": build_company_invoice_pdf_data(year, month, company, preview_data),
+            })
+
+        excel_payload = fetch_invoice_detail_rows(db, year, month, str(company.id))
+        if excel_payload:
+            jobs.append({
+                "company_id": company_id,
+                "kind": "xlsx",
+                "archive_name": f"xlsx/請求詳細_{company_name}_{year}年{month}月.xlsx",
+                "payload": excel_payload,
+            })
+
+        compute_seconds[company_id] = time.perf_counter() - started
+
+    return jobs, compute_seconds, company_names
+
+
+def render_job(job: dict) -> Tuple[str, str, bytes, float]:
+    """프로세스 풀 워커: 작업 하나를 PDF/엑셀 바이트로 렌더링"""
+    started = time.perf_counter()
+    payload = job["payload"]
+
+    if job["kind"] == "pdf":
+        output = render_chunked_pdf("company_invoice.html", payload, list_key="students")
+    else:
+        output = write_invoice_detail_sheet(payload)
+
+    try:
+        content = output.read()
+    finally:
+        output.close()
+    return job["company_id"], job["archive_name"], content, time.perf_counter() - started
+
+
+def run_month_close(year: int, month: int, output_path: str, workers: Optional[int] = None) -> dict:
+    """월 마감 실행: 계산 → 병렬 렌더링 → ZIP 기록 → 처리량 보고"""
+    if month < 1 or month > 12:
+        raise ValueError("월은 1-12 사이의 값이어야 합니다")
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        jobs, compute_seconds, company_names = collect_invoice_jobs(db, year, month)
+    finally:
+        db.close()
+    compute_elapsed = time.perf_counter() - started
+
+    render_seconds = {}
+    document_counts = {}
+    render_started = time.perf_counter()
+
+    # 완료되는 순서대로 ZIP에 기록하여 결과 전체를 메모리에 쌓지 않음
+    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            futures = [executor.submit(render_job, job) for job in jobs]
+            for future in as_completed(futures):
+                company_id, archive_name, content, seconds = future.result()
+                archive.writestr(archive_name, content)
+                render_seconds[company_id] = render_seconds.get(company_id, 0) + seconds
+                document_counts[company_id] = document_counts.get(company_id, 0) + 1
+
+    render_elapsed = time.perf_counter() - render_started
+    total_elapsed = time.perf_counter() - started
+
+    report = {
+        "year": year,
+        "month": month,
+        "output": output_path,
+        "documents": len(jobs),
+        "compute_seconds": round(compute_elapsed, 3),
+        "render_seconds": round(render_elapsed, 3),
+        "total_seconds": round(total_elapsed, 3),
+        "documents_per_second": round(len(jobs) / render_elapsed, 2) if render_elapsed > 0 else 0,
+        "companies": [
+            {
+                "company_id": company_id,
+                "company": company_names[company_id],
+                "documents": document_counts.get(company_id, 0),
+                "compute_seconds": round(seconds, 3),
+                # 워커별 렌더링 시간의 합 (병렬 실행이므로 벽시계 시간과 다름)
+                "render_seconds": round(render_seconds.get(company_id, 0), 3),
+            }
+            for company_id, seconds in compute_seconds.items()
+        ],
+    }
+    logger.info(
+        f"월 마감 완료: {year}년 {month}월, 문서 {report['documents']}개, "
+        f"{report['documents_per_second']} docs/s, 총 {report['total_seconds']}s"
+    )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월 마감 청구서 PDF/엑셀 일괄 생성")
+    parser.add_argument("year", type=int)
+    parser.add_argument("month", type=int)
+    parser.add_argument("--output", help="ZIP 파일 경로 (기본: month_close_<year>_<month>.zip)")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    output_path = args.output or f"month_close_{args.year}_{args.month:02d}.zip"
+    report = run_month_close(args.year, args.month, output_path, workers=args.workers)
+
+    print(f"=== 월 마감 {report['year']}년 {report['month']}월 ===")
+    print(f"출력: {report['output']}")
+    print(f"문서 수: {report['documents']}, 처리량: {report['documents_per_second']} docs/s")
+    print(f"계산 {report['compute_seconds']}s / 렌더링 {report['render_seconds']}s / 전체 {report['total_seconds']}s")
+    for row in report["companies"]:
+        print(
+            f"  {row['company']}: 문서 {row['documents']}개, "
+            f"계산 {row['compute_seconds']}s, 렌더링 {row['render_seconds']}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
-from database import SessionLocal, engine
+from database import SessionLocal
 from models import User, DatabaseLog
 from schemas import UserCreate, UserLogin, ChangePasswordRequest, AdminResetPasswordRequest
 from datetime import timedelta
@@ -34,12 +34,6 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_DAYS = 7
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.post("/login")
 async def login(user: UserLogin):
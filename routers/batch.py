@@ -0,0 +1,151 @@
+"""
+대시보드 일괄 조회 (/batch)
+
+대시보드는 로드 시 건물 목록, 내 건물, 건물별 통계, 리포트 통계, 만료 예정 학생, 미읽음 수 등을 병렬로 요청하여
+요청마다 인증(Supabase 조회)과 DB 세션 준비, 응답 프레이밍 비용을 따로 치른다.
+/batch는 내부 GET 경로 목록을 받아 한 번 인증한 사용자와 하나의 DB 세션으로 순서대로 실행하고 결과를 한 응답으로 반환한다.
+
+- 하위 요청은 라우터로 직접 전달되므로 파라미터 검증, 예외 처리, 응답 모델은 개별 요청과 같다
+  (압축/ETag/메트릭 미들웨어는 배치 응답에만 적용).
+- get_current_user는 배치 요청에서 검증한 사용자를, get_db는 배치 요청의 세션을 그대로 반환한다 (request.state).
+  하위 요청은 하나씩 실행되므로 세션을 동시에 사용하지 않고, 실패한 하위 요청 뒤에는 롤백하여 다음 요청에 영향을 주지 않는다.
+- 하위 응답 본문(JSON)은 다시 파싱하지 않고 그대로 이어 붙인다. JSON이 아닌 응답(PDF/엑셀 등)은 406으로 표시한다.
+
+요청 예:
+    POST /batch
+    {"requests": [{"id": "buildings", "path": "/buildings/my-buildings"},
+                  {"id": "expiring", "path": "/students/expiring-soon?days=30"}]}
+응답:
+    {"responses": [{"id": "buildings", "path": "...", "status": 200, "body": [...]}, ...]}
+"""
+import logging
+import os
+from typing import Optional, Tuple
+from urllib.parse import quote, unquote, urlsplit
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from database import get_db
+from schemas import BatchRequest
+from utils.dependencies import get_current_user
+from utils.metrics import Counter
+from utils.responses import dumps
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["일괄 조회"])
+
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+
+batch_subrequests = Counter(
+    "batch_subrequests_total", "/batch로 실행한 하위 요청 수 (라우트 템플릿별)", ("route", "status")
+)
+
+# 배치 요청의 라우팅 결과 (하위 요청에서 다시 매칭)
+_ROUTING_SCOPE_KEYS = ("router", "endpoint", "path_params", "route")
+# 본문이 없는 하위 요청에는 의미가 없는 헤더
+_DROPPED_HEADERS = (b"content-length", b"content-type", b"transfer-encoding")
+_NOT_JSON_BODY = dumps({"detail": "JSON以外のレスポンスは一括取得できません"})
+
+
+def _split_path(path: str) -> Tuple[str, str]:
+    """하위 요청 경로 → (경로, 쿼리 문자열). 내부 경로가 아니거나 /batch 자신이면 400"""
+    parts = urlsplit(path)
+    route_path = unquote(parts.path)
+    if parts.scheme or parts.netloc or not route_path.startswith("/") or route_path.rstrip("/") == "/batch":
+        raise HTTPException(status_code=400, detail=f"一括取得できないパスです: {path}")
+    return route_path, parts.query
+
+
+def _is_json(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return content_type.startswith("application/json") or "+json" in content_type
+
+
+async def _run_subrequest(request: Request, path: str, query_string: str, state: dict, follow_redirect: bool = True):
+    """하위 GET 요청을 라우터로 직접 실행 → (상태 코드, Content-Type, 본문, 라우트 템플릿)"""
+    scope = {key: value for key, value in request.scope.items() if key not in _ROUTING_SCOPE_KEYS}
+    scope.update({
+        "method": "GET",
+        "path": path,
+        "raw_path": quote(path).encode(),
+        "query_string": query_string.encode(),
+        "headers": [(name, value) for name, value in request.scope["headers"] if name not in _DROPPED_HEADERS],
+        "state": dict(state),
+    })
+
+    body_sent = False
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # 스트리밍 응답의 연결 종료 감시는 응답이 끝날 때까지 대기
+        await request.receive()
+        return {"type": "http.disconnect"}
+
+    status_code = 500
+    headers = Headers()
+    chunks = []
+
+    async def send(message):
+        nonlocal status_code, headers
+        if message["type"] == "http.response.start":
+            status_code = message["status"]
+            headers = Headers(raw=message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app.router(scope, receive, send)
+    except StarletteHTTPException as e:
+        # 일치하는 라우트가 없을 때 라우터가 직접 발생시키는 404 등
+        return e.status_code, "application/json", dumps({"detail": e.detail}), scope.get("route")
+    except Exception as e:
+        logger.error(f"일괄 조회 하위 요청 처리 중 오류: {path} - {str(e)}", exc_info=True)
+        return 500, "application/json", dumps({"detail": f"一括取得中にエラーが発生しました: {str(e)}"}), scope.get("route")
+
+    if follow_redirect and status_code in (307, 308) and "location" in headers:
+        # 끝 슬래시 리다이렉트(/students → /students/)는 내부에서 한 번 따라감
+        location = urlsplit(headers["location"])
+        return await _run_subrequest(request, unquote(location.path), location.query, state, follow_redirect=False)
+
+    return status_code, headers.get("content-type"), b"".join(chunks), scope.get("route")
+
+
+@router.post("/batch")
+async def batch_get(
+    batch: BatchRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """여러 내부 GET 요청을 한 번의 인증/DB 세션으로 순서대로 실행하여 결과를 한 응답으로 반환"""
+    if len(batch.requests) > BATCH_MAX_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"一括リクエストは最大{BATCH_MAX_REQUESTS}件までです")
+    targets = [_split_path(item.path) for item in batch.requests]
+
+    state = {**request.scope.get("state", {}), "batch_current_user": current_user, "batch_db": db}
+    parts = []
+    for item, (path, query_string) in zip(batch.requests, targets):
+        status_code, content_type, body, route = await _run_subrequest(request, path, query_string, state)
+        batch_subrequests.labels(getattr(route, "path", None) or "<unmatched>", status_code).inc()
+
+        if status_code >= 400:
+            # 실패한 트랜잭션이 다음 하위 요청에 이어지지 않도록 정리
+            await run_in_threadpool(db.rollback)
+        if body and not _is_json(content_type):
+            status_code, body = 406, _NOT_JSON_BODY
+        parts.append(b'{"id":%s,"path":%s,"status":%d,"body":%s}' % (
+            dumps(item.id), dumps(item.path), status_code, body or b"null"
+        ))
+
+    return Response(content=b'{"responses":[' + b",".join(parts) + b"]}", media_type="application/json")
@@ -2,9 +2,9 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 from typing import Optional, List
-from database import SessionLocal, engine
+from database import get_db
 from models import (
-    BillingInvoice, BillingInvoiceItem, BillingMonthlyItem,
+    BillingInvoice, BillingInvoiceItem,
     Student, Company, Room, Building, Grade, Department
 )
 from schemas import (
@@ -16,69 +16,16 @@ import uuid
 import calendar
 from io import BytesIO
 import io
-from weasyprint import HTML
 from fastapi.responses import StreamingResponse
 from urllib.parse import quote
 from database_log import create_database_log
-from fastapi.templating import Jinja2Templates
+from utils.pdf_renderer import templates, html_to_pdf_bytes, inline_template_stylesheet, iter_spooled_file
+from utils.excel_export import write_invoice_detail_sheet
+from utils.monthly_items import fetch_monthly_items, fetch_invoice_detail_rows
 import os
-import pandas as pd
-import openpyxl
-from openpyxl.styles import Alignment
 
 router = APIRouter(prefix="/billing", tags=["청구 관리"])
 
-# Jinja2Templates 설정
-templates = Jinja2Templates(directory="templates")
-
-# HTML to PDF 변환 함수 (weasyprint 66.0 사용)
-def html_to_pdf_bytes(html_content: str) -> bytes:
-    """
-    HTML 내용을 PDF로 변환 (weasyprint 66.0 호환)
-    """
-    try:
-        # weasyprint 66.0에서는 새로운 API 사용
-        # 방법 1: HTML(string=html_content) - 최신 방식
-        try:
-            html_doc = HTML(string=html_content)
-            pdf_bytes = html_doc.write_pdf()
-            print(f"PDF 변환 성공 (weasyprint 66.0): {len(pdf_bytes)} bytes")
-            return pdf_bytes
-        except Exception as e1:
-            print(f"방법 1 실패: {e1}")
-            
-            # 방법 2: HTML() 생성자에 직접 HTML 내용 전달
-            try:
-                html_doc = HTML(html_content)
-                pdf_bytes = html_doc.write_pdf()
-                print(f"PDF 변환 성공 (방법 2): {len(pdf_bytes)} bytes")
-                return pdf_bytes
-            except Exception as e2:
-                print(f"방법 2 실패: {e2}")
-                
-                # 방법 3: from_string 메서드 사용
-                try:
-                    html_doc = HTML.from_string(html_content)
-                    pdf_bytes = html_doc.write_pdf()
-                    print(f"PDF 변환 성공 (방법 3): {len(pdf_bytes)} bytes")
-                    return pdf_bytes
-                except Exception as e3:
-                    print(f"방법 3 실패: {e3}")
-                    raise Exception(f"모든 PDF 변환 방법 실패: {str(e1)}")
-                    
-    except Exception as e:
-        print(f"PDF 변환 중 오류: {e}")
-        print(f"HTML 내용 길이: {len(html_content)}")
-        print(f"HTML 내용 일부: {html_content[:200]}...")
-        raise Exception(f"PDF 변환 실패: {str(e)}")
-
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/invoices")
 def get_invoices(
@@ -164,155 +111,21 @@ def generate_company_invoice_excel(
         print(f"company: {company.id}")
         company_id = str(company.id)
         
-        # 해당 회사의 학생들 조회 (학생 타입 필터링)
-        query = db.query(Student).filter(Student.company_id == company_id)
+        # 해당 회사의 학생 존재 여부 확인 (학생 타입 필터링)
+        student_query = db.query(Student.id).filter(Student.company_id == company.id)
         if student_type:
-            query = query.filter(Student.student_type == student_type)
+            student_query = student_query.filter(Student.student_type == student_type)
         
-        students = query.all()
-        if not students:
+        if not student_query.first():
             raise HTTPException(status_code=404, detail="該当会社の学生がありません。")
         
-        # 모든 학생의 월별 항목을 수집
-        all_invoice_items = []
-        total_company_amount = 0
-        
-        for student in students:
-            # 해당 학생의 해당 월 billing_monthly_items 조회
-            monthly_items = db.query(BillingMonthlyItem).filter(
-                BillingMonthlyItem.student_id == student.id,
-                BillingMonthlyItem.year == year,
-                BillingMonthlyItem.month == month
-            ).all()
-            
-            if not monthly_items:
-                continue  # 해당 월에 항목이 없으면 건너뛰기
-            
-            # 총 금액 계산
-            total_amount = sum(float(item.amount) for item in monthly_items)
-            total_company_amount += total_amount
-            
-            # 청구서 항목들 준비
-            for item in monthly_items:
-                invoice_item = {
-                    "student_id": student.id,
-                    "student_name": student.name,
-                    "student_type": student.student_type,
-                    "grade_name": student.grade.name if student.grade else None,
-                    "item_name": item.item_name,
-                    "amount": item.amount,
-                    "memo": item.memo,
-                    "sort_order": item.sort_order,
-                    "original_item_id": item.id
-                }
-                all_invoice_items.append(invoice_item)
-        
-        if not all_invoice_items:
+        # 회사 학생들의 해당 월 항목을 집계/행 단위로 조회 (행은 스트리밍)
+        detail = fetch_invoice_detail_rows(db, year, month, company_id, student_type=student_type, stream=True)
+        if not detail:
             raise HTTPException(status_code=404, detail="該当月の請求項目がありません。")
         
-        # 엑셀 데이터 구성 (필요한 컬럼만, 0원 항목 제거)
-        excel_data = []
-        
-        # 헤더 행 추가 (필요한 컬럼만)
-        excel_data.append([
-            "学生名", "項目名", "金額"
-        ])
-        
-        # 학생별로 그룹화하여 데이터 정리
-        student_groups = {}
-        for item in all_invoice_items:
-            student_id = item["student_id"]
-            if student_id not in student_groups:
-                student_groups[student_id] = {
-                    "student_name": item["student_name"],
-                    "items": []
-                }
-            
-            # 0원이 아닌 항목만 추가
-            if float(item["amount"]) > 0:
-                student_groups[student_id]["items"].append({
-                    "item_name": item["item_name"],
-                    "amount": item["amount"]
-                })
-        
-        print(f"엑셀 데이터: {student_groups}")
-        
-        # 그룹화된 데이터를 엑셀 형식으로 변환
-        for student_id, student_data in student_groups.items():
-            if student_data["items"]:  # 항목이 있는 경우만
-                # 첫 번째 행: 학생명과 첫 번째 항목
-                first_item = student_data["items"][0]
-                excel_data.append([
-                    student_data["student_name"],
-                    first_item["item_name"],
-                    first_item["amount"]
-                ])
-                
-                # 나머지 항목들 (학생명은 빈 값으로)
-                for item in student_data["items"][1:]:
-                    excel_data.append([
-                        "",  # 학생명 병합을 위해 빈 값
-                        item["item_name"],
-                        item["amount"]
-                    ])
-        
-        # 요약 행 추가
-        excel_data.append([])  # 빈 행
-        excel_data.append([
-            "合計", "", total_company_amount
-        ])
-        
-        # 엑셀 파일 생성
-        # DataFrame 생성
-        df = pd.DataFrame(excel_data[1:], columns=excel_data[0])
-        
-        # 엑셀 파일 생성
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="請求詳細", index=False)
-            ws = writer.sheets["請求詳細"]
-            
-            # 열 너비 자동 조정
-            for col in ws.columns:
-                max_len = 0
-                col_letter = col[0].column_letter
-                for cell in col:
-                    v = "" if cell.value is None else str(cell.value)
-                    if len(v) > max_len:
-                        max_len = len(v)
-                ws.column_dimensions[col_letter].width = min(max_len + 2, 50)
-            
-            # 학생명 셀 병합
-            current_student_name = None
-            merge_start_row = 2  # 헤더 다음 행부터 시작
-            merge_end_row = 2
-            
-            for row_idx in range(2, len(excel_data) + 1):  # 헤더 제외하고 2행부터
-                student_name = ws.cell(row=row_idx, column=1).value
-                
-                if student_name and student_name != "":  # 학생명이 있는 경우
-                    if current_student_name is not None and merge_start_row < merge_end_row:
-                        # 이전 학생의 셀 병합
-                        ws.merge_cells(f'A{merge_start_row}:A{merge_end_row}')
-                    
-                    # 새로운 학생 시작
-                    current_student_name = student_name
-                    merge_start_row = row_idx
-                    merge_end_row = row_idx
-                else:
-                    # 같은 학생의 추가 항목
-                    merge_end_row = row_idx
-            
-            # 마지막 학생의 셀 병합
-            if current_student_name is not None and merge_start_row < merge_end_row:
-                ws.merge_cells(f'A{merge_start_row}:A{merge_end_row}')
-            
-            # 셀 정렬 설정
-            for row in ws.iter_rows(min_row=2, max_row=len(excel_data), min_col=1, max_col=3):
-                for cell in row:
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-                    
-        output.seek(0)
+        # write-only 워크북에 행을 스트리밍 기록 (학생명 셀은 학생별로 병합)
+        output = write_invoice_detail_sheet(detail)
 
         # 파일명 생성 (슬래시 등 위험문자 제거 권장)
         student_type_filter = f"_{student_type}" if student_type else ""
@@ -328,7 +141,7 @@ def generate_company_invoice_excel(
         }
 
         return StreamingResponse(
-            output,
+            iter_spooled_file(output),
             media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             headers=headers,
         )
@@ -364,13 +177,12 @@ def generate_company_invoice_pdfV2(
         department_name = department.name
         company_address = company.address or ""
         
-        # 해당 회사의 학생들 조회 (학생 타입 필터링)
-        query = db.query(Student).filter(Student.company_id == company_id)
+        # 해당 회사의 학생 존재 여부 확인 (학생 타입 필터링)
+        student_query = db.query(Student.id).filter(Student.company_id == company.id)
         if student_type:
-            query = query.filter(Student.student_type == student_type)
+            student_query = student_query.filter(Student.student_type == student_type)
         
-        students = query.all()
-        if not students:
+        if not student_query.first():
             raise HTTPException(status_code=404, detail="該当会社の学生がありません。")
         
         # 회사별로 하나의 청구서 생성
@@ -379,33 +191,21 @@ def generate_company_invoice_pdfV2(
         total_company_amount = 0
         all_invoice_items = []
         
-        # 모든 학생의 월별 항목을 수집
-        for student in students:
-            # 해당 학생의 해당 월 billing_monthly_items 조회
-            monthly_items = db.query(BillingMonthlyItem).filter(
-                BillingMonthlyItem.student_id == student.id,
-                BillingMonthlyItem.year == year,
-                BillingMonthlyItem.month == month
-            ).all()
-            
-            if not monthly_items:
-                continue  # 해당 월에 항목이 없으면 건너뛰기
-            
-            # 총 금액 계산
-            total_amount = sum(float(item.amount) for item in monthly_items)
-            total_company_amount += total_amount
-            
-            # 청구서 항목들 준비 (스냅샷)
-            for item in monthly_items:
-                invoice_item = {
-                    "student_id": student.id,
-                    "item_name": item.item_name,
-                    "amount": item.amount,
-                    "memo": item.memo,
-                    "sort_order": item.sort_order,
-                    "original_item_id": item.id
-                }
-                all_invoice_items.append(invoice_item)
+        # 모든 학생의 해당 월 billing_monthly_items를 한 번에 조회
+        monthly_items = fetch_monthly_items(db, year, month, company_id=company_id, student_type=student_type)
+        
+        # 청구서 항목들 준비 (스냅샷)
+        for item in monthly_items:
+            total_company_amount += float(item.amount)
+            all_invoice_items.append({
+                "student_id": item.student_id,
+                "student_name": item.student.name,
+                "item_name": item.item_name,
+                "amount": item.amount,
+                "memo": item.memo,
+                "sort_order": item.sort_order,
+                "original_item_id": item.id
+            })
         
         # 회사별 총액이 있는 경우에만 청구서 생성
         if total_company_amount > 0:
@@ -443,7 +243,7 @@ def generate_company_invoice_pdfV2(
                 student_id = item_data["student_id"]
                 if student_id not in student_invoice_data:
                     student_invoice_data[student_id] = {
-                        "student_name": next((s.name for s in students if s.id == student_id), "Unknown Student"),
+                        "student_name": item_data["student_name"] or "Unknown Student",
                         "invoice_items": [],
                         "total_amount": 0
                     }
@@ -540,16 +340,17 @@ def generate_company_invoice_pdfV2(
         
         # HTML 내용을 UTF-8로 인코딩하여 PDF 생성
         try:
-            pdf_bytes = html_to_pdf_bytes(html_content)
+            pdf_bytes = html_to_pdf_bytes(html_content, embed_font=False, template_name="company_invoice.html")
             print(f"PDF 생성 성공, 크기: {len(pdf_bytes)} bytes")
         except UnicodeEncodeError as encode_error:
             print(f"UnicodeEncodeError 발생: {encode_error}")
             # 인코딩 에러 발생 시 HTML 내용을 안전하게 처리
             safe_html_content = html_content.encode('utf-8', errors='ignore').decode('utf-8')
-            pdf_bytes = html_to_pdf_bytes(safe_html_content)
+            pdf_bytes = html_to_pdf_bytes(safe_html_content, embed_font=False, template_name="company_invoice.html")
         except Exception as pdf_error:
             print(f"PDF 생성 실패: {pdf_error}")
-            # PDF 생성 실패 시 HTML 파일로 대체
+            # PDF 생성 실패 시 HTML 파일로 대체 (템플릿 CSS를 <style>로 포함)
+            html_content = inline_template_stylesheet(html_content, "company_invoice.html")
             filename = f"invoice_{company_id}_{year}_{month}.html"
             return StreamingResponse(
                 BytesIO(html_content.encode('utf-8')),
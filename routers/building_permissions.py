@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session, joinedload
-from database import SessionLocal
+from database import get_db
 from models import Building, UserBuildingPermission, Room, Student, Resident
 from utils.dependencies import get_current_user
 from database_log import create_database_log
@@ -12,12 +12,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/buildings", tags=["빌딩 권한 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # ===== 빌딩 권한 관리 API =====
 
@@ -2,31 +2,27 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
-from models import Building, Room, Student, Resident, BillingMonthlyItem, RoomUtility, BuildingCategoriesRent, Company, UserBuildingPermission, Elderly
+from database import get_db
+from models import Building, Room, Student, Resident, BillingMonthlyItem, RoomUtility, Company, UserBuildingPermission, Elderly
 from schemas import BuildingResponse, BuildingUpdate, BuildingCreate
 from datetime import datetime, date, timedelta
 from database_log import create_database_log
 from utils.dependencies import get_current_user
-from fastapi.responses import HTMLResponse, FileResponse, Response
-from fastapi.templating import Jinja2Templates
-from weasyprint import HTML, CSS
-from weasyprint.text.fonts import FontConfiguration
+from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse
+from utils.pdf_renderer import render_chunked_pdf, SharedSpooledFile
+from utils.ids import parse_uuid
+from utils.cache import cached, building_category_rent
+from utils.single_flight import coalesced, single_flight
 from urllib.parse import quote
 import base64
+import logging
 import os
 from utils.dependencies import get_current_user
 
 router = APIRouter(prefix="/buildings", tags=["건물 관리"])
 
-templates = Jinja2Templates(directory="templates")
+logger = logging.getLogger(__name__)
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/")
 def get_buildings(
@@ -131,6 +127,11 @@ def create_building(
         )
 
 @router.get("/options")
+@cached(
+    "buildings.options", tags=("buildings", "user_building_permissions"),
+    # 전체 조회 권한이면 모든 사용자가 같은 결과, 아니면 사용자별
+    key=lambda current_user, **_: "all" if current_user.get("role") in ["admin", "mishima_user"] else current_user["id"]
+)
 def get_building_options(db: Session = Depends(get_db), current_user: dict = Depends(get_current_user)):
     """건물 옵션 목록 (드롭다운용) - 권한 기반 필터링 적용"""
     try:
@@ -332,14 +333,11 @@ def get_rooms_by_building(
           "monthly_rent": None
         }
         
-        # 해당 빌딩의 BuildingCategoriesRent 정보 조회
-        building_status_rent = db.query(BuildingCategoriesRent).filter(
-            BuildingCategoriesRent.building_id == room.building_id,
-            BuildingCategoriesRent.categories_id == 'd7d6625d-b75f-496c-ae06-4718024be703'
-        ).first()
+        # 해당 빌딩의 BuildingCategoriesRent 정보 조회 (빌딩별 캐시)
+        building_status_rent = building_category_rent(db, room.building_id, 'd7d6625d-b75f-496c-ae06-4718024be703')
       
         if building_status_rent:
-            room_dict["monthly_rent"] = building_status_rent.monthly_rent
+            room_dict["monthly_rent"] = building_status_rent["monthly_rent"]
         
         room_data.append(room_dict)
 
@@ -408,6 +406,7 @@ def update_building(
         )
 
 @router.get("/monthly-invoice-preview/students/company/{year}/{month}")
+@coalesced("buildings.invoice_preview.company")
 def get_monthly_invoice_preview_by_students_company(
     year: int,
     month: int,
@@ -423,9 +422,12 @@ def get_monthly_invoice_preview_by_students_company(
     if month < 1 or month > 12:
         raise HTTPException(status_code=400, detail="월은 1-12 사이의 값이어야 합니다")
 
+    # UUID 컬럼과 같은 타입으로 바인딩 (문자열 비교로 인한 캐스팅 방지)
+    company_uuid = parse_uuid(company_id, "会社ID")
+
     # billing_scope 확인 (company_id가 있는 경우에만)
     if company_id:
-        company = db.query(Company).filter(Company.id == company_id).first()
+        company = db.query(Company).filter(Company.id == company_uuid).first()
         if company and company.billing_scope:
             # billing_scope가 True인 경우: department_id 필수
             if not department_id:
@@ -461,18 +463,19 @@ def get_monthly_invoice_preview_by_students_company(
 
     # 1. 회사별/부서별 학생 리스트 조회
     print(f"[DEBUG] 회사별/부서별 학생 리스트 조회 시작")
+    department_uuid = parse_uuid(department_id, "部署ID")
     if company_id and department_id:
         # 특정 회사와 부서의 학생들 조회
         students_query = db.query(Student).filter(
-            Student.company_id == company_id,
-            Student.department_id == department_id
+            Student.company_id == company_uuid,
+            Student.department_id == department_uuid
         )
     elif company_id:
         # 특정 회사 학생들 조회
-        students_query = db.query(Student).filter(Student.company_id == company_id)
+        students_query = db.query(Student).filter(Student.company_id == company_uuid)
     elif department_id:
         # 특정 부서 학생들 조회
-        students_query = db.query(Student).filter(Student.department_id == department_id)
+        students_query = db.query(Student).filter(Student.department_id == department_uuid)
     else:
         # 모든 학생 조회
         students_query = db.query(Student)
@@ -911,6 +914,7 @@ def get_monthly_invoice_preview_by_students_company(
     }
 
 @router.get("/monthly-invoice-preview/students/by-building/{year}/{month}")
+@coalesced("buildings.invoice_preview.building")
 def get_monthly_invoice_preview_by_students_building(
     year: int,
     month: int,
@@ -1389,64 +1393,189 @@ def get_monthly_invoice_preview_by_students_building(
         }
     }
 
-def html_to_pdf_bytes(html_content: str) -> bytes:
-    """HTML 내용을 PDF로 변환 (weasyprint 사용)"""
-    from weasyprint import HTML, CSS
-    from weasyprint.text.fonts import FontConfiguration
-    import base64
-    import os
-    
-    # Noto Sans JP 폰트 파일을 base64로 인코딩
-    font_path = "static/fonts/NotoSansJP-Regular.ttf"
-    font_base64 = ""
-    
-    try:
-        if os.path.exists(font_path):
-            with open(font_path, "rb") as font_file:
-                font_data = font_file.read()
-                font_base64 = base64.b64encode(font_data).decode('utf-8')
-                print(f"[DEBUG] Noto Sans JP 폰트 로드 성공: {len(font_data)} bytes")
+def company_invoice_student_row(year: int, month: int, student: dict) -> dict:
+    """월간 청구서 미리보기의 학생 항목 → company_invoice.html 2페이지 리스트 행 (청구 기준 월 포함)"""
+    # 특별 케이스 확인 - grade_name으로 비교
+    is_special_case_1 = (
+        student.get("student_type") == "GENERAL" and 
+        student.get("grade_name", "") == "3期生"
+    )
+
+    is_special_case_2 = (
+        student.get("student_type") == "GENERAL" and 
+        student.get("grade_name", "") == "2期生"
+    )
+
+    # 청구기준 월 결정
+    if is_special_case_1:
+        # 특별 조건 1: 현재 월 (7월 검색 시 7월)
+        billing_month = month
+        billing_year = year
+    elif is_special_case_2:
+        # 특별 조건 2: 다음 월 (7월 검색 시 8월)
+        if month == 12:
+            billing_month = 1
+            billing_year = year + 1
         else:
-            print(f"[WARNING] 폰트 파일을 찾을 수 없음: {font_path}")
-    except Exception as e:
-        print(f"[WARNING] 폰트 로드 실패: {str(e)}")
+            billing_month = month + 1
+            billing_year = year
+    else:
+        # 일반 조건: 전월 (7월 검색 시 6월)
+        if month == 1:
+            billing_month = 12
+            billing_year = year - 1
+        else:
+            billing_month = month - 1
+            billing_year = year
+
+    # 월 마감 일괄 작업에서도 학생마다 호출되므로 stdout이 아닌 DEBUG 로그로 남김
+    logger.debug(
+        f"PDF 생성 - 학생: {student.get('student_name', '')}, student_type: {student.get('student_type', '')}, "
+        f"grade_name: {student.get('grade_name', '')}, 청구 기준: {billing_year}년 {billing_month}월"
+    )
+
+    # 2페이지 리스트용 데이터 추가
+    student_data = {
+        "student_name": student.get("student_name", ""),
+        "building_name": student.get("building_name", ""),
+        "room_number": student.get("room_number", ""),
+        "company_name": student.get("company_name", ""),
+        "rent_amount": student.get("rent_amount", 0),
+        "management_fee": student.get("management_fee", 0),
+        "wifi_amount": student.get("wifi_amount", 0),
+        "total_amount": student.get("rent_management_wifi_total", 0),
+        "category": "技能" if student.get("student_type") == "GENERAL" else "特定",
+        "generation": student.get("grade_name", "") if student.get("student_type") == "GENERAL" else "",
+        "billingMonth": billing_month,
+        "billingYear": billing_year,
+        # Wi-Fi 세금 계산 (10%)
+        "wifi_tax_amount": int(student.get("wifi_amount", 0) * 0.1)
+    }
+    return student_data
+
+
+def build_company_invoice_pdf_data(year: int, month: int, company: Company, preview_data: dict) -> dict:
+    """회사 기준 월간 청구서 PDF(company_invoice.html)용 데이터 구성
+
+    다운로드 엔드포인트와 월 마감 일괄 작업(month_close.py)이 함께 사용한다.
+    """
+    # 다음 달 계산 (지급 기한용)
+    if month == 12:
+        next_year = year + 1
+        next_month = 1
+    else:
+        next_year = year
+        next_month = month + 1
     
-    # CSS with embedded font
-    css_content = f"""
-    @font-face {{
-        font-family: "Noto Sans JP";
-        src: url("data:font/ttf;base64,{font_base64}") format("truetype");
-        font-weight: normal;
-        font-style: normal;
-    }}
+    # PDF용 데이터 준비 - 2페이지 리스트 포함
+    pdf_data = {
+        "sender_name": "株式会社 ミシマ",
+        "sender_address": "〒546-0003 大阪市東住吉区今川4-5-9-201",
+        "sender_tel": "06-6760-7400",
+        "sender_fax": "06-6760-7401",
+        "registration_number": "T4120001018934",
+        "recipient_name": company.name + " 御中",
+        "recipient_address": company.address,
+        "sender_postal_code": "546-0003",
+        "invoice_date": f"{year}年{month}月10日",
+        "billing_period": preview_data.get("billing_period", f"{year}年{month}月"),
+        "year": year,
+        "month": month,
+        "categories": [],
+        "subtotal": 0,
+        "tax_amount": 0,
+        "total_amount": 0,
+        "bank_name": "関西みらい銀行",
+        "branch_name": "八尾本町支店",
+        "account_type": "普通",
+        "account_number": "0043448",
+        "account_holder": "株式会社ミシマ",
+        "payment_deadline": f"{next_year}年{next_month}月31日",
+        "students": [],
+        "total_rent": 0,
+        "total_management": 0,
+        "total_wifi": 0
+    }
     
-    @page {{
-        size: A4;
-        margin: 20mm;
-    }}
+    # 학생들을 기능실습생/특정기능실습생으로 분류
+    general_students = []
+    specific_students = []
     
-    body {{
-        font-family: "Noto Sans JP", "Hiragino Sans", "ヒラギノ角ゴシック", "Yu Gothic Medium", "Yu Gothic", "メイリオ", "Meiryo", "MS PGothic", "MS Pゴシック", "Takao Gothic", "IPAexGothic", "IPAPGothic", "VL PGothic", "Noto Sans CJK JP", sans-serif;
-        font-size: 8pt;
-        line-height: 1.4;
-        -webkit-font-smoothing: antialiased;
-        -moz-osx-font-smoothing: grayscale;
-    }}
+    for student in preview_data.get("students", []):
+        student_data = company_invoice_student_row(year, month, student)
+        pdf_data["students"].append(student_data)
+        
+        # 합계 계산
+        pdf_data["total_rent"] += student.get("rent_amount", 0)
+        pdf_data["total_management"] += student.get("management_fee", 0)
+        pdf_data["total_wifi"] += student.get("wifi_amount", 0)
+        
+        if student.get("student_type") == "GENERAL":
+            general_students.append(student)
+        else:
+            specific_students.append(student)
     
-    * {{
-        font-family: "Noto Sans JP", "Hiragino Sans", "ヒラギノ角ゴシック", "Yu Gothic Medium", "Yu Gothic", "メイリオ", "Meiryo", "MS PGothic", "MS Pゴシック", "Takao Gothic", "IPAexGothic", "IPAPGothic", "VL PGothic", "Noto Sans CJK JP", sans-serif !important;
-    }}
-    """
+    # 1페이지 청구서용 카테고리 데이터
+    if general_students:
+        # generation별로 그룹화
+        generation_groups = {}
+        for student in general_students:
+            generation = student.get("grade_name", "")
+            if generation not in generation_groups:
+                generation_groups[generation] = []
+            generation_groups[generation].append(student)
+        
+        # 각 generation별로 카테고리 생성
+        for generation, students in generation_groups.items():
+            group_rent = sum(s.get("rent_amount", 0) for s in students)
+            group_management = sum(s.get("management_fee", 0) for s in students)
+            group_wifi = sum(s.get("wifi_amount", 0) for s in students)
+            group_wifi_tax = int(group_wifi * 0.1)
+            group_subtotal = group_rent + group_management + group_wifi  # 소계 계산
+            
+            pdf_data["categories"].append({
+                "name": f"技能実習生{generation}",
+                "students": students,
+                "subtotal": group_subtotal,
+                "total_rent": group_rent,
+                "total_management": group_management,
+                "total_wifi": group_wifi,
+                "total_wifi_tax": group_wifi_tax,
+                "billing_month": students[0].get("billingMonth", month) if students else month
+            })
+            pdf_data["subtotal"] += group_subtotal  # 전체 소계에 추가
     
-    # FontConfiguration 설정
-    font_config = FontConfiguration()
+    if specific_students:
+        specific_rent = sum(s.get("rent_amount", 0) for s in specific_students)
+        specific_management = sum(s.get("management_fee", 0) for s in specific_students)
+        specific_wifi = sum(s.get("wifi_amount", 0) for s in specific_students)
+        specific_wifi_tax = int(specific_wifi * 0.1)
+        specific_subtotal = specific_rent + specific_management + specific_wifi  # 소계 계산
+        
+        pdf_data["categories"].append({
+            "name": "特定技能実習生",
+            "students": specific_students,
+            "subtotal": specific_subtotal,
+            "total_rent": specific_rent,
+            "total_management": specific_management,
+            "total_wifi": specific_wifi,
+            "total_wifi_tax": specific_wifi_tax,
+            "billing_month": specific_students[0].get("billingMonth", month) if specific_students else month
+        })
+        pdf_data["subtotal"] += specific_subtotal  # 전체 소계에 추가
     
-    # HTML과 CSS를 함께 렌더링
-    html_doc = HTML(string=html_content)
-    css_doc = CSS(string=css_content, font_config=font_config)
+    # 세금 계산 (Wi-Fi 비용에만 10% 세금)
+    total_wifi_tax = sum(category.get("total_wifi_tax", 0) for category in pdf_data["categories"])
+    pdf_data["tax_amount"] = total_wifi_tax
+    pdf_data["total_amount"] = pdf_data["subtotal"] + pdf_data["tax_amount"]
     
-    pdf = html_doc.write_pdf(stylesheets=[css_doc], font_config=font_config)
-    return pdf
+    logger.debug(
+        f"최종 PDF 데이터: categories 길이 = {len(pdf_data['categories'])}, "
+        f"총 학생 수: {len(general_students) + len(specific_students)}, "
+        f"소계: {pdf_data['subtotal']}, 세금: {pdf_data['tax_amount']}, 총액: {pdf_data['total_amount']}"
+    )
+    
+    return pdf_data
 
 @router.get("/download-monthly-invoice-pdf/students/company/{year}/{month}")
 def download_monthly_invoice_pdf_students_company(
@@ -1458,7 +1587,7 @@ def download_monthly_invoice_pdf_students_company(
     current_user: dict = Depends(get_current_user)
 ):
     """월간 학생별 청구서 PDF 다운로드 (회사 기준)"""
-    try:
+    def render_pdf():
         # 회사 정보 조회
         company = db.query(Company).filter(Company.id == company_id).first()
         if not company:
@@ -1484,198 +1613,25 @@ def download_monthly_invoice_pdf_students_company(
             db=db
         )
         
-        # 다음 달 계산 (지급 기한용)
-        if month == 12:
-            next_year = year + 1
-            next_month = 1
-        else:
-            next_year = year
-            next_month = month + 1
-        
-        # PDF용 데이터 준비 - 2페이지 리스트 포함
-        pdf_data = {
-            "sender_name": "株式会社 ミシマ",
-            "sender_address": "〒546-0003 大阪市東住吉区今川4-5-9-201",
-            "sender_tel": "06-6760-7400",
-            "sender_fax": "06-6760-7401",
-            "registration_number": "T4120001018934",
-            "recipient_name": company.name + " 御中",
-            "recipient_address": company.address,
-            "sender_postal_code": "546-0003",
-            "invoice_date": f"{year}年{month}月10日",
-            "billing_period": preview_data.get("billing_period", f"{year}年{month}月"),
-            "year": year,
-            "month": month,
-            "categories": [],
-            "subtotal": 0,
-            "tax_amount": 0,
-            "total_amount": 0,
-            "bank_name": "関西みらい銀行",
-            "branch_name": "八尾本町支店",
-            "account_type": "普通",
-            "account_number": "0043448",
-            "account_holder": "株式会社ミシマ",
-            "payment_deadline": f"{next_year}年{next_month}月31日",
-            "students": [],
-            "total_rent": 0,
-            "total_management": 0,
-            "total_wifi": 0
-        }
-        
-        # 학생들을 기능실습생/특정기능실습생으로 분류
-        general_students = []
-        specific_students = []
+        # PDF용 데이터 구성
+        pdf_data = build_company_invoice_pdf_data(year, month, company, preview_data)
         
-        for student in preview_data.get("students", []):
-            # 특별 케이스 확인 - grade_name으로 비교
-            is_special_case_1 = (
-                student.get("student_type") == "GENERAL" and 
-                student.get("grade_name", "") == "3期生"
-            )
-            
-            is_special_case_2 = (
-                student.get("student_type") == "GENERAL" and 
-                student.get("grade_name", "") == "2期生"
-            )
-            
-            # 디버깅 로그 추가
-            print(f"[DEBUG] PDF 생성 - 학생: {student.get('student_name', '')}")
-            print(f"[DEBUG] PDF 생성 - student_type: {student.get('student_type', '')}")
-            print(f"[DEBUG] PDF 생성 - grade_name: {student.get('grade_name', '')}")
-            print(f"[DEBUG] PDF 생성 - is_special_case_1: {is_special_case_1}")
-            print(f"[DEBUG] PDF 생성 - is_special_case_2: {is_special_case_2}")
-            
-            # 청구기준 월 결정
-            if is_special_case_1:
-                # 특별 조건 1: 현재 월 (7월 검색 시 7월)
-                billing_month = month
-                billing_year = year
-                print(f"[DEBUG] PDF 생성 - 특별 조건 1 적용: {billing_year}년 {billing_month}월")
-            elif is_special_case_2:
-                # 특별 조건 2: 다음 월 (7월 검색 시 8월)
-                if month == 12:
-                    billing_month = 1
-                    billing_year = year + 1
-                else:
-                    billing_month = month + 1
-                    billing_year = year
-                print(f"[DEBUG] PDF 생성 - 특별 조건 2 적용: {billing_year}년 {billing_month}월")
-            else:
-                # 일반 조건: 전월 (7월 검색 시 6월)
-                if month == 1:
-                    billing_month = 12
-                    billing_year = year - 1
-                else:
-                    billing_month = month - 1
-                    billing_year = year
-                print(f"[DEBUG] PDF 생성 - 일반 조건 적용: {billing_year}년 {billing_month}월")
-            
-            # 2페이지 리스트용 데이터 추가
-            student_data = {
-                "student_name": student.get("student_name", ""),
-                "building_name": student.get("building_name", ""),
-                "room_number": student.get("room_number", ""),
-                "company_name": student.get("company_name", ""),
-                "rent_amount": student.get("rent_amount", 0),
-                "management_fee": student.get("management_fee", 0),
-                "wifi_amount": student.get("wifi_amount", 0),
-                "total_amount": student.get("rent_management_wifi_total", 0),
-                "category": "技能" if student.get("student_type") == "GENERAL" else "特定",
-                "generation": student.get("grade_name", "") if student.get("student_type") == "GENERAL" else "",
-                "billingMonth": billing_month,
-                "billingYear": billing_year,
-                # Wi-Fi 세금 계산 (10%)
-                "wifi_tax_amount": int(student.get("wifi_amount", 0) * 0.1)
-            }
-            pdf_data["students"].append(student_data)
-            
-            # 합계 계산
-            pdf_data["total_rent"] += student.get("rent_amount", 0)
-            pdf_data["total_management"] += student.get("management_fee", 0)
-            pdf_data["total_wifi"] += student.get("wifi_amount", 0)
-            
-            if student.get("student_type") == "GENERAL":
-                general_students.append(student)
-            else:
-                specific_students.append(student)
-        
-        # 1페이지 청구서용 카테고리 데이터
-        if general_students:
-            # generation별로 그룹화
-            generation_groups = {}
-            for student in general_students:
-                generation = student.get("grade_name", "")
-                if generation not in generation_groups:
-                    generation_groups[generation] = []
-                generation_groups[generation].append(student)
-            
-            # 각 generation별로 카테고리 생성
-            for generation, students in generation_groups.items():
-                group_rent = sum(s.get("rent_amount", 0) for s in students)
-                group_management = sum(s.get("management_fee", 0) for s in students)
-                group_wifi = sum(s.get("wifi_amount", 0) for s in students)
-                group_wifi_tax = int(group_wifi * 0.1)
-                group_subtotal = group_rent + group_management + group_wifi  # 소계 계산
-                
-                pdf_data["categories"].append({
-                    "name": f"技能実習生{generation}",
-                    "students": students,
-                    "subtotal": group_subtotal,
-                    "total_rent": group_rent,
-                    "total_management": group_management,
-                    "total_wifi": group_wifi,
-                    "total_wifi_tax": group_wifi_tax,
-                    "billing_month": students[0].get("billingMonth", month) if students else month
-                })
-                pdf_data["subtotal"] += group_subtotal  # 전체 소계에 추가
-        
-        if specific_students:
-            specific_rent = sum(s.get("rent_amount", 0) for s in specific_students)
-            specific_management = sum(s.get("management_fee", 0) for s in specific_students)
-            specific_wifi = sum(s.get("wifi_amount", 0) for s in specific_students)
-            specific_wifi_tax = int(specific_wifi * 0.1)
-            specific_subtotal = specific_rent + specific_management + specific_wifi  # 소계 계산
-            
-            pdf_data["categories"].append({
-                "name": "特定技能実習生",
-                "students": specific_students,
-                "subtotal": specific_subtotal,
-                "total_rent": specific_rent,
-                "total_management": specific_management,
-                "total_wifi": specific_wifi,
-                "total_wifi_tax": specific_wifi_tax,
-                "billing_month": specific_students[0].get("billingMonth", month) if specific_students else month
-            })
-            pdf_data["subtotal"] += specific_subtotal  # 전체 소계에 추가
-        
-        # 세금 계산 (Wi-Fi 비용에만 10% 세금)
-        total_wifi_tax = sum(category.get("total_wifi_tax", 0) for category in pdf_data["categories"])
-        pdf_data["tax_amount"] = total_wifi_tax
-        pdf_data["total_amount"] = pdf_data["subtotal"] + pdf_data["tax_amount"]
-        
-        print(f"[DEBUG] 최종 PDF 데이터: categories 길이 = {len(pdf_data['categories'])}")
-        print(f"[DEBUG] 총 학생 수: {len(general_students) + len(specific_students)}")
-        print(f"[DEBUG] 소계: {pdf_data['subtotal']}, 세금: {pdf_data['tax_amount']}, 총액: {pdf_data['total_amount']}")
-        print(f"[DEBUG] 2페이지 총액 (rent_management_wifi_total): {pdf_data['total_amount']}")
-        print(f"[DEBUG] 학생별 total_amount:")
-        for i, student in enumerate(pdf_data["students"]):
-            print(f"  학생 {i+1}: {student.get('total_amount', 0)}")
-        
-        # HTML 템플릿 렌더링
-        html_content = templates.get_template("company_invoice.html").render(
-            data=pdf_data
+        # 학생 리스트를 청크 단위로 렌더링하여 PDF 생성 (메모리 사용량 제한)
+        return SharedSpooledFile(render_chunked_pdf("company_invoice.html", pdf_data, list_key="students"))
+
+    try:
+        # 같은 조건의 PDF 생성이 진행 중이면 그 결과 파일을 함께 스트리밍
+        pdf_file = single_flight.do(
+            "buildings.invoice_pdf.company", [year, month, company_id, department_id], render_pdf
         )
         
-        # PDF 생성
-        pdf_bytes = html_to_pdf_bytes(html_content)
-        
         # 파일명 생성 (영문으로 변경)
         company_suffix = f"_{company_id}" if company_id else "_all"
         filename = f"monthly_invoice_{year}_{month:02d}{company_suffix}.pdf"
         
-        # PDF 파일 반환
-        return Response(
-            content=pdf_bytes,
+        # PDF 파일 스트리밍 반환
+        return StreamingResponse(
+            pdf_file.iter_blocks(),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
@@ -1698,7 +1654,7 @@ def download_monthly_invoice_pdf_students_building(
     current_user: dict = Depends(get_current_user)
 ):
     """월간 학생별 청구서 PDF 다운로드 (건물 기준)"""
-    try:
+    def render_pdf():
         # 미리보기 데이터 조회 - 직접 함수 호출
         preview_data = get_monthly_invoice_preview_by_students_building(
             year=year,
@@ -1717,97 +1673,33 @@ def download_monthly_invoice_pdf_students_building(
             "vat_total_amount": int(preview_data["summary"]["grand_total"] + preview_data["summary"]["grand_total"] * 0.1),
             "vat": int(preview_data["summary"]["grand_total"] * 0.1),
             "issue_date": datetime.now().strftime("%Y年%m月%d日"),
-            "invoice_list": []
+            "students": [],
+            "total_rent": 0,
+            "total_management": 0,
+            "total_wifi": 0
         }
         
-        # 학생 데이터 처리
+        # 학생 데이터 처리 - 템플릿 2페이지 리스트(data.students) 행으로 구성
         for student in preview_data["students"]:
-            # invoice_items 구성
-            invoice_items = []
-            
-            # 월세
-            if student.get("rent_amount", 0) > 0:
-                invoice_items.append({
-                    "name": "月額賃料",
-                    "unit_price": student["rent_amount"],
-                    "amount": student["rent_amount"],
-                    "memo": "",
-                    "type": "rent"
-                })
-            
-            # 관리비
-            if student.get("management_fee", 0) > 0:
-                invoice_items.append({
-                    "name": "管理費",
-                    "unit_price": student["management_fee"],
-                    "amount": student["management_fee"],
-                    "memo": "",
-                    "type": "management"
-                })
-            
-            # 와이파이
-            if student.get("wifi_amount", 0) > 0:
-                invoice_items.append({
-                    "name": "Wi-Fi料金",
-                    "unit_price": student["wifi_amount"],
-                    "amount": student["wifi_amount"],
-                    "memo": "",
-                    "type": "wifi"
-                })
-            
-            # 전기
-            if student.get("electricity_amount", 0) > 0:
-                invoice_items.append({
-                    "name": "電気代",
-                    "unit_price": student["electricity_amount"],
-                    "amount": student["electricity_amount"],
-                    "memo": "",
-                    "type": "electricity"
-                })
-            
-            # 수도
-            if student.get("water_amount", 0) > 0:
-                invoice_items.append({
-                    "name": "水道代",
-                    "unit_price": student["water_amount"],
-                    "amount": student["water_amount"],
-                    "memo": "",
-                    "type": "water"
-                })
-            
-            # 가스
-            if student.get("gas_amount", 0) > 0:
-                invoice_items.append({
-                    "name": "ガス代",
-                    "unit_price": student["gas_amount"],
-                    "amount": student["gas_amount"],
-                    "memo": "",
-                    "type": "gas"
-                })
-            
-            # 학생 데이터 추가
-            pdf_data["invoice_list"].append({
-                "student_name": student.get("student_name", "Unknown"),
-                "total_amount": student.get("total_amount", 0),  # 이 부분 추가
-                "invoice_number": f"INV-{year}{month:02d}-{student.get('student_id', 'unknown')[:8]}",
-                "invoice_items": invoice_items
-            })
-        
-        # HTML 템플릿 렌더링
-        html_content = templates.get_template("company_invoice.html").render(
-            data=pdf_data
-        )
+            pdf_data["students"].append(company_invoice_student_row(year, month, student))
+            pdf_data["total_rent"] += student.get("rent_amount", 0)
+            pdf_data["total_management"] += student.get("management_fee", 0)
+            pdf_data["total_wifi"] += student.get("wifi_amount", 0)
         
-        # PDF 생성
-        pdf_bytes = html_to_pdf_bytes(html_content)
+        # 학생 리스트를 청크 단위로 렌더링하여 PDF 생성 (메모리 사용량 제한)
+        return SharedSpooledFile(render_chunked_pdf("company_invoice.html", pdf_data, list_key="students"))
+
+    try:
+        # 같은 조건의 PDF 생성이 진행 중이면 그 결과 파일을 함께 스트리밍
+        pdf_file = single_flight.do("buildings.invoice_pdf.building", [year, month, building_id], render_pdf)
         
         # 파일명 생성
         building_suffix = f"_{building_id}" if building_id else "_전체"
         filename = f"월간청구서_건물_{year}년{month}월{building_suffix}.pdf"
         
-        # PDF 파일 반환
-        return Response(
-            content=pdf_bytes,
+        # PDF 파일 스트리밍 반환
+        return StreamingResponse(
+            pdf_file.iter_blocks(),
             media_type="application/pdf",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
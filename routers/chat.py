@@ -1,10 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, status, UploadFile, File, Form
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, or_, and_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, or_, and_, desc, select, update
 from typing import Optional, List, Union
 import logging
-from database import SessionLocal, engine
+from database import get_db, get_async_db
 from models import (
     Conversation, ConversationMember, Message, MessageRead, 
     Attachment, Reaction, MessageMention, Student, Company, Grade
@@ -18,7 +19,7 @@ from schemas import (
 )
 from datetime import datetime, date, timedelta
 import uuid
-from database_log import create_database_log
+from database_log import create_database_log, create_database_log_async
 import os
 from supabase import create_client
 from utils.dependencies import get_current_user
@@ -37,12 +38,52 @@ SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 supabase_storage = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY) if SUPABASE_SERVICE_KEY else None
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+
+async def count_unread_messages_async(db: AsyncSession, conversation_id, member_ids) -> dict:
+    """대화방 참여자별 읽지 않은 메시지 수 (마지막 읽은 시간 이후, 본인 메시지 제외)
+
+    참여자마다 멤버 조회와 COUNT 쿼리를 반복하지 않고 한 번의 GROUP BY 쿼리로 계산한다.
+    """
+    member_ids = list(member_ids)
+    if not member_ids:
+        return {}
+    
+    unread_filter = and_(
+        Message.conversation_id == ConversationMember.conversation_id,
+        Message.sender_id != ConversationMember.user_id,  # 본인이 보낸 메시지 제외
+        Message.deleted_at.is_(None),
+        # 읽은 기록이 없으면 모든 메시지가 읽지 않음
+        or_(
+            ConversationMember.last_read_at.is_(None),
+            Message.created_at > ConversationMember.last_read_at
+        )
+    )
+    result = await db.execute(
+        select(ConversationMember.user_id, func.count(Message.id))
+        .outerjoin(Message, unread_filter)
+        .where(
+            ConversationMember.conversation_id == conversation_id,
+            ConversationMember.user_id.in_(member_ids)
+        )
+        .group_by(ConversationMember.user_id)
+    )
+    counts = {str(user_id): count for user_id, count in result.all()}
+    
+    unread_counts = {}
+    for member_id in member_ids:
+        if str(member_id) in counts:
+            unread_counts[member_id] = counts[str(member_id)]
+        else:
+            # 멤버 정보가 없는 연결 사용자는 본인 메시지를 제외한 전체 메시지 수
+            unread_counts[member_id] = await db.scalar(
+                select(func.count(Message.id)).where(
+                    Message.conversation_id == conversation_id,
+                    Message.sender_id != member_id,
+                    Message.deleted_at.is_(None)
+                )
+            )
+    return unread_counts
+
 
 def get_token_header(token: str = Depends(HTTPBearer())):
     return token.credentials
@@ -243,7 +284,7 @@ async def create_conversation(
             detail=f"会話の作成中にエラーが発生しました: {str(e)}"
         )
 
-@router.get("/conversations")
+@router.get("/conversations", response_model=ConversationListResponse)
 def get_conversations(
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(20, description="페이지당 항목 수", ge=1, le=100),
@@ -605,17 +646,19 @@ async def create_message(
     parent_id: Optional[str] = Form(None),
     mentioned_user_ids: Optional[str] = Form(None),  # JSON 문자열로 받음
     attachments: List[UploadFile] = File(default=[]),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
 
     """새 메시지 생성"""
     try:
         # 대화방 존재 여부 및 참여 권한 확인
-        conversation = db.query(Conversation).join(ConversationMember).filter(
-            Conversation.id == conversation_id,
-            ConversationMember.user_id == current_user["id"]
-        ).first()
+        conversation = (await db.execute(
+            select(Conversation).join(ConversationMember).where(
+                Conversation.id == conversation_id,
+                ConversationMember.user_id == current_user["id"]
+            )
+        )).scalars().first()
         
         if not conversation:
             raise HTTPException(
@@ -646,7 +689,7 @@ async def create_message(
         )
         
         db.add(new_message)
-        db.flush()  # ID 생성을 위해 flush
+        await db.flush()  # ID 생성을 위해 flush
         
         # 멘션 처리
         mention_list = []
@@ -659,10 +702,12 @@ async def create_message(
                 if mentioned_ids and isinstance(mentioned_ids, list):
                     for mentioned_user_id in mentioned_ids:
                         # 멘션된 사용자가 대화방 멤버인지 확인
-                        is_member = db.query(ConversationMember).filter(
-                            ConversationMember.conversation_id == conversation_id,
-                            ConversationMember.user_id == mentioned_user_id
-                        ).first()
+                        is_member = (await db.execute(
+                            select(ConversationMember.user_id).where(
+                                ConversationMember.conversation_id == conversation_id,
+                                ConversationMember.user_id == mentioned_user_id
+                            )
+                        )).first()
                         
                         if is_member:
                             mention = MessageMention(
@@ -762,23 +807,23 @@ async def create_message(
                     )
         
         # 다른 멤버들의 last_read_at 업데이트 (읽지 않은 상태로)
-        db.query(ConversationMember).filter(
-            ConversationMember.conversation_id == conversation_id,
-            ConversationMember.user_id != current_user["id"]
-        ).update({
-            ConversationMember.last_read_at: None
-        })
+        await db.execute(
+            update(ConversationMember).where(
+                ConversationMember.conversation_id == conversation_id,
+                ConversationMember.user_id != current_user["id"]
+            ).values(last_read_at=None)
+        )
         
         # 발신자 메시지는 자동으로 읽음 처리
-        db.query(ConversationMember).filter(
-            ConversationMember.conversation_id == conversation_id,
-            ConversationMember.user_id == current_user["id"]
-        ).update({
-            ConversationMember.last_read_at: datetime.utcnow()
-        })
+        await db.execute(
+            update(ConversationMember).where(
+                ConversationMember.conversation_id == conversation_id,
+                ConversationMember.user_id == current_user["id"]
+            ).values(last_read_at=datetime.utcnow())
+        )
         
-        db.commit()
-        db.refresh(new_message)
+        await db.commit()
+        await db.refresh(new_message)
         
         # WebSocket을 통해 실시간 메시지 전송
         try:
@@ -914,36 +959,14 @@ async def create_message(
             try:
                 # 각 참여자별 읽지 않은 메시지 수 계산
                 conversation_members = manager.get_conversation_members(conversation_id)
-                unread_counts = {}
-                
-                for member_id in conversation_members:
-                    if member_id != current_user["id"]:  # 발신자 제외
-                        # 해당 사용자의 마지막 읽은 시간 확인
-                        member_info = db.query(ConversationMember).filter(
-                            ConversationMember.conversation_id == conversation_id,
-                            ConversationMember.user_id == member_id
-                        ).first()
-                        
-                        if member_info and member_info.last_read_at:
-                            # 마지막 읽은 시간 이후의 메시지 수 계산
-                            unread_count = db.query(Message).filter(
-                                Message.conversation_id == conversation_id,
-                                Message.created_at > member_info.last_read_at,
-                                Message.sender_id != member_id,  # 본인이 보낸 메시지 제외
-                                Message.deleted_at.is_(None)
-                            ).count()
-                        else:
-                            # 읽은 기록이 없으면 모든 메시지가 읽지 않음
-                            unread_count = db.query(Message).filter(
-                                Message.conversation_id == conversation_id,
-                                Message.sender_id != member_id,  # 본인이 보낸 메시지 제외
-                                Message.deleted_at.is_(None)
-                            ).count()
-                        
-                        unread_counts[member_id] = unread_count
-                    else:
-                        # 발신자는 0
-                        unread_counts[member_id] = 0
+                unread_counts = await count_unread_messages_async(
+                    db,
+                    conversation_id,
+                    [member_id for member_id in conversation_members if member_id != current_user["id"]]  # 발신자 제외
+                )
+                if current_user["id"] in conversation_members:
+                    # 발신자는 0
+                    unread_counts[current_user["id"]] = 0
                 
                 # 마지막 메시지 정보로 채팅 리스트 업데이트
                 chat_list_update_data = {
@@ -974,14 +997,18 @@ async def create_message(
                 import asyncio
                 from main import send_push_notification_to_conversation
                 
-                # 백그라운드에서 푸시 알림 전송
-                asyncio.create_task(send_push_notification_to_conversation(
+                from utils.metrics import push_outbox_depth
+
+                # 백그라운드에서 푸시 알림 전송 (완료될 때까지 대기열 깊이에 포함)
+                push_task = asyncio.create_task(send_push_notification_to_conversation(
                     conversation_id=conversation_id,
                     sender_name=sender_info["name"] if sender_info else "사용자",
                     message_body=clean_body if clean_body else body,
                     conversation_title=conversation.title,
                     exclude_user_id=current_user["id"]
                 ))
+                push_outbox_depth.inc()
+                push_task.add_done_callback(lambda _: push_outbox_depth.dec())
                 logger.info(f"푸시 알림 전송 요청: {conversation_id}")
             except Exception as push_error:
                 logger.error(f"푸시 알림 전송 실패: {push_error}")
@@ -992,7 +1019,7 @@ async def create_message(
         
         # 데이터베이스 로그 생성
         try:
-            create_database_log(
+            await create_database_log_async(
                 db=db,
                 table_name="messages",
                 record_id=str(new_message.id),
@@ -1062,13 +1089,13 @@ async def create_message(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"メッセージの送信中にエラーが発生しました: {str(e)}"
         )
 
-@router.get("/conversations/{conversation_id}/messages")
+@router.get("/conversations/{conversation_id}/messages", response_model=MessageListResponse)
 def get_messages(
     conversation_id: str,
     page: int = Query(1, description="페이지 번호", ge=1),
@@ -1392,17 +1419,19 @@ def get_messages(
 async def update_message(
     message_id: str,
     message_update: MessageUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """메시지 수정"""
     try:
         # 메시지 존재 여부 및 작성자 확인
-        message = db.query(Message).filter(
-            Message.id == message_id,
-            Message.sender_id == current_user["id"],
-            Message.deleted_at.is_(None)
-        ).first()
+        message = (await db.execute(
+            select(Message).where(
+                Message.id == message_id,
+                Message.sender_id == current_user["id"],
+                Message.deleted_at.is_(None)
+            )
+        )).scalars().first()
         
         if not message:
             raise HTTPException(
@@ -1420,8 +1449,8 @@ async def update_message(
             message.body = message_update.body
             message.edited_at = datetime.utcnow()
         
-        db.commit()
-        db.refresh(message)
+        await db.commit()
+        await db.refresh(message)
         
         # WebSocket을 통해 메시지 수정 알림 전송
         try:
@@ -1455,32 +1484,9 @@ async def update_message(
             try:
                 # 각 참여자별 읽지 않은 메시지 수 계산
                 conversation_members = manager.get_conversation_members(str(message.conversation_id))
-                unread_counts = {}
-                
-                for member_id in conversation_members:
-                    # 해당 사용자의 마지막 읽은 시간 확인
-                    member_info = db.query(ConversationMember).filter(
-                        ConversationMember.conversation_id == message.conversation_id,
-                        ConversationMember.user_id == member_id
-                    ).first()
-                    
-                    if member_info and member_info.last_read_at:
-                        # 마지막 읽은 시간 이후의 메시지 수 계산
-                        unread_count = db.query(Message).filter(
-                            Message.conversation_id == message.conversation_id,
-                            Message.created_at > member_info.last_read_at,
-                            Message.sender_id != member_id,  # 본인이 보낸 메시지 제외
-                            Message.deleted_at.is_(None)
-                        ).count()
-                    else:
-                        # 읽은 기록이 없으면 모든 메시지가 읽지 않음
-                        unread_count = db.query(Message).filter(
-                            Message.conversation_id == message.conversation_id,
-                            Message.sender_id != member_id,  # 본인이 보낸 메시지 제외
-                            Message.deleted_at.is_(None)
-                        ).count()
-                    
-                    unread_counts[member_id] = unread_count
+                unread_counts = await count_unread_messages_async(
+                    db, message.conversation_id, conversation_members
+                )
                 
                 chat_list_update_data = {
                     "message_id": str(message.id),
@@ -1506,7 +1512,7 @@ async def update_message(
         
         # 데이터베이스 로그 생성
         try:
-            create_database_log(
+            await create_database_log_async(
                 db=db,
                 table_name="messages",
                 record_id=str(message.id),
@@ -1530,7 +1536,7 @@ async def update_message(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"メッセージの編集中にエラーが発生しました: {str(e)}"
@@ -2002,16 +2008,18 @@ async def mark_conversation_as_read(
 async def add_reaction(
     message_id: str,
     reaction: ReactionCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ):
     """메시지에 이모지 반응 추가"""
     try:
         # 메시지 존재 여부 확인
-        message = db.query(Message).filter(
-            Message.id == message_id,
-            Message.deleted_at.is_(None)
-        ).first()
+        message = (await db.execute(
+            select(Message).where(
+                Message.id == message_id,
+                Message.deleted_at.is_(None)
+            )
+        )).scalars().first()
         
         if not message:
             raise HTTPException(
@@ -2020,11 +2028,13 @@ async def add_reaction(
             )
         
         # 이미 같은 이모지 반응이 있는지 확인
-        existing_reaction = db.query(Reaction).filter(
-            Reaction.message_id == message_id,
-            Reaction.user_id == current_user["id"],
-            Reaction.emoji == reaction.emoji
-        ).first()
+        existing_reaction = (await db.execute(
+            select(Reaction).where(
+                Reaction.message_id == message_id,
+                Reaction.user_id == current_user["id"],
+                Reaction.emoji == reaction.emoji
+            )
+        )).scalars().first()
         
         # 사용자 프로필 정보 조회
         user_profile = None
@@ -2052,8 +2062,8 @@ async def add_reaction(
         
         # 같은 이모지 반응이 있으면 제거 (토글 방식)
         if existing_reaction:
-            db.delete(existing_reaction)
-            db.commit()
+            await db.delete(existing_reaction)
+            await db.commit()
             action = "removed"
             
             # WebSocket으로 실시간 알림
@@ -2104,7 +2114,7 @@ async def add_reaction(
             emoji=reaction.emoji
         )
         db.add(new_reaction)
-        db.commit()
+        await db.commit()
         action = "added"
         
         # WebSocket으로 실시간 알림
@@ -2151,7 +2161,7 @@ async def add_reaction(
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"絵文字リアクションの追加中にエラーが発生しました: {str(e)}"
@@ -1,22 +1,18 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import Company, Student, Department
 from datetime import datetime
 from utils.dependencies import get_current_user
+from utils.cache import cached
 import uuid
 
 router = APIRouter(prefix="/companies", tags=["회사 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/")
+@cached("companies.list", tags=("departments", "companies", "students"))
 def get_companies(
     name: Optional[str] = Query(None, description="회사 이름으로 검색"),
     page: int = Query(1, description="페이지 번호", ge=1),
@@ -49,7 +45,7 @@ def get_companies(
         result = []
         for department in departments:
             # 각 부서의 학생 수 계산
-            student_count = db.query(Student).filter(Student.company_id == str(department.company_id)).count()
+            student_count = db.query(Student).filter(Student.company_id == department.company_id).count()
             
             department_data = {
                 "id": str(department.id),  # 부서의 ID 반환
@@ -110,7 +106,7 @@ def get_companies_only(
         result = []
         for department in departments:
             # 각 부서의 학생 수 계산
-            student_count = db.query(Student).filter(Student.company_id == str(department.company_id)).count()
+            student_count = db.query(Student).filter(Student.company_id == department.company_id).count()
             
             department_data = {
                 "id": str(department.id),  # 부서의 ID 반환
@@ -147,7 +143,7 @@ def get_company(company_id: str, db: Session = Depends(get_db), current_user: di
             raise HTTPException(status_code=404, detail="회사를 찾을 수 없습니다")
         
         # 회사에 속한 학생들 조회
-        students = db.query(Student).filter(Student.company_id == company_id).all()
+        students = db.query(Student).filter(Student.company_id == company.id).all()
         
         company_data = {
             "id": str(company.id),
@@ -4,12 +4,16 @@ from supabase import create_client
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func
 from typing import Optional, List, Union
-from database import SessionLocal, engine
+from database import get_db
 from models import Contact, ContactPhoto, ContactComment, Student, Company, Profiles, PushSubscription
 from schemas import ContactCreate, ContactUpdate, ContactResponse, ContactCommentCreate, ContactPhotoCreate
 from datetime import datetime, date, timedelta
 import uuid
 from database_log import create_database_log
+from utils.pagination import CURSOR_QUERY, cursor_page_response, paginate_by_cursor
+from utils.count_cache import ESTIMATE_TOTAL_QUERY, count_total
+from utils.fields import ResponseField, column_field, fields_query, select_fields, loader_options, serialize_fields
+from utils.single_flight import coalesced
 import os
 import random
 import string
@@ -26,12 +30,6 @@ SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
 
 supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 def get_token_header(token: str = Depends(HTTPBearer())):
     return token.credentials
@@ -224,6 +222,77 @@ def generate_random_filename(original_filename: str) -> str:
 
 # ===== contact 관련 API들 =====
 
+def _profile_names(db: Session, contacts: list, include_comments: bool) -> dict:
+    """리포트 작성자와 코멘트 작성자의 이름 (프로필 ID → 이름)"""
+    profile_ids = set()
+    for contact in contacts:
+        profile_ids.add(contact.creator_id)
+        if include_comments:
+            profile_ids.update(comment.operator_id for comment in contact.comments)
+    profile_ids.discard(None)
+    if not profile_ids:
+        return {}
+    return dict(db.query(Profiles.id, Profiles.name).filter(Profiles.id.in_(profile_ids)).all())
+
+
+def _contact_comments(contact, context):
+    return [
+        {
+            "id": str(comment.id),
+            "operator_id": str(comment.operator_id),
+            "comment": comment.comment,
+            "created_at": comment.created_at.isoformat() + "Z" if comment.created_at else None,
+            "operator": {
+                "id": str(comment.operator_id),
+                "name": context["profile_names"].get(comment.operator_id)
+            }
+        } for comment in contact.comments
+    ]
+
+
+def _contact_photos(contact, context=None):
+    return [
+        {
+            "id": str(photo.id),
+            "photo_url": photo.photo_url,
+            "filename": photo.photo_url.split("/")[-1] if photo.photo_url else None,
+            "uploaded_at": photo.uploaded_at.isoformat() + "Z" if photo.uploaded_at else None,
+            "thumbnail_url": photo.photo_url,
+            "is_public": True
+        } for photo in contact.photos
+    ] if contact.photos else []
+
+
+# 리포트 목록 응답 필드 (fields 파라미터로 선택 가능)
+CONTACT_LIST_FIELDS = {
+    "id": column_field(Contact.id, str),
+    "creator_id": column_field(Contact.creator_id, str),
+    "occurrence_date": column_field(
+        Contact.occurrence_date, lambda value: value.strftime("%Y-%m-%d") if value else None
+    ),
+    "contact_type": column_field(Contact.contact_type),
+    "contact_content": column_field(Contact.contact_content),
+    "status": column_field(Contact.status),
+    "created_at": column_field(
+        Contact.created_at, lambda value: value.strftime("%Y-%m-%d %H:%M:%S") if value else None
+    ),
+    "photos_count": ResponseField(
+        lambda contact, context: len(contact.photos) if contact.photos else 0, relations=((Contact.photos,),)
+    ),
+    "comments_count": ResponseField(
+        lambda contact, context: len(contact.comments) if contact.comments else 0, relations=((Contact.comments,),)
+    ),
+    "photos": ResponseField(_contact_photos, relations=((Contact.photos,),)),
+    "comments": ResponseField(_contact_comments, relations=((Contact.comments,),)),
+    "creator": ResponseField(
+        lambda contact, context: {
+            "id": str(contact.creator_id),
+            "name": context["profile_names"].get(contact.creator_id),
+        },
+        columns=(Contact.creator_id,)
+    ),
+}
+
 @router.get("")
 def get_contact(
     contact_type: Optional[str] = Query(None, description="보고 종류로 필터링 (defect/claim/other)"),
@@ -232,16 +301,18 @@ def get_contact(
     occurrence_date_to: Optional[date] = Query(None, description="발생일 종료일"),
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = CURSOR_QUERY,
+    estimate_total: bool = ESTIMATE_TOTAL_QUERY,
+    fields: Optional[str] = fields_query(CONTACT_LIST_FIELDS),
     db: Session = Depends(get_db),
     current_user: Optional[dict] = Depends(get_current_user)
 ):
     """리포트 목록 조회 (필터링, 페이지네이션 지원)"""
     try:
-        # 기본 쿼리 생성
-        query = db.query(Contact).options(
-            joinedload(Contact.photos),
-            joinedload(Contact.comments)
-        )
+        selected_fields = select_fields(fields, CONTACT_LIST_FIELDS)
+
+        # 기본 쿼리 생성 (선택된 필드에 필요한 컬럼/관계만 로드)
+        query = db.query(Contact).options(*loader_options(selected_fields, CONTACT_LIST_FIELDS))
         
                 # 로그인한 사용자가 있는 경우 권한 체크 (Profiles 테이블에서 확인)
         user_role = "user"
@@ -272,75 +343,48 @@ def get_contact(
         if not is_admin and current_user:
             # 일반 사용자는 자신의 리포트만 조회
             query = query.filter(Contact.creator_id == current_user["id"])
-        # 최신순으로 정렬
-        query = query.order_by(Contact.created_at.desc())
-        
-        # 전체 항목 수 계산
-        total_count = query.count()
+        if cursor is not None:
+            # 커서 페이지네이션 (전체 항목 수 계산 없이 다음 페이지 커서만 반환)
+            contact, next_cursor = paginate_by_cursor(
+                query, Contact.id, cursor, page_size, sort_column=Contact.created_at, descending=True
+            )
+        else:
+            # 최신순으로 정렬
+            query = query.order_by(Contact.created_at.desc())
         
-        # 페이지네이션 적용
-        contact = query.offset((page - 1) * page_size).limit(page_size).all()
+            # 전체 항목 수 계산 (필터 조합/조회 범위별 캐시)
+            total_count, total_is_estimate = count_total(
+                query, "contact.list",
+                {
+                    "contact_type": contact_type, "status": status,
+                    "occurrence_date_from": occurrence_date_from, "occurrence_date_to": occurrence_date_to,
+                    "creator_id": current_user["id"] if current_user and not is_admin else None,
+                },
+                tables=("contact",),
+                estimate=estimate_total,
+            )
         
-        # 전체 페이지 수 계산
-        total_pages = (total_count + page_size - 1) // page_size
+            # 페이지네이션 적용
+            contact = query.offset((page - 1) * page_size).limit(page_size).all()
         
-        # 응답 데이터 준비
-        result = []
-        for contact in contact:
-            # creator 정보 조회
-            creator = db.query(Profiles).filter(Profiles.id == contact.creator_id).first()
-            creator_name = creator.name if creator else None
-            
-            # comments의 operator 정보 조회
-            comments_with_operators = []
-            for comment in contact.comments:
-                operator = db.query(Profiles).filter(Profiles.id == comment.operator_id).first()
-                operator_name = operator.name if operator else None
-                
-                comments_with_operators.append({
-                    "id": str(comment.id),
-                    "operator_id": str(comment.operator_id),
-                    "comment": comment.comment,
-                    "created_at": comment.created_at.isoformat() + "Z" if comment.created_at else None,
-                    "operator": {
-                        "id": str(comment.operator_id),
-                        "name": operator_name
-                    }
-                })
-            
-            contact_data = {
-                "id": str(contact.id),
-                "creator_id": str(contact.creator_id),
-                "occurrence_date": contact.occurrence_date.strftime("%Y-%m-%d") if contact.occurrence_date else None,
-                "contact_type": contact.contact_type,
-                "contact_content": contact.contact_content,
-                "status": contact.status,
-                "created_at": contact.created_at.strftime("%Y-%m-%d %H:%M:%S") if contact.created_at else None,
-                "photos_count": len(contact.photos) if contact.photos else 0,
-                "comments_count": len(contact.comments) if contact.comments else 0,
-                "photos": [
-                    {
-                        "id": str(photo.id),
-                        "photo_url": photo.photo_url,
-                        "filename": photo.photo_url.split("/")[-1] if photo.photo_url else None,
-                        "uploaded_at": photo.uploaded_at.isoformat() + "Z" if photo.uploaded_at else None,
-                        "thumbnail_url": photo.photo_url,
-                        "is_public": True
-                    } for photo in contact.photos
-                ] if contact.photos else [],
-                "comments": comments_with_operators,
-                "creator": {
-                    "id": str(contact.creator_id),
-                    "name": creator_name,
-                }
-            }
-            result.append(contact_data)
+            # 전체 페이지 수 계산
+            total_pages = (total_count + page_size - 1) // page_size
         
+        # 작성자/코멘트 작성자 이름은 필요한 경우에만 한 번에 조회
+        context = {}
+        if "creator" in selected_fields or "comments" in selected_fields:
+            context["profile_names"] = _profile_names(db, contact, include_comments="comments" in selected_fields)
+
+        # 응답 데이터 준비 (fields 지정 시 해당 키만)
+        result = [serialize_fields(item, selected_fields, context) for item in contact]
+
+        if cursor is not None:
+            return cursor_page_response(result, page_size, next_cursor)
 
-        
         return {
             "items": result,
             "total": total_count,
+            "total_is_estimate": total_is_estimate,
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages,
@@ -348,6 +392,8 @@ def get_contact(
             "has_previous": page > 1,
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"連絡一覧取得中にエラーが発生しました: {str(e)}")
 
@@ -978,6 +1024,7 @@ def delete_contact_comment(
 # ===== 통계 및 대시보드 API들 =====
 
 @router.get("/statistics/overview")
+@coalesced("contact.statistics.overview")
 def get_contact_statistics(
     db: Session = Depends(get_db)
 ):
@@ -1016,6 +1063,7 @@ def get_contact_statistics(
         raise HTTPException(status_code=500, detail=f"統計取得中にエラーが発生しました: {str(e)}")
 
 @router.get("/statistics/monthly")
+@coalesced("contact.statistics.monthly")
 def get_monthly_contact_statistics(
     year: int = Query(..., description="조회할 연도"),
     db: Session = Depends(get_db)
@@ -1,19 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import DatabaseLog
+from utils.pagination import CURSOR_QUERY, cursor_page_response, paginate_by_cursor
+from utils.count_cache import ESTIMATE_TOTAL_QUERY, count_total
 from datetime import datetime, date
 import uuid
 
 router = APIRouter(prefix="/database-logs", tags=["데이터베이스 로그"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/")
 def get_database_logs(
@@ -24,6 +20,8 @@ def get_database_logs(
     end_date: Optional[date] = Query(None, description="종료 날짜"),
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = CURSOR_QUERY,
+    estimate_total: bool = ESTIMATE_TOTAL_QUERY,
     db: Session = Depends(get_db)
 ):
     """데이터베이스 로그 목록 조회"""
@@ -42,17 +40,31 @@ def get_database_logs(
         if end_date:
             query = query.filter(DatabaseLog.created_at <= end_date)
         
-        # 최신순으로 정렬
-        query = query.order_by(DatabaseLog.created_at.desc())
+        if cursor is not None:
+            # 커서 페이지네이션 (전체 항목 수 계산 없이 다음 페이지 커서만 반환)
+            logs, next_cursor = paginate_by_cursor(
+                query, DatabaseLog.id, cursor, page_size, sort_column=DatabaseLog.created_at, descending=True
+            )
+        else:
+            # 최신순으로 정렬
+            query = query.order_by(DatabaseLog.created_at.desc())
         
-        # 전체 항목 수 계산
-        total_count = query.count()
+            # 전체 항목 수 계산 (필터 조합별 캐시)
+            total_count, total_is_estimate = count_total(
+                query, "database_logs.list",
+                {
+                    "table_name": table_name, "action": action, "user_id": user_id,
+                    "start_date": start_date, "end_date": end_date,
+                },
+                tables=("database_logs",),
+                estimate=estimate_total,
+            )
         
-        # 페이지네이션 적용
-        logs = query.offset((page - 1) * page_size).limit(page_size).all()
+            # 페이지네이션 적용
+            logs = query.offset((page - 1) * page_size).limit(page_size).all()
         
-        # 전체 페이지 수 계산
-        total_pages = (total_count + page_size - 1) // page_size
+            # 전체 페이지 수 계산
+            total_pages = (total_count + page_size - 1) // page_size
         
         # 응답 데이터 준비
         result = []
@@ -73,9 +85,13 @@ def get_database_logs(
             }
             result.append(log_data)
         
+        if cursor is not None:
+            return cursor_page_response(result, page_size, next_cursor)
+
         return {
             "items": result,
             "total": total_count,
+            "total_is_estimate": total_is_estimate,
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages,
@@ -83,6 +99,8 @@ def get_database_logs(
             "has_previous": page > 1
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터베이스 로그 조회 중 오류가 발생했습니다: {str(e)}")
 
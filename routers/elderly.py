@@ -1,25 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal, engine
-from models import ElderlyMealRecord, ElderlyHospitalization, Resident, Room, Building, User, Elderly, Profiles, PushSubscription, ElderlyCategories, BuildingCategoriesRent, ElderlyContract
-from schemas import ElderlyHospitalizationCreate, ElderlyMealRecordCreate, ElderlyMealRecordResponse, NewResidenceRequest, ElderlyCreate, ElderlyUpdate
+from database import get_db
+from models import ElderlyMealRecord, ElderlyHospitalization, Resident, Room, Building, User, Elderly, Profiles, PushSubscription, ElderlyCategories, ElderlyContract
+from schemas import ElderlyListResponse, ElderlyHospitalizationCreate, ElderlyMealRecordCreate, ElderlyMealRecordResponse, NewResidenceRequest, ElderlyCreate, ElderlyUpdate
 from datetime import datetime, date, timedelta
 import uuid
 import calendar
 import json
 from database_log import create_database_log
 from utils.dependencies import get_current_user
+from utils.pagination import CURSOR_QUERY, cursor_page_response, paginate_by_cursor
+from utils.count_cache import ESTIMATE_TOTAL_QUERY, count_total
+from utils.cache import cached, building_category_rent
+from utils.fields import ResponseField, column_field, optional_str, fields_query, select_fields, loader_options, serialize_fields
+from utils.single_flight import coalesced
 from pywebpush import webpush, WebPushException
 
 router = APIRouter(prefix="/elderly", tags=["고령자 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 def get_vapid_private_key():
     """VAPID 개인키를 가져옵니다. (main.py와 동일한 방식)"""
@@ -191,7 +190,106 @@ async def send_hospitalization_notification(
     except Exception as e:
         print(f"입원/퇴원 웹푸시 알림 전송 중 오류: {e}")
 
-@router.get("/")
+def _hospitalization_state(elderly):
+    """입원 상태와 최근(입원 중이면 현재) 입원 기록"""
+    hospitalization_status = "正常"
+    latest_hospitalization = None
+
+    if elderly.hospitalizations:
+        # 가장 최근 입원 기록 찾기
+        latest_hospitalization = max(elderly.hospitalizations, key=lambda x: x.admission_date)
+
+        # 퇴원일이 없는 기록이 있으면 입원중
+        current_hospitalization = [h for h in elderly.hospitalizations if h.discharge_date is None]
+
+        if current_hospitalization:
+            hospitalization_status = "入院中"
+            latest_hospitalization = max(current_hospitalization, key=lambda x: x.admission_date)
+
+    return hospitalization_status, latest_hospitalization
+
+
+def _latest_hospitalization_info(elderly, context=None):
+    latest_hospitalization = _hospitalization_state(elderly)[1]
+    if not latest_hospitalization:
+        return None
+    return {
+        "id": str(latest_hospitalization.id),
+        "elderly_id": str(latest_hospitalization.elderly_id),
+        "hospital_name": latest_hospitalization.hospital_name,
+        "admission_date": latest_hospitalization.admission_date,
+        "discharge_date": latest_hospitalization.discharge_date,
+        "last_meal_date": latest_hospitalization.last_meal_date,
+        "last_meal_type": latest_hospitalization.last_meal_type,
+        "meal_resume_date": latest_hospitalization.meal_resume_date,
+        "meal_resume_type": latest_hospitalization.meal_resume_type,
+        "note": latest_hospitalization.note
+    }
+
+
+def _current_room_info(elderly, context=None):
+    if not elderly.current_room:
+        return None
+    return {
+        "id": str(elderly.current_room.id),
+        "room_number": elderly.current_room.room_number,
+        "floor": elderly.current_room.floor,
+        "capacity": elderly.current_room.capacity,
+        "rent": elderly.current_room.rent,
+        "maintenance": elderly.current_room.maintenance,
+        "service": elderly.current_room.service,
+        "note": elderly.current_room.note,
+        "building": {
+            "id": str(elderly.current_room.building.id),
+            "name": elderly.current_room.building.name,
+            "address": elderly.current_room.building.address,
+            "resident_type": elderly.current_room.building.resident_type
+        } if elderly.current_room.building else None
+    }
+
+
+def _current_check_in_dates(db: Session, elderly_ids: list) -> dict:
+    """현재 거주 기록의 입주일 (고령자 ID → 입주일)"""
+    if not elderly_ids:
+        return {}
+    residents = db.query(Resident.resident_id, Resident.check_in_date).filter(
+        Resident.resident_id.in_(elderly_ids),
+        Resident.resident_type == "elderly",
+        Resident.is_active == True,
+        Resident.check_out_date.is_(None)
+    ).all()
+    check_in_dates = {}
+    for resident_id, check_in_date in residents:
+        check_in_dates.setdefault(resident_id, check_in_date)
+    return check_in_dates
+
+
+# 고령자 목록 응답 필드 (fields 파라미터로 선택 가능)
+ELDERLY_LIST_FIELDS = {
+    "id": column_field(Elderly.id, str),
+    **{
+        column.key: column_field(column) for column in (
+            Elderly.name, Elderly.email, Elderly.created_at, Elderly.phone, Elderly.avatar,
+            Elderly.name_katakana, Elderly.gender, Elderly.birth_date, Elderly.status,
+        )
+    },
+    "current_room_id": column_field(Elderly.current_room_id, optional_str),
+    "care_level": column_field(Elderly.care_level),
+    "check_in_date": ResponseField(lambda elderly, context: context["check_in_dates"].get(elderly.id)),
+    "contract_date": column_field(Elderly.contract_date),
+    "hospitalization_status": ResponseField(
+        lambda elderly, context: _hospitalization_state(elderly)[0],
+        relations=((Elderly.hospitalizations,),)
+    ),
+    "latest_hospitalization": ResponseField(_latest_hospitalization_info, relations=((Elderly.hospitalizations,),)),
+    "current_room": ResponseField(
+        _current_room_info,
+        columns=(Elderly.current_room_id,),
+        relations=((Elderly.current_room, Room.building),)
+    ),
+}
+
+@router.get("/", response_model=ElderlyListResponse, response_model_exclude_unset=True)
 def get_elderly(
     name: Optional[str] = Query(None, description="고령자 이름으로 검색"),
     name_katakana: Optional[str] = Query(None, description="고령자 이름 카타카나로 검색"),
@@ -204,18 +302,19 @@ def get_elderly(
     sort_desc: Optional[bool] = Query(False, description="내림차순 정렬 여부 (true: 내림차순, false: 오름차순)"),
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = CURSOR_QUERY,
+    estimate_total: bool = ESTIMATE_TOTAL_QUERY,
+    fields: Optional[str] = fields_query(ELDERLY_LIST_FIELDS),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
     고령자 목록을 조회합니다.
     """
-    # 기본 쿼리 생성
-    query = db.query(Elderly).options(
-        joinedload(Elderly.current_room).joinedload(Room.building),
-        joinedload(Elderly.category),
-        joinedload(Elderly.hospitalizations)
-    )
+    selected_fields = select_fields(fields, ELDERLY_LIST_FIELDS)
+
+    # 기본 쿼리 생성 (선택된 필드에 필요한 컬럼/관계만 로드)
+    query = db.query(Elderly).options(*loader_options(selected_fields, ELDERLY_LIST_FIELDS))
     
     # 검색 조건 적용
     if name:
@@ -246,115 +345,62 @@ def get_elderly(
         query = query.filter(Room.room_number.ilike(f"%{room_number}%"))
     
     # 정렬 적용
+    sort_column = Elderly.created_at
     if sort_by:
         if sort_by == "name":
-            if sort_desc:
-                query = query.order_by(Elderly.name.desc())
-            else:
-                query = query.order_by(Elderly.name.asc())
+            sort_column = Elderly.name
         elif sort_by == "current_room.room_number":
             # Room 테이블과 조인하여 방번호로 정렬
             query = query.outerjoin(Room, Elderly.current_room_id == Room.id)
-            if sort_desc:
-                query = query.order_by(Room.room_number.desc())
-            else:
-                query = query.order_by(Room.room_number.asc())
+            sort_column = Room.room_number
     else:
         # 기본 정렬: 생성일 기준 내림차순
-        query = query.order_by(Elderly.created_at.desc())
-    
-    # 전체 개수 계산
-    total_count = query.count()
-    
-    # 페이지네이션 적용
-    offset = (page - 1) * page_size
-    elderly_list = query.offset(offset).limit(page_size).all()
-    
-    # 응답 데이터 구성
-    elderly_data = []
-    for elderly in elderly_list:
-        # 입원 상태 확인 (새로운 스키마)
-        hospitalization_status = "正常"
-        latest_hospitalization = None
-        
-        if elderly.hospitalizations:
-            # 가장 최근 입원 기록 찾기
-            latest_hospitalization = max(elderly.hospitalizations, key=lambda x: x.admission_date)
-            
-            # 퇴원일이 없는 기록이 있으면 입원중
-            current_hospitalization = [h for h in elderly.hospitalizations if h.discharge_date is None]
-            
-            if current_hospitalization:
-                hospitalization_status = "入院中"
-                latest_hospitalization = max(current_hospitalization, key=lambda x: x.admission_date)
-        
-        # 현재 거주 기록에서 입주일 조회
-        current_resident = db.query(Resident).filter(
-            Resident.resident_id == elderly.id,
-            Resident.resident_type == "elderly",
-            Resident.is_active == True,
-            Resident.check_out_date.is_(None)
-        ).first()
-        
-        elderly_dict = {
-        "id": str(elderly.id),
-        "name": elderly.name,
-            "email": elderly.email,
-            "created_at": elderly.created_at,
-            "phone": elderly.phone,
-            "avatar": elderly.avatar,
-        "name_katakana": elderly.name_katakana,
-        "gender": elderly.gender,
-            "birth_date": elderly.birth_date,
-            "status": elderly.status,
-            "current_room_id": str(elderly.current_room_id) if elderly.current_room_id else None,
-            "care_level": elderly.care_level,
-            "check_in_date": current_resident.check_in_date if current_resident else None,
-            "contract_date": elderly.contract_date,
-            "hospitalization_status": hospitalization_status,
-            "latest_hospitalization": {
-                "id": str(latest_hospitalization.id),
-                "elderly_id": str(latest_hospitalization.elderly_id),
-                "hospital_name": latest_hospitalization.hospital_name,
-                "admission_date": latest_hospitalization.admission_date,
-                "discharge_date": latest_hospitalization.discharge_date,
-                "last_meal_date": latest_hospitalization.last_meal_date,
-                "last_meal_type": latest_hospitalization.last_meal_type,
-                "meal_resume_date": latest_hospitalization.meal_resume_date,
-                "meal_resume_type": latest_hospitalization.meal_resume_type,
-                "note": latest_hospitalization.note
-            } if latest_hospitalization else None,
-            "current_room": None
-        }
-        
-        # 현재 방 정보 추가
-        if elderly.current_room:
-            elderly_dict["current_room"] = {
-                "id": str(elderly.current_room.id),
-                "room_number": elderly.current_room.room_number,
-                "floor": elderly.current_room.floor,
-                "capacity": elderly.current_room.capacity,
-                "rent": elderly.current_room.rent,
-                "maintenance": elderly.current_room.maintenance,
-                "service": elderly.current_room.service,
-                "note": elderly.current_room.note,
-                "building": {
-                    "id": str(elderly.current_room.building.id),
-                    "name": elderly.current_room.building.name,
-                    "address": elderly.current_room.building.address,
-                    "resident_type": elderly.current_room.building.resident_type
-                } if elderly.current_room.building else None
-            }
-        
-        elderly_data.append(elderly_dict)
+        sort_by, sort_desc = "created_at", True
+
+    if cursor is not None:
+        # 커서 페이지네이션 (전체 개수 계산 없이 다음 페이지 커서만 반환)
+        elderly_list, next_cursor = paginate_by_cursor(
+            query, Elderly.id, cursor, page_size,
+            sort_column=sort_column, descending=sort_desc, sort_name=f"{sort_by}:{sort_desc}"
+        )
+    else:
+        query = query.order_by(sort_column.desc() if sort_desc else sort_column.asc())
+
+        # 전체 개수 계산 (필터 조합별 캐시)
+        total_count, total_is_estimate = count_total(
+            query, "elderly.list",
+            {
+                "name": name, "name_katakana": name_katakana, "gender": gender, "care_level": care_level,
+                "status": status, "building_id": building_id, "room_number": room_number,
+            },
+            tables=("elderly", "rooms", "buildings"),
+            estimate=estimate_total,
+        )
+
+        # 페이지네이션 적용
+        offset = (page - 1) * page_size
+        elderly_list = query.offset(offset).limit(page_size).all()
     
+    # 입주일은 필요한 경우에만 한 번에 조회
+    context = {}
+    if "check_in_date" in selected_fields:
+        context["check_in_dates"] = _current_check_in_dates(db, [elderly.id for elderly in elderly_list])
+
+    # 응답 데이터 구성 (fields 지정 시 해당 키만)
+    elderly_data = [serialize_fields(elderly, selected_fields, context) for elderly in elderly_list]
+
+    if cursor is not None:
+        return cursor_page_response(elderly_data, page_size, next_cursor)
+
     return {
         "items": elderly_data,
         "total": total_count,
+        "total_is_estimate": total_is_estimate,
         "total_pages": (total_count + page_size - 1) // page_size
     }
 
 @router.get("/rent-by-category")
+@cached("elderly.rent_by_category", tags=("buildings", "rooms", "building_categories_rents"))
 def get_elderly_rent_by_category(
     categories_id: str = Query(..., description="카테고리 ID"),
     building_id: str = Query(..., description="빌딩 ID"),
@@ -389,14 +435,11 @@ def get_elderly_rent_by_category(
         deposit_value = room.deposit
         
         # BuildingCategoriesRent에서 추가 조회하여 rent 값 대체
-        rent_info = db.query(BuildingCategoriesRent).filter(
-            BuildingCategoriesRent.building_id == building_id,
-            BuildingCategoriesRent.categories_id == categories_id
-        ).first()
+        rent_info = building_category_rent(db, building_id, categories_id)
         
         # BuildingCategoriesRent에서 데이터가 있으면 rent 값을 monthly_rent로 대체
         if rent_info:
-            rent_value = rent_info.monthly_rent
+            rent_value = rent_info["monthly_rent"]
         
         # 응답 데이터 구성
         return {
@@ -2422,6 +2465,7 @@ def create_new_elderly_residence(
         raise HTTPException(status_code=500, detail=f"居住記録追加中にエラーが発生しました: {str(e)}")
 
 @router.get("/buildings/{building_id}/statistics")
+@coalesced("elderly.building_statistics")
 def get_building_elderly_statistics(
     building_id: str,
     db: Session = Depends(get_db),
@@ -1,20 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import CareItem, CareMealPrice, CareUtilityPrice
 from schemas import CareItemResponse, CareMealPriceCreate, CareMealPriceUpdate, CareMealPriceResponse, CareUtilityPriceCreate, CareUtilityPriceUpdate, CareUtilityPriceResponse
 from datetime import datetime
 import uuid
+from utils.cache import cached
 
 router = APIRouter(prefix="/elderly-care", tags=["고령자 케어 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/care-items", response_model=List[CareItemResponse])
 def get_care_items(db: Session = Depends(get_db)):
@@ -28,11 +23,21 @@ def get_care_items(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"케어 항목 조회 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/care-meal-prices", response_model=List[CareMealPriceResponse])
+@cached("elderly_care.meal_prices", tags=("care_meal_prices",))
 def get_care_meal_prices(db: Session = Depends(get_db)):
-    """케어 식사 가격 목록 조회"""
+    """케어 식사 가격 목록 조회 (가격 생성/수정/삭제 시 캐시 자동 무효화)"""
     try:
         meal_prices = db.query(CareMealPrice).all()
-        return meal_prices
+        return [
+            {
+                "id": str(price.id),
+                "meal_type": price.meal_type,
+                "price": price.price,
+                "is_active": price.is_active,
+                "created_at": price.created_at
+            }
+            for price in meal_prices
+        ]
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"케어 식사 가격 조회 중 오류가 발생했습니다: {str(e)}")
@@ -118,11 +123,22 @@ def delete_care_meal_price(price_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"케어 식사 가격 삭제 중 오류가 발생했습니다: {str(e)}")
 
 @router.get("/care-utility-prices", response_model=List[CareUtilityPriceResponse])
+@cached("elderly_care.utility_prices", tags=("care_utility_prices",))
 def get_care_utility_prices(db: Session = Depends(get_db)):
-    """케어 유틸리티 가격 목록 조회"""
+    """케어 유틸리티 가격 목록 조회 (가격 생성/수정/삭제 시 캐시 자동 무효화)"""
     try:
         utility_prices = db.query(CareUtilityPrice).all()
-        return utility_prices
+        return [
+            {
+                "id": str(price.id),
+                "utility_type": price.utility_type,
+                "price_per_unit": price.price_per_unit,
+                "unit": price.unit,
+                "is_active": price.is_active,
+                "created_at": price.created_at
+            }
+            for price in utility_prices
+        ]
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"케어 유틸리티 가격 조회 중 오류가 발생했습니다: {str(e)}")
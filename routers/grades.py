@@ -1,19 +1,13 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import Grade, Student
 from datetime import datetime
 import uuid
 
 router = APIRouter(prefix="/grades", tags=["등급 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/")
 def get_grades(
@@ -75,7 +69,7 @@ def get_grade(grade_id: str, db: Session = Depends(get_db)):
             raise HTTPException(status_code=404, detail="등급을 찾을 수 없습니다")
         
         # 등급에 속한 학생들 조회
-        students = db.query(Student).filter(Student.grade_id == grade_id).all()
+        students = db.query(Student).filter(Student.grade_id == grade.id).all()
         
         grade_data = {
             "id": str(grade.id),
@@ -1,20 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import Invoice, InvoiceItem, Student, Company, Room, Building
 from schemas import InvoiceCreate, InvoiceResponse, InvoiceUpdate
 from datetime import datetime, date
 import uuid
+from utils.ids import parse_uuid
+from utils.pagination import CURSOR_QUERY, cursor_page_response, paginate_by_cursor
+from utils.count_cache import ESTIMATE_TOTAL_QUERY, count_total
 
 router = APIRouter(prefix="/invoices", tags=["인보이스 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.post("/", response_model=InvoiceResponse)
 def create_invoice(invoice_data: InvoiceCreate, db: Session = Depends(get_db)):
@@ -28,7 +25,7 @@ def create_invoice(invoice_data: InvoiceCreate, db: Session = Depends(get_db)):
         # 새 인보이스 생성
         new_invoice = Invoice(
             id=str(uuid.uuid4()),
-            student_id=invoice_data.student_id,
+            student_id=student.id,
             invoice_date=invoice_data.invoice_date,
             due_date=invoice_data.due_date,
             total_amount=invoice_data.total_amount,
@@ -64,6 +61,8 @@ def get_invoices(
     end_date: Optional[date] = Query(None, description="종료 날짜"),
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = CURSOR_QUERY,
+    estimate_total: bool = ESTIMATE_TOTAL_QUERY,
     db: Session = Depends(get_db)
 ):
     """인보이스 목록 조회"""
@@ -72,7 +71,7 @@ def get_invoices(
         
         # 필터링 적용
         if student_id:
-            query = query.filter(Invoice.student_id == student_id)
+            query = query.filter(Invoice.student_id == parse_uuid(student_id, "学生ID"))
         if status:
             query = query.filter(Invoice.status == status)
         if start_date:
@@ -80,17 +79,28 @@ def get_invoices(
         if end_date:
             query = query.filter(Invoice.invoice_date <= end_date)
         
-        # 최신순으로 정렬
-        query = query.order_by(Invoice.invoice_date.desc())
-        
-        # 전체 항목 수 계산
-        total_count = query.count()
-        
-        # 페이지네이션 적용
-        invoices = query.offset((page - 1) * page_size).limit(page_size).all()
-        
-        # 전체 페이지 수 계산
-        total_pages = (total_count + page_size - 1) // page_size
+        if cursor is not None:
+            # 커서 페이지네이션 (전체 항목 수 계산 없이 다음 페이지 커서만 반환)
+            invoices, next_cursor = paginate_by_cursor(
+                query, Invoice.id, cursor, page_size, sort_column=Invoice.invoice_date, descending=True
+            )
+        else:
+            # 최신순으로 정렬
+            query = query.order_by(Invoice.invoice_date.desc())
+        
+            # 전체 항목 수 계산 (필터 조합별 캐시)
+            total_count, total_is_estimate = count_total(
+                query, "invoices.list",
+                {"student_id": student_id, "status": status, "start_date": start_date, "end_date": end_date},
+                tables=("invoices",),
+                estimate=estimate_total,
+            )
+        
+            # 페이지네이션 적용
+            invoices = query.offset((page - 1) * page_size).limit(page_size).all()
+        
+            # 전체 페이지 수 계산
+            total_pages = (total_count + page_size - 1) // page_size
         
         # 응답 데이터 준비
         result = []
@@ -108,9 +118,13 @@ def get_invoices(
             }
             result.append(invoice_data)
         
+        if cursor is not None:
+            return cursor_page_response(result, page_size, next_cursor)
+
         return {
             "items": result,
             "total": total_count,
+            "total_is_estimate": total_is_estimate,
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages,
@@ -118,6 +132,8 @@ def get_invoices(
             "has_previous": page > 1
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"인보이스 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
@@ -275,7 +291,7 @@ def get_company_invoice_pdf(
             raise HTTPException(status_code=404, detail="회사를 찾을 수 없습니다")
         
         # 해당 회사 소속 학생들의 월간 인보이스 조회
-        students = db.query(Student).filter(Student.company_id == company_id).all()
+        students = db.query(Student).filter(Student.company_id == company.id).all()
         
         # 월간 인보이스 데이터 구성
         monthly_data = {
@@ -328,7 +344,7 @@ def get_student_monthly_invoice(
         
         # 해당 월의 인보이스 조회
         invoice = db.query(Invoice).filter(
-            Invoice.student_id == student_id,
+            Invoice.student_id == student.id,
             db.func.extract('year', Invoice.invoice_date) == year,
             db.func.extract('month', Invoice.invoice_date) == month
         ).first()
@@ -1,20 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
-from models import Student, Room, BillingMonthlyItem
+from database import get_db
+from models import Student, Room
 from datetime import datetime, date
 import calendar
 import uuid
+from utils.monthly_items import fetch_monthly_items, group_items_by_student
 
 router = APIRouter(prefix="/monthly-billing", tags=["월별 청구서"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # 이 API들은 buildings.py로 이동되었습니다
 # @router.get("/buildings/monthly-invoice-preview/students/{year}/{month}") - buildings.py에 있음
@@ -37,13 +32,11 @@ def validate_monthly_billing(year: int, month: int, db: Session = Depends(get_db
         students = db.query(Student).filter(Student.status == "active").all()
         validation_results = []
         
+        # 해당 월의 월별 항목들을 한 번에 조회하여 학생별로 그룹화
+        items_by_student = group_items_by_student(fetch_monthly_items(db, year, month))
+        
         for student in students:
-            # 해당 월의 월별 항목들 조회
-            monthly_items = db.query(BillingMonthlyItem).filter(
-                BillingMonthlyItem.student_id == student.id,
-                BillingMonthlyItem.year == year,
-                BillingMonthlyItem.month == month
-            ).all()
+            monthly_items = items_by_student.get(student.id, [])
             
             student_validation = {
                 "student_id": str(student.id),
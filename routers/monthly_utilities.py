@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import Room, Student, RoomUtility
 from datetime import datetime, date
 import calendar
@@ -9,12 +9,6 @@ import uuid
 
 router = APIRouter(prefix="/monthly-utilities", tags=["월별 유틸리티 상세 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # 이 API들은 rooms.py로 이동되었습니다
 # @router.get("/rooms/{room_id}/utilities/monthly-allocation/{year}/{month}") - rooms.py에 있음
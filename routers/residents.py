@@ -1,17 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from database import SessionLocal
+from database import get_db
 from models import Student
 
 
 router = APIRouter(prefix="/residents", tags=["거주자 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # 이 API들은 rooms.py로 이동되었습니다
 # @router.get("/rooms/{room_id}/residents") - rooms.py에 있음
@@ -1,20 +1,16 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import RoomCharge, ChargeItem, ChargeItemAllocation, Student, Room
+from utils.pagination import CURSOR_QUERY, cursor_page_response, paginate_by_cursor
+from utils.count_cache import ESTIMATE_TOTAL_QUERY, count_total
 from schemas import RoomChargeCreate, RoomChargeUpdate, ChargeItemCreate, ChargeItemUpdate, ChargeItemAllocationCreate, ChargeItemAllocationUpdate
 from datetime import datetime
 import uuid
 
 router = APIRouter(prefix="/room-charges", tags=["방 요금 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.post("/", response_model=dict)
 def create_room_charge(
@@ -64,6 +60,8 @@ def get_room_charges(
     status: Optional[str] = Query(None, description="상태로 필터링"),
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = CURSOR_QUERY,
+    estimate_total: bool = ESTIMATE_TOTAL_QUERY,
     db: Session = Depends(get_db)
 ):
     """방 요금 목록 조회"""
@@ -76,14 +74,25 @@ def get_room_charges(
         if status:
             query = query.filter(RoomCharge.status == status)
         
-        # 전체 항목 수 계산
-        total_count = query.count()
+        if cursor is not None:
+            # 커서 페이지네이션 (청구일 최신순, 전체 항목 수 계산 없이 다음 페이지 커서만 반환)
+            charges, next_cursor = paginate_by_cursor(
+                query, RoomCharge.id, cursor, page_size, sort_column=RoomCharge.charge_date, descending=True
+            )
+        else:
+            # 전체 항목 수 계산 (필터 조합별 캐시)
+            total_count, total_is_estimate = count_total(
+                query, "room_charges.list",
+                {"room_id": room_id, "status": status},
+                tables=("room_charges",),
+                estimate=estimate_total,
+            )
         
-        # 페이지네이션 적용
-        charges = query.offset((page - 1) * page_size).limit(page_size).all()
+            # 페이지네이션 적용
+            charges = query.offset((page - 1) * page_size).limit(page_size).all()
         
-        # 전체 페이지 수 계산
-        total_pages = (total_count + page_size - 1) // page_size
+            # 전체 페이지 수 계산
+            total_pages = (total_count + page_size - 1) // page_size
         
         # 응답 데이터 준비
         result = []
@@ -100,9 +109,13 @@ def get_room_charges(
             }
             result.append(charge_data)
         
+        if cursor is not None:
+            return cursor_page_response(result, page_size, next_cursor)
+
         return {
             "items": result,
             "total": total_count,
+            "total_is_estimate": total_is_estimate,
             "page": page,
             "page_size": page_size,
             "total_pages": total_pages,
@@ -110,6 +123,8 @@ def get_room_charges(
             "has_previous": page > 1
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"방 요금 목록 조회 중 오류가 발생했습니다: {str(e)}")
 
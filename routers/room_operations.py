@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import Room, Student, RoomLog, ResidenceCardHistory
 from schemas import AssignRoomRequest, NewResidenceRequest
 from datetime import datetime
@@ -9,12 +9,6 @@ import uuid
 
 router = APIRouter(prefix="/room-operations", tags=["방 운영 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # 이 API들은 rooms.py로 이동되었습니다
 # @router.post("/rooms/{room_id}/check-in") - rooms.py에 있음
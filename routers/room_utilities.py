@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import RoomUtility, Student, Room, Resident
 from schemas import RoomUtilityCreate, RoomUtilityUpdate
 from datetime import datetime, date, timedelta
@@ -11,12 +11,6 @@ import uuid
 
 router = APIRouter(prefix="/room-utilities", tags=["방 유틸리티 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.post("/", response_model=dict)
 def create_room_utility(
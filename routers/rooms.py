@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import Room, Building, Student, RoomUtility, Resident, UserBuildingPermission
 from schemas import RoomResponse, RoomUpdate, RoomCreate
 from database_log import create_database_log
@@ -11,12 +11,6 @@ import uuid
 
 router = APIRouter(prefix="/rooms", tags=["방 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 @router.get("/")
 def get_rooms(
@@ -4,9 +4,9 @@ from supabase import create_client
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, or_, and_
 from typing import Optional, List
-from database import SessionLocal, engine
+from database import get_db
 from models import Student, Company, Grade, Room, Building, ResidenceCardHistory, Resident, BillingMonthlyItem, Department
-from schemas import StudentCreate, StudentUpdate, StudentResponse, VisaInfoUpdate, NewResidenceRequest, BillingMonthlyItemCreate, BillingMonthlyItemUpdate, MonthlyItemSortOrderUpdate
+from schemas import StudentCreate, StudentUpdate, StudentResponse, StudentListResponse, VisaInfoUpdate, NewResidenceRequest, BillingMonthlyItemCreate, BillingMonthlyItemUpdate, MonthlyItemSortOrderUpdate
 from datetime import datetime, date, timedelta
 import uuid
 from database_log import create_database_log
@@ -15,6 +15,10 @@ import random
 import string
 from supabase import create_client
 from utils.dependencies import get_current_user
+from utils.pagination import CURSOR_QUERY, cursor_page_response, paginate_by_cursor
+from utils.count_cache import ESTIMATE_TOTAL_QUERY, count_total
+from utils.student_search import build_search_query, normalize_search_text, serialize_search_result
+from utils.fields import ResponseField, column_field, optional_str, fields_query, select_fields, loader_options, serialize_fields
 
 router = APIRouter(prefix="/students", tags=["학생 관리"])
 
@@ -26,12 +30,6 @@ SUPABASE_SERVICE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
 supabase_storage = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY) if SUPABASE_SERVICE_KEY else None
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 def get_token_header(token: str = Depends(HTTPBearer())):
     return token.credentials
@@ -49,7 +47,68 @@ def generate_random_filename(original_filename: str) -> str:
     
     return new_filename
 
-@router.get("/")
+def _department_info(student, context=None):
+    """부서 정보 구성 (회사 이름 + 부서 이름)"""
+    if not student.department:
+        return None
+    if student.department.name == "-":
+        # 부서 이름이 "-"인 경우 회사 이름만 표시
+        department_display_name = student.department.company.name if student.department.company else student.department.name
+    else:
+        # 부서 이름이 "-"가 아닌 경우 "회사 이름 - 부서 이름" 형태로 표시
+        company_name = student.department.company.name if student.department.company else ""
+        department_display_name = f"{company_name} - {student.department.name}" if company_name else student.department.name
+
+    return {
+        "id": str(student.department.id),
+        "name": department_display_name,
+        "department_name": student.department.name,
+        "company_name": student.department.company.name if student.department.company else None
+    }
+
+
+# 학생 목록 응답 필드 (fields 파라미터로 선택 가능)
+STUDENT_LIST_FIELDS = {
+    "id": column_field(Student.id, str),
+    "name": column_field(Student.name),
+    "email": column_field(Student.email, lambda value: value if value else ""),
+    "created_at": column_field(Student.created_at),
+    "department_id": column_field(Student.department_id, optional_str),
+    "consultant": column_field(Student.consultant),
+    "phone": column_field(Student.phone),
+    "avatar": column_field(Student.avatar),
+    "grade_id": column_field(Student.grade_id, optional_str),
+    **{
+        column.key: column_field(column) for column in (
+            Student.cooperation_submitted_date, Student.cooperation_submitted_place, Student.assignment_date,
+            Student.ward, Student.name_katakana, Student.gender, Student.birth_date, Student.nationality,
+            Student.has_spouse, Student.japanese_level, Student.passport_number, Student.residence_card_number,
+            Student.residence_card_start, Student.residence_card_expiry, Student.resignation_date,
+            Student.local_address, Student.address, Student.experience_over_2_years, Student.status,
+            Student.arrival_type, Student.student_type, Student.note,
+        )
+    },
+    "department": ResponseField(
+        _department_info,
+        columns=(Student.department_id,),
+        relations=((Student.department, Department.company),)
+    ),
+    "grade": ResponseField(
+        lambda student, context: {"name": student.grade.name} if student.grade else None,
+        columns=(Student.grade_id,),
+        relations=((Student.grade,),)
+    ),
+    "current_room": ResponseField(
+        lambda student, context: {
+            "room_number": student.current_room.room_number,
+            "building_name": student.current_room.building.name
+        } if student.current_room and student.current_room.building else None,
+        columns=(Student.current_room_id,),
+        relations=((Student.current_room, Room.building),)
+    ),
+}
+
+@router.get("/", response_model=StudentListResponse, response_model_exclude_unset=True)
 def get_students(
     name: Optional[str] = Query(None, description="학생 이름으로 검색"),
     name_katakana: Optional[str] = Query(None, description="학생 이름 카타카나로 검색"),
@@ -67,15 +126,18 @@ def get_students(
     sort_desc: Optional[bool] = Query(False, description="내림차순 정렬 여부 (true: 내림차순, false: 오름차순)"),
     page: int = Query(1, description="페이지 번호", ge=1),
     page_size: int = Query(10, description="페이지당 항목 수", ge=1, le=100),
+    cursor: Optional[str] = CURSOR_QUERY,
+    estimate_total: bool = ESTIMATE_TOTAL_QUERY,
+    fields: Optional[str] = fields_query(STUDENT_LIST_FIELDS),
     db: Session = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     """학생 목록 조회 (검색, 필터링, 정렬, 페이지네이션 지원)"""
-    # 기본 쿼리 생성
+    selected_fields = select_fields(fields, STUDENT_LIST_FIELDS)
+
+    # 기본 쿼리 생성 (선택된 필드에 필요한 컬럼/관계만 로드)
     query = db.query(Student).options(
-        joinedload(Student.grade),
-        joinedload(Student.department).joinedload(Department.company),
-        joinedload(Student.current_room).joinedload(Room.building)
+        *loader_options(selected_fields, STUDENT_LIST_FIELDS)
     ).outerjoin(Grade).outerjoin(Department, Student.department_id == Department.id)
 
     # 방 관련 필터링이 있는 경우 Room과 Building 테이블과 조인
@@ -115,100 +177,56 @@ def get_students(
             # 빌딩이 있는 학생 (current_room_id가 NOT NULL인 경우)
             query = query.filter(Student.current_room_id.isnot(None))
     
-    # 정렬 적용
-    if sort_by:
-        if sort_by == "nationality":
-            if sort_desc:
-                query = query.order_by(Student.nationality.desc())
-            else:
-                query = query.order_by(Student.nationality.asc())
-        elif sort_by == "grade.name":
-            if sort_desc:
-                query = query.order_by(Grade.name.desc())
-            else:
-                query = query.order_by(Grade.name.asc())
-        elif sort_by == "student_type":
-            if sort_desc:
-                query = query.order_by(Student.student_type.desc())
-            else:
-                query = query.order_by(Student.student_type.asc())
-    
-    # 전체 항목 수 계산
-    total_count = query.count()
+    # 정렬 필드
+    sort_columns = {
+        "nationality": Student.nationality,
+        "grade.name": Grade.name,
+        "student_type": Student.student_type,
+    }
+    sort_column = sort_columns.get(sort_by)
+
+    if cursor is not None:
+        # 커서 페이지네이션 (정렬 미지정 시 최신 등록순)
+        if sort_column is None:
+            sort_by, sort_column, sort_desc = "created_at", Student.created_at, True
+        students, next_cursor = paginate_by_cursor(
+            query, Student.id, cursor, page_size,
+            sort_column=sort_column, descending=sort_desc, sort_name=f"{sort_by}:{sort_desc}"
+        )
+    else:
+        # 정렬 적용
+        if sort_column is not None:
+            query = query.order_by(sort_column.desc() if sort_desc else sort_column.asc())
+
+        # 전체 항목 수 계산 (필터 조합별 캐시, 2페이지 이후에는 다시 세지 않음)
+        total_count, total_is_estimate = count_total(
+            query, "students.list",
+            {
+                "student_type": None if student_type == "ALL" else student_type, "name": name,
+                "nationality": nationality, "name_katakana": name_katakana, "department": department,
+                "consultant": consultant, "email": email, "building_name": building_name,
+                "room_number": room_number, "status": status, "grade": grade, "has_no_building": has_no_building,
+            },
+            tables=("students", "grades", "departments", "rooms", "buildings"),
+            estimate=estimate_total,
+        )
 
-    # 페이지네이션 적용
-    students = query.offset((page - 1) * page_size).limit(page_size).all()
+        # 페이지네이션 적용
+        students = query.offset((page - 1) * page_size).limit(page_size).all()
 
-    # 전체 페이지 수 계산
-    total_pages = (total_count + page_size - 1) // page_size
+        # 전체 페이지 수 계산
+        total_pages = (total_count + page_size - 1) // page_size
 
-    # 응답 데이터 준비
-    result = []
-    for student in students:
-        # 부서 정보 구성 (회사 이름 + 부서 이름)
-        department_info = None
-        if student.department:
-            if student.department.name == "-":
-                # 부서 이름이 "-"인 경우 회사 이름만 표시
-                department_display_name = student.department.company.name if student.department.company else student.department.name
-            else:
-                # 부서 이름이 "-"가 아닌 경우 "회사 이름 - 부서 이름" 형태로 표시
-                company_name = student.department.company.name if student.department.company else ""
-                department_display_name = f"{company_name} - {student.department.name}" if company_name else student.department.name
-            
-            department_info = {
-                "id": str(student.department.id),
-                "name": department_display_name,
-                "department_name": student.department.name,
-                "company_name": student.department.company.name if student.department.company else None
-            }
+    # 응답 데이터 준비 (fields 지정 시 해당 키만)
+    result = [serialize_fields(student, selected_fields) for student in students]
 
-        student_data = {
-            "id": str(student.id),
-            "name": student.name,
-            "email": student.email if student.email else "",
-            "created_at": student.created_at,
-            "department_id": str(student.department_id) if student.department_id else None,
-            "consultant": student.consultant,
-            "phone": student.phone,
-            "avatar": student.avatar,
-            "grade_id": str(student.grade_id) if student.grade_id else None,
-            "cooperation_submitted_date": student.cooperation_submitted_date,
-            "cooperation_submitted_place": student.cooperation_submitted_place,
-            "assignment_date": student.assignment_date,
-            "ward": student.ward,
-            "name_katakana": student.name_katakana,
-            "gender": student.gender,
-            "birth_date": student.birth_date,
-            "nationality": student.nationality,
-            "has_spouse": student.has_spouse,
-            "japanese_level": student.japanese_level,
-            "passport_number": student.passport_number,
-            "residence_card_number": student.residence_card_number,
-            "residence_card_start": student.residence_card_start,
-            "residence_card_expiry": student.residence_card_expiry,
-            "resignation_date": student.resignation_date,
-            "local_address": student.local_address,
-            "address": student.address,
-            "experience_over_2_years": student.experience_over_2_years,
-            "status": student.status,
-            "arrival_type": student.arrival_type,
-            "student_type": student.student_type,
-            "note": student.note,
-            "department": department_info,
-            "grade": {
-                "name": student.grade.name
-            } if student.grade else None,
-            "current_room": {
-                "room_number": student.current_room.room_number,
-                "building_name": student.current_room.building.name
-            } if student.current_room and student.current_room.building else None
-        }
-        result.append(student_data)
+    if cursor is not None:
+        return cursor_page_response(result, page_size, next_cursor)
 
     return {
         "items": result,
         "total": total_count,
+        "total_is_estimate": total_is_estimate,
         "page": page,
         "page_size": page_size,
         "total_pages": total_pages,
@@ -216,6 +234,26 @@ def get_students(
         "has_previous": page > 1
     }
 
+@router.get("/search")
+def search_students(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (이름, 카타카나, 국적, 이메일, 방 번호, 건물, 등급)"),
+    student_type: Optional[str] = Query(None, description="학생 유형으로 필터링"),
+    status: Optional[str] = Query(None, description="상태로 필터링"),
+    limit: int = Query(20, description="최대 결과 수", ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """학생 통합 검색 (반각/전각, 가타카나/히라가나 구분 없이 부분 일치, 관련도 순 정렬)"""
+    if not normalize_search_text(q):
+        raise HTTPException(status_code=400, detail="検索キーワードを入力してください")
+
+    rows = build_search_query(db, q, limit=limit, student_type=student_type, status=status).all()
+    return {
+        "items": [serialize_search_result(student, score) for student, score in rows],
+        "query": q,
+        "count": len(rows),
+    }
+
 @router.get("/expiring-soon")
 def get_students_expiring_soon(
     months_ahead: int = Query(4, description="만료 몇 개월 전부터 조회할지 (기본값: 4개월)"),
@@ -0,0 +1,201 @@
+"""
+마스터 데이터 델타 동기화 (/sync)
+
+SPA는 학생/방/건물/회사/고령자 목록을 로컬 상태로 유지하기 위해 전체 목록을 반복해서 내려받았다.
+/sync는 이전 응답의 token 이후 변경(updated_at)되거나 삭제(sync_tombstones)된 행만 반환한다.
+
+- token은 응답 시점의 DB 시각을 담은 불투명한 문자열이다. since 없이 호출하면 전체 행을 반환한다 (reset=true).
+- updated_at은 쓰기 트랜잭션 시작 시각이므로, 조회 시점에 아직 커밋되지 않은 쓰기를 놓치지 않도록
+  since보다 SYNC_OVERLAP_SECONDS 앞부터 다시 조회한다. 같은 행이 여러 번 올 수 있으므로 클라이언트는 id로 덮어쓴다.
+- 클라이언트는 deleted의 id를 먼저 지우고 changes를 반영한다.
+- 삭제 기록 보존 기간(SYNC_TOMBSTONE_RETENTION_DAYS)보다 오래된 token은 전체 동기화로 응답한다 (reset=true, 로컬 상태 교체).
+  보존 기간이 지난 삭제 기록은 워커마다 SYNC_TOMBSTONE_PURGE_INTERVAL_SECONDS에 한 번 /sync 요청에서 삭제한다.
+- 건물은 /buildings 목록과 같은 권한 필터가 변경과 삭제 모두에 적용된다. 건물이 삭제되면 권한 행도 함께 삭제되므로
+  일반 사용자에게는 자신의 권한 행 삭제 기록(권한 회수 포함)을 건물 삭제로 전달한다.
+  권한 부여는 건물의 updated_at을 바꾸지 않으므로, 권한 행의 created_at이 since 이후인 건물도 변경으로 전달한다.
+"""
+import base64
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.orm import Session
+
+from database import get_db
+from models import Building, Company, Elderly, Room, Student, SyncTombstone, UserBuildingPermission
+from utils.dependencies import get_current_user
+from utils.responses import FastJSONResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/sync", tags=["델타 동기화"])
+
+SYNC_OVERLAP_SECONDS = int(os.getenv("SYNC_OVERLAP_SECONDS", "60"))
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", "90"))
+SYNC_TOMBSTONE_PURGE_INTERVAL_SECONDS = int(os.getenv("SYNC_TOMBSTONE_PURGE_INTERVAL_SECONDS", "3600"))
+
+# 권한 행 삭제 기록 (row_id=건물 ID, user_id=권한을 잃은 사용자)
+PERMISSION_TOMBSTONE_TABLE = "user_building_permissions"
+
+# 응답 키 → 모델 (응답 키는 테이블 이름과 같고 sync_tombstones.table_name에 기록되는 값)
+SYNC_MODELS = {
+    "students": Student,
+    "rooms": Room,
+    "buildings": Building,
+    "companies": Company,
+    "elderly": Elderly,
+}
+
+
+def encode_sync_token(watermark: datetime) -> str:
+    payload = json.dumps({"v": 1, "t": watermark.isoformat()}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_sync_token(token: str) -> datetime:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        watermark = datetime.fromisoformat(payload["t"])
+    except Exception:
+        raise HTTPException(status_code=400, detail="無効な同期トークンです")
+    if payload.get("v") != 1 or watermark.tzinfo is None:
+        raise HTTPException(status_code=400, detail="無効な同期トークンです")
+    return watermark
+
+
+def _select_tables(tables: Optional[str]) -> list:
+    if not tables:
+        return list(SYNC_MODELS)
+    requested = [name.strip() for name in tables.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in SYNC_MODELS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"同期できないテーブルです: {', '.join(unknown)}")
+    return [name for name in SYNC_MODELS if name in requested]
+
+
+_purge_lock = threading.Lock()
+_last_purge: Optional[float] = None
+
+
+def purge_sync_tombstones(db: Session) -> int:
+    """보존 기간보다 오래된 삭제 기록 삭제
+
+    보존 기간 안의 token도 겹침 구간만큼 앞부터 조회하므로 SYNC_OVERLAP_SECONDS만큼 더 남겨 둔다.
+    """
+    cutoff = func.now() - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS, seconds=SYNC_OVERLAP_SECONDS)
+    result = db.execute(delete(SyncTombstone).where(SyncTombstone.deleted_at < cutoff))
+    db.commit()
+    return result.rowcount
+
+
+def _purge_tombstones_periodically(db: Session):
+    """워커마다 SYNC_TOMBSTONE_PURGE_INTERVAL_SECONDS에 한 번 삭제 기록 정리 (실패해도 동기화는 계속)"""
+    global _last_purge
+    with _purge_lock:
+        now = time.monotonic()
+        if _last_purge is not None and now - _last_purge < SYNC_TOMBSTONE_PURGE_INTERVAL_SECONDS:
+            return
+        _last_purge = now
+
+    try:
+        purged = purge_sync_tombstones(db)
+        if purged:
+            logger.info(f"보존 기간이 지난 동기화 삭제 기록 {purged}건 삭제")
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"동기화 삭제 기록 정리 실패: {e}")
+
+
+def _allowed_building_ids(db: Session, current_user: dict) -> Optional[list]:
+    """접근 가능한 건물 ID 목록 (admin/mishima_user는 None = 전체)"""
+    if current_user.get("role") in ["admin", "mishima_user"]:
+        return None
+    return [
+        building_id for (building_id,) in db.query(UserBuildingPermission.building_id).filter(
+            UserBuildingPermission.user_id == current_user["id"]
+        ).all()
+    ]
+
+
+def _granted_building_ids(current_user: dict, changed_after: datetime):
+    """changed_after 이후 권한을 받은 건물 ID (서브쿼리)
+
+    권한 행의 created_at은 앱에서 기록한 UTC 시각(시간대 없음)이므로 같은 형식으로 비교한다.
+    앱과 DB의 시계 차이는 SYNC_OVERLAP_SECONDS 겹침 구간으로 흡수한다.
+    """
+    if changed_after.tzinfo is not None:
+        changed_after = changed_after.astimezone(timezone.utc).replace(tzinfo=None)
+    return select(UserBuildingPermission.building_id).where(
+        UserBuildingPermission.user_id == current_user["id"],
+        UserBuildingPermission.created_at >= changed_after,
+    )
+
+
+def _deleted_ids(db: Session, name: str, changed_after: datetime,
+                 allowed_building_ids: Optional[list], current_user: dict) -> list:
+    """changed_after 이후 삭제된 행 ID (건물은 권한 필터 적용)"""
+    condition = SyncTombstone.table_name == name
+    if name == "buildings" and allowed_building_ids is not None:
+        condition = or_(
+            and_(SyncTombstone.table_name == name, SyncTombstone.row_id.in_(allowed_building_ids)),
+            and_(SyncTombstone.table_name == PERMISSION_TOMBSTONE_TABLE, SyncTombstone.user_id == current_user["id"]),
+        )
+    return [
+        str(row_id) for row_id in db.scalars(
+            select(SyncTombstone.row_id).where(condition, SyncTombstone.deleted_at >= changed_after).distinct()
+        )
+    ]
+
+
+@router.get("")
+def sync_master_data(
+    since: Optional[str] = Query(None, description="이전 응답의 token (미지정 시 전체 동기화)"),
+    tables: Optional[str] = Query(None, description=f"동기화할 테이블 (쉼표 구분, 미지정 시 전체: {', '.join(SYNC_MODELS)})"),
+    db: Session = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    """since 이후 변경/삭제된 마스터 데이터 조회"""
+    selected = _select_tables(tables)
+    since_at = decode_sync_token(since) if since else None
+    _purge_tombstones_periodically(db)
+
+    # 토큰과 updated_at을 같은 DB 시계로 비교 (트랜잭션 시작 시각)
+    now = db.execute(select(func.now())).scalar()
+    reset = since_at is None or since_at < now - timedelta(days=SYNC_TOMBSTONE_RETENTION_DAYS)
+    changed_after = None if reset else since_at - timedelta(seconds=SYNC_OVERLAP_SECONDS)
+
+    allowed_building_ids = _allowed_building_ids(db, current_user) if "buildings" in selected else None
+
+    changes = {}
+    deleted = {}
+    for name in selected:
+        table = SYNC_MODELS[name].__table__
+        statement = select(table)
+        if changed_after is not None:
+            changed = table.c.updated_at >= changed_after
+            if name == "buildings" and allowed_building_ids is not None:
+                # 새로 권한을 받은 건물은 updated_at이 바뀌지 않아도 변경으로 전달
+                changed = or_(changed, table.c.id.in_(_granted_building_ids(current_user, changed_after)))
+            statement = statement.where(changed)
+        if name == "buildings" and allowed_building_ids is not None:
+            statement = statement.where(table.c.id.in_(allowed_building_ids))
+        changes[name] = [dict(row) for row in db.execute(statement.order_by(table.c.updated_at, table.c.id)).mappings()]
+
+        deleted[name] = [] if changed_after is None else _deleted_ids(
+            db, name, changed_after, allowed_building_ids, current_user
+        )
+
+    # 행 수가 많은 전체 동기화도 jsonable_encoder를 거치지 않고 orjson으로 바로 직렬화
+    return FastJSONResponse({
+        "token": encode_sync_token(now),
+        "reset": reset,
+        "changes": changes,
+        "deleted": deleted,
+    })
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 from typing import Optional
-from database import SessionLocal
+from database import get_db
 from models import Student
 from datetime import datetime
 import uuid
@@ -10,12 +10,6 @@ from supabase import create_client
 
 router = APIRouter(prefix="/upload", tags=["파일 업로드"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # Supabase 설정
 SUPABASE_URL = os.getenv("SUPABASE_URL")
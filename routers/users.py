@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, File
 from sqlalchemy.orm import Session, joinedload
 from typing import Optional, List
-from database import SessionLocal
+from database import get_db
 from models import User, DatabaseLog, Profiles
 from schemas import UserCreate
 from datetime import datetime
@@ -15,12 +15,6 @@ from database_log import create_database_log
 
 router = APIRouter(prefix="/users", tags=["사용자 관리"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
 # Supabase 설정
 SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -6,81 +6,48 @@ import base64
 import logging
 from datetime import datetime
 from utils.websocket_manager import manager
-from database import SessionLocal
+from database import AsyncSessionLocal
 from models import Conversation, ConversationMember, Message, Attachment, MessageRead
 from routers.chat import supabase
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter(tags=["WebSocket"])
 
 logger = logging.getLogger(__name__)
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
-async def get_unread_message_counts(user_id: str, db: Session) -> Dict[str, int]:
-    """사용자의 미확인 메시지 수를 조회합니다. (chat.py의 로직과 동일 - message_reads 테이블 활용)"""
+async def get_unread_message_counts(user_id: str, db: AsyncSession) -> Dict[str, int]:
+    """사용자의 미확인 메시지 수를 조회합니다. (chat.py의 로직과 동일 - message_reads 테이블 활용)
+
+    대화방별 메시지를 모두 읽어 와 Python에서 세지 않고,
+    참여 대화방별 (본인이 보내지 않았고 읽음 기록이 없는 메시지 수)를 한 번의 집계 쿼리로 계산합니다.
+    """
     try:
-        # 사용자가 참여한 대화방 목록 조회
-        user_conversations = db.query(ConversationMember).filter(
-            ConversationMember.user_id == user_id
-        ).all()
-        
-        unread_counts = {}
+        already_read = select(MessageRead.message_id).where(
+            MessageRead.message_id == Message.id,
+            MessageRead.user_id == user_id
+        ).exists()
         
-        # 각 대화방별로 미확인 메시지 수 계산
-        for member in user_conversations:
-            conversation_id = str(member.conversation_id)
-            
-            # 해당 대화방의 모든 메시지 조회
-            messages = db.query(Message).filter(
-                Message.conversation_id == conversation_id,
-                Message.deleted_at.is_(None)  # 삭제되지 않은 메시지만
-            ).all()
-            
-            if not messages:
-                unread_counts[conversation_id] = 0
-                continue
-            
-            # 해당 대화방의 모든 메시지 ID 수집
-            message_ids = [str(msg.id) for msg in messages]
-            
-            # 한 번에 모든 읽음 상태 조회 (배치 쿼리)
-            read_status_data = {}
-            if message_ids:
-                try:
-                    read_statuses = db.query(MessageRead).filter(
-                        MessageRead.message_id.in_(message_ids),
-                        MessageRead.user_id == user_id
-                    ).all()
-                    
-                    for read_status in read_statuses:
-                        read_status_data[str(read_status.message_id)] = True
-                        
-                except Exception as e:
-                    logger.warning(f"대화방 {conversation_id} 읽음 상태 배치 조회 실패: {e}")
-            
-            # 읽지 않은 메시지 수 계산 (chat.py와 동일한 로직)
-            unread_count = 0
-            for msg in messages:
-                msg_id_str = str(msg.id)
-                if (str(msg.sender_id) != user_id and 
-                    msg_id_str not in read_status_data):
-                    unread_count += 1
-            
-            unread_counts[conversation_id] = unread_count
+        result = await db.execute(
+            select(ConversationMember.conversation_id, func.count(Message.id))
+            .outerjoin(Message, and_(
+                Message.conversation_id == ConversationMember.conversation_id,
+                Message.deleted_at.is_(None),  # 삭제되지 않은 메시지만
+                Message.sender_id != user_id,
+                ~already_read
+            ))
+            .where(ConversationMember.user_id == user_id)
+            .group_by(ConversationMember.conversation_id)
+        )
         
-        return unread_counts
+        return {str(conversation_id): unread_count for conversation_id, unread_count in result.all()}
         
     except Exception as e:
         logger.error(f"미확인 메시지 수 조회 중 오류: {e}")
         return {}
 
-async def get_unread_notification_counts(user_id: str, db: Session) -> Dict[str, int]:
+async def get_unread_notification_counts(user_id: str, db: AsyncSession) -> Dict[str, int]:
     """사용자의 미확인 알림 수를 조회합니다."""
     try:
         # 여기서는 예시로 구현
@@ -98,17 +65,17 @@ async def get_unread_notification_counts(user_id: str, db: Session) -> Dict[str,
         logger.error(f"미확인 알림 수 조회 중 오류: {e}")
         return {}
 
-async def update_unread_counts_for_conversation(conversation_id: str, db: Session):
+async def update_unread_counts_for_conversation(conversation_id: str, db: AsyncSession):
     """특정 대화방의 모든 멤버들에게 미확인 메시지 수를 업데이트합니다."""
     try:
         # 대화방의 모든 멤버 조회
-        members = db.query(ConversationMember).filter(
-            ConversationMember.conversation_id == conversation_id
-        ).all()
+        member_user_ids = (await db.execute(
+            select(ConversationMember.user_id).where(
+                ConversationMember.conversation_id == conversation_id
+            )
+        )).scalars().all()
         
-        for member in members:
-            user_id = member.user_id
-            
+        for user_id in member_user_ids:
             # 해당 사용자의 미확인 메시지 수 조회
             unread_message_counts = await get_unread_message_counts(user_id, db)
             unread_notification_counts = await get_unread_notification_counts(user_id, db)
@@ -129,49 +96,53 @@ async def update_unread_counts_for_conversation(conversation_id: str, db: Sessio
     except Exception as e:
         logger.error(f"미확인 메시지 수 업데이트 중 오류: {e}")
 
-async def mark_messages_as_read(user_id: str, conversation_id: str, db: Session):
+async def mark_messages_as_read(user_id: str, conversation_id: str, db: AsyncSession):
     """사용자가 특정 대화방의 메시지를 읽음 처리합니다. (chat.py의 mark_conversation_as_read 로직과 동일)"""
     try:
         # 대화방 존재 여부 및 참여 권한 확인
-        conversation = db.query(Conversation).join(ConversationMember).filter(
-            Conversation.id == conversation_id,
-            ConversationMember.user_id == user_id
-        ).first()
+        conversation = (await db.execute(
+            select(Conversation.id).join(ConversationMember).where(
+                Conversation.id == conversation_id,
+                ConversationMember.user_id == user_id
+            )
+        )).first()
         
         if not conversation:
             logger.warning(f"대화방 {conversation_id}에 대한 접근 권한이 없습니다 (사용자: {user_id})")
             return
         
         # 읽지 않은 메시지들 조회
-        unread_messages = db.query(Message).filter(
-            Message.conversation_id == conversation_id,
-            Message.sender_id != user_id,
-            Message.deleted_at.is_(None)
-        ).all()
+        unread_message_ids = (await db.execute(
+            select(Message.id).where(
+                Message.conversation_id == conversation_id,
+                Message.sender_id != user_id,
+                Message.deleted_at.is_(None)
+            )
+        )).scalars().all()
         
-        if not unread_messages:
+        if not unread_message_ids:
             logger.info(f"대화방 {conversation_id}에 읽지 않은 메시지가 없습니다")
             return
         
-        # 배치로 읽음 처리
-        read_records = []
-        for msg in unread_messages:
-            # 이미 읽음 처리되었는지 확인
-            existing_read = db.query(MessageRead).filter(
-                MessageRead.message_id == msg.id,
+        # 이미 읽음 처리된 메시지는 한 번에 조회하여 제외
+        read_message_ids = set((await db.execute(
+            select(MessageRead.message_id).where(
+                MessageRead.message_id.in_(unread_message_ids),
                 MessageRead.user_id == user_id
-            ).first()
-            
-            if not existing_read:
-                read_records.append(MessageRead(
-                    message_id=msg.id,
-                    user_id=user_id,
-                    read_at=datetime.utcnow()
-                ))
+            )
+        )).scalars().all())
+        
+        # 배치로 읽음 처리
+        read_at = datetime.utcnow()
+        read_records = [
+            MessageRead(message_id=message_id, user_id=user_id, read_at=read_at)
+            for message_id in unread_message_ids
+            if message_id not in read_message_ids
+        ]
         
         if read_records:
             db.add_all(read_records)
-            db.commit()
+            await db.commit()
             
             logger.info(f"대화방 {conversation_id}에서 {len(read_records)}개 메시지를 읽음 처리했습니다")
             
@@ -258,14 +229,16 @@ async def websocket_endpoint(websocket: WebSocket):
         }))
         
         # 사용자가 참여 중인 대화방들에 참여 및 미확인 메시지 수 조회
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
-            user_conversations = db.query(ConversationMember).filter(
-                ConversationMember.user_id == user_id
-            ).all()
+            conversation_ids = (await db.execute(
+                select(ConversationMember.conversation_id).where(
+                    ConversationMember.user_id == user_id
+                )
+            )).scalars().all()
             
-            for conv_member in user_conversations:
-                manager.join_conversation(user_id, str(conv_member.conversation_id))
+            for conv_id in conversation_ids:
+                manager.join_conversation(user_id, str(conv_id))
             
             # 미확인 메시지 수 조회
             unread_message_counts = await get_unread_message_counts(user_id, db)
@@ -287,7 +260,7 @@ async def websocket_endpoint(websocket: WebSocket):
         except Exception as e:
             logger.error(f"사용자 대화방 정보 조회 실패: {e}")
         finally:
-            db.close()
+            await db.close()
         
         # 메시지 처리 루프
         try:
@@ -321,12 +294,14 @@ async def websocket_room_endpoint(websocket: WebSocket, conversation_id: str):
             return
         
         # 대화방 참여 권한 확인
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
-            conversation_member = db.query(ConversationMember).filter(
-                ConversationMember.conversation_id == conversation_id,
-                ConversationMember.user_id == user_id
-            ).first()
+            conversation_member = (await db.execute(
+                select(ConversationMember.user_id).where(
+                    ConversationMember.conversation_id == conversation_id,
+                    ConversationMember.user_id == user_id
+                )
+            )).first()
             
             if not conversation_member:
                 await websocket.close(code=4003, reason="대화방에 참여할 권한이 없습니다")
@@ -337,7 +312,7 @@ async def websocket_room_endpoint(websocket: WebSocket, conversation_id: str):
             await websocket.close(code=4004, reason="대화방 권한 확인에 실패했습니다")
             return
         finally:
-            db.close()
+            await db.close()
         
         # 채팅방에 연결
         await manager.connect_to_room(websocket, user_id, conversation_id)
@@ -352,6 +327,7 @@ async def websocket_room_endpoint(websocket: WebSocket, conversation_id: str):
         }))
         
         # 미확인 메시지 수 조회 및 전송
+        db = AsyncSessionLocal()
         try:
             unread_message_counts = await get_unread_message_counts(user_id, db)
             unread_notification_counts = await get_unread_notification_counts(user_id, db)
@@ -371,6 +347,8 @@ async def websocket_room_endpoint(websocket: WebSocket, conversation_id: str):
             }))
         except Exception as e:
             logger.error(f"미확인 메시지 수 조회 실패: {e}")
+        finally:
+            await db.close()
         
         # 메시지 처리 루프
         try:
@@ -471,7 +449,7 @@ async def handle_room_websocket_message(websocket: WebSocket, user_id: str, conv
         message_body = message_data.get("body")
         
         if message_body:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
             try:
                 # 메시지 생성
                 new_message = Message(
@@ -482,8 +460,8 @@ async def handle_room_websocket_message(websocket: WebSocket, user_id: str, conv
                 )
                 
                 db.add(new_message)
-                db.commit()
-                db.refresh(new_message)
+                await db.commit()
+                await db.refresh(new_message)
                 
                 # 첨부파일 처리 (있는 경우)
                 attachments = message_data.get("attachments", [])
@@ -498,7 +476,7 @@ async def handle_room_websocket_message(websocket: WebSocket, user_id: str, conv
                         )
                         db.add(attachment)
                     
-                    db.commit()
+                    await db.commit()
                 
                 # 발신자 프로필 정보 조회
                 sender_info = None
@@ -579,7 +557,7 @@ async def handle_room_websocket_message(websocket: WebSocket, user_id: str, conv
                     "timestamp": datetime.utcnow().isoformat()
                 }, user_id, conversation_id)
             finally:
-                db.close()
+                await db.close()
         else:
             await manager.send_room_personal_message({
                 "type": "error",
@@ -607,7 +585,7 @@ async def handle_room_websocket_message(websocket: WebSocket, user_id: str, conv
     
     elif message_type == "mark_as_read":
         # 메시지 읽음 처리
-        db = SessionLocal()
+        db = AsyncSessionLocal()
         try:
             await mark_messages_as_read(user_id, conversation_id, db)
             
@@ -627,7 +605,7 @@ async def handle_room_websocket_message(websocket: WebSocket, user_id: str, conv
                 "timestamp": datetime.utcnow().isoformat()
             }, user_id, conversation_id)
         finally:
-            db.close()
+            await db.close()
     
     else:
         # 지원하지 않는 메시지 타입
@@ -170,6 +170,71 @@ class StudentResponse(BaseModel):
             UUID: str  # UUID를 문자열로 변환
         }
 
+# 목록 응답 공통 필드
+# offset 방식(total/page...)과 커서 방식(next_cursor) 응답을 모두 표현하며,
+# 라우터는 response_model_exclude_unset=True로 실제로 설정한 키만 반환한다 (fields 파라미터 포함)
+class ListPageMeta(BaseModel):
+    total: Optional[int] = None
+    total_is_estimate: Optional[bool] = None
+    page: Optional[int] = None
+    page_size: Optional[int] = None
+    total_pages: Optional[int] = None
+    has_next: Optional[bool] = None
+    has_previous: Optional[bool] = None
+    next_cursor: Optional[str] = None
+
+class StudentListDepartment(BaseModel):
+    id: str
+    name: Optional[str] = None
+    department_name: Optional[str] = None
+    company_name: Optional[str] = None
+
+class StudentListGrade(BaseModel):
+    name: Optional[str] = None
+
+class StudentListRoom(BaseModel):
+    room_number: Optional[str] = None
+    building_name: Optional[str] = None
+
+class StudentListItem(BaseModel):
+    id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    created_at: Optional[datetime] = None
+    department_id: Optional[str] = None
+    consultant: Optional[int] = None
+    phone: Optional[str] = None
+    avatar: Optional[str] = None
+    grade_id: Optional[str] = None
+    cooperation_submitted_date: Optional[date] = None
+    cooperation_submitted_place: Optional[str] = None
+    assignment_date: Optional[date] = None
+    ward: Optional[str] = None
+    name_katakana: Optional[str] = None
+    gender: Optional[str] = None
+    birth_date: Optional[date] = None
+    nationality: Optional[str] = None
+    has_spouse: Optional[bool] = None
+    japanese_level: Optional[str] = None
+    passport_number: Optional[str] = None
+    residence_card_number: Optional[str] = None
+    residence_card_start: Optional[date] = None
+    residence_card_expiry: Optional[date] = None
+    resignation_date: Optional[date] = None
+    local_address: Optional[str] = None
+    address: Optional[str] = None
+    experience_over_2_years: Optional[bool] = None
+    status: Optional[str] = None
+    arrival_type: Optional[str] = None
+    student_type: Optional[str] = None
+    note: Optional[str] = None
+    department: Optional[StudentListDepartment] = None
+    grade: Optional[StudentListGrade] = None
+    current_room: Optional[StudentListRoom] = None
+
+class StudentListResponse(ListPageMeta):
+    items: List[StudentListItem]
+
 # 인보이스 관련 스키마
 class InvoiceCreate(BaseModel):
     student_id: str
@@ -741,6 +806,57 @@ class ElderlyResponse(BaseModel):
             UUID: str  # UUID를 문자열로 변환
         }
 
+class ElderlyListHospitalization(BaseModel):
+    id: str
+    elderly_id: str
+    hospital_name: Optional[str] = None
+    admission_date: Optional[date] = None
+    discharge_date: Optional[date] = None
+    last_meal_date: Optional[date] = None
+    last_meal_type: Optional[str] = None
+    meal_resume_date: Optional[date] = None
+    meal_resume_type: Optional[str] = None
+    note: Optional[str] = None
+
+class ElderlyListBuilding(BaseModel):
+    id: str
+    name: Optional[str] = None
+    address: Optional[str] = None
+    resident_type: Optional[str] = None
+
+class ElderlyListRoom(BaseModel):
+    id: str
+    room_number: Optional[str] = None
+    floor: Optional[int] = None
+    capacity: Optional[int] = None
+    rent: Optional[int] = None
+    maintenance: Optional[int] = None
+    service: Optional[int] = None
+    note: Optional[str] = None
+    building: Optional[ElderlyListBuilding] = None
+
+class ElderlyListItem(BaseModel):
+    id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    created_at: Optional[datetime] = None
+    phone: Optional[str] = None
+    avatar: Optional[str] = None
+    name_katakana: Optional[str] = None
+    gender: Optional[str] = None
+    birth_date: Optional[date] = None
+    status: Optional[str] = None
+    current_room_id: Optional[str] = None
+    care_level: Optional[str] = None
+    check_in_date: Optional[date] = None
+    contract_date: Optional[date] = None
+    hospitalization_status: Optional[str] = None
+    latest_hospitalization: Optional[ElderlyListHospitalization] = None
+    current_room: Optional[ElderlyListRoom] = None
+
+class ElderlyListResponse(ListPageMeta):
+    items: List[ElderlyListItem]
+
 class ElderlyContractCreate(BaseModel):
     elderly_id: str = Field(..., description="고령자 ID")
     room_id: Optional[str] = Field(None, description="방 ID")
@@ -1272,4 +1388,12 @@ class MessageListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
-    conversation_info: Optional[dict] = None  # id, title, is_group, other_user_id 포함
\ No newline at end of file
+    conversation_info: Optional[dict] = None  # id, title, is_group, other_user_id 포함
+# ===== 일괄 조회(/batch) 스키마 =====
+
+class BatchRequestItem(BaseModel):
+    id: Optional[str] = Field(None, description="응답과 짝을 맞추기 위한 클라이언트 지정 식별자")
+    path: str = Field(..., description="조회할 내부 GET 경로 (쿼리 문자열 포함, 예: /students/expiring-soon?days=30)")
+
+class BatchRequest(BaseModel):
+    requests: List[BatchRequestItem] = Field(..., min_length=1, description="순서대로 실행할 GET 요청 목록")
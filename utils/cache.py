@@ -0,0 +1,197 @@
+"""
+참조 데이터 읽기 캐시 (TTL + LRU + 태그 무효화)
+
+등급/회사/건물 옵션/케어 단가처럼 자주 바뀌지 않는 데이터를 요청마다 다시 조회하지 않도록 결과를 캐시한다.
+
+- 항목은 TTL이 지나거나, CACHE_MAX_ENTRIES를 넘어 LRU로 밀려나거나, 태그가 무효화되면 버려진다.
+- 태그는 테이블 이름을 사용한다. ORM으로 해당 테이블에 쓰기(flush/commit, Query.update/delete)가 일어나면
+  utils/count_cache의 세션 이벤트로 자동 무효화되므로 라우터의 쓰기 코드에서 따로 호출할 필요가 없다.
+  ORM을 거치지 않는 쓰기는 cache.invalidate("테이블 이름")을 직접 호출한다.
+- 기본 백엔드는 워커 프로세스 메모리(InMemoryCacheBackend)이며 다른 워커의 쓰기는 TTL이 지나야 반영된다.
+  여러 워커가 공유하는 백엔드(Redis 등)는 CacheBackend를 구현하여 교체한다.
+- 캐시된 값은 여러 요청이 공유하므로 ORM 객체가 아닌 dict/list 등 일반 값으로 만들고, 호출자는 수정하지 않는다.
+"""
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+from utils.count_cache import add_write_listener
+from utils.metrics import Counter
+
+CACHE_DEFAULT_TTL_SECONDS = float(os.getenv("CACHE_DEFAULT_TTL_SECONDS", "60"))
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+
+# 캐시에 값이 없음을 나타내는 표식 (None도 캐시할 수 있도록 구분)
+MISSING = object()
+
+cache_requests = Counter("cache_requests_total", "읽기 캐시 조회 수", ("scope", "result"))
+
+
+class CacheBackend:
+    """캐시 저장소 인터페이스
+
+    태그 버전은 invalidate(tag)마다 증가하는 정수다. 항목은 저장 시점의 태그 버전을 함께 기록하고,
+    조회 시 현재 버전과 다르면 무효로 본다. 공유 백엔드는 태그 버전을 INCR/MGET 같은 원자적 연산으로,
+    항목은 키별 TTL이 있는 값으로 구현하면 된다 (값은 JSON으로 직렬화 가능한 형태).
+    """
+
+    def tag_versions(self, tags: Sequence[str]) -> Tuple[int, ...]:
+        raise NotImplementedError
+
+    def get(self, key: str, versions: Tuple[int, ...]) -> Any:
+        """저장된 값 (없거나 만료되었거나 태그 버전이 다르면 MISSING)"""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float, versions: Tuple[int, ...]):
+        raise NotImplementedError
+
+    def invalidate(self, *tags: str):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """워커 프로세스 메모리 백엔드 (크기 제한 LRU)"""
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Tuple[int, ...], Any]]" = OrderedDict()
+        self._tag_versions = {}
+        self._lock = threading.Lock()
+
+    def tag_versions(self, tags: Sequence[str]) -> Tuple[int, ...]:
+        with self._lock:
+            return tuple(self._tag_versions.get(tag, 0) for tag in tags)
+
+    def get(self, key: str, versions: Tuple[int, ...]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, stored_versions, value = entry
+            if expires_at <= now or stored_versions != versions:
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: float, versions: Tuple[int, ...]):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, versions, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *tags: str):
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class TaggedCache:
+    """태그 무효화 읽기 캐시"""
+
+    def __init__(self, backend: CacheBackend, default_ttl: float = CACHE_DEFAULT_TTL_SECONDS):
+        self.backend = backend
+        self.default_ttl = default_ttl
+
+    @staticmethod
+    def make_key(scope: str, parts: Any) -> str:
+        return f"{scope}:{json.dumps(parts, default=str, ensure_ascii=False, sort_keys=True)}"
+
+    def get_or_set(self, scope: str, parts: Any, tags: Sequence[str], compute: Callable[[], Any],
+                   ttl: Optional[float] = None) -> Any:
+        """캐시된 값을 반환하고, 없으면 compute()로 계산하여 저장
+
+        Args:
+            scope: 캐시 구분 이름 (메트릭 라벨로도 사용, 예: "companies.list")
+            parts: 캐시 키 구성 요소 (JSON으로 직렬화 가능한 값)
+            tags: 값이 의존하는 테이블 이름
+        """
+        key = self.make_key(scope, parts)
+        versions = self.backend.tag_versions(tags)
+        value = self.backend.get(key, versions)
+        if value is not MISSING:
+            cache_requests.labels(scope, "hit").inc()
+            return value
+
+        cache_requests.labels(scope, "miss").inc()
+        value = compute()
+        # 계산 도중 쓰기가 있었으면 이전 데이터일 수 있으므로 저장하지 않음
+        if self.backend.tag_versions(tags) == versions:
+            self.backend.set(key, value, self.default_ttl if ttl is None else ttl, versions)
+        return value
+
+    def invalidate(self, *tags: str):
+        self.backend.invalidate(*tags)
+
+    def clear(self):
+        self.backend.clear()
+
+
+cache = TaggedCache(InMemoryCacheBackend())
+add_write_listener(cache.invalidate)
+
+# 기본 캐시 키에서 제외하는 엔드포인트 인자 (요청마다 다른 객체)
+_NON_KEY_ARGUMENTS = ("db", "current_user", "request")
+
+
+def endpoint_key_parts(kwargs: dict) -> dict:
+    """엔드포인트 인자 중 결과를 결정하는 값 (db/current_user/request 제외)"""
+    return {name: value for name, value in kwargs.items() if name not in _NON_KEY_ARGUMENTS}
+
+
+def cached(scope: str, tags: Sequence[str], ttl: Optional[float] = None,
+           key: Optional[Callable[..., Any]] = None):
+    """동기 엔드포인트 결과 캐시 데코레이터
+
+    의존성(인증 포함)은 FastAPI가 매 요청 실행하고, 엔드포인트 본문만 캐시된다.
+    HTTPException 등 예외는 캐시하지 않는다.
+
+    Args:
+        key: 엔드포인트 인자로 캐시 키 구성 요소를 만드는 함수.
+            미지정 시 db/current_user를 제외한 모든 인자를 사용하므로 사용자별로 결과가 다르면 반드시 지정한다.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("cached는 동기 엔드포인트에만 사용할 수 있습니다")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = key(**kwargs) if key is not None else endpoint_key_parts(kwargs)
+            return cache.get_or_set(scope, parts, tags, lambda: func(*args, **kwargs), ttl)
+
+        return wrapper
+
+    return decorator
+
+
+def building_category_rent(db, building_id, categories_id) -> Optional[dict]:
+    """빌딩/카테고리별 월세 ({"monthly_rent": ...}, BuildingCategoriesRent 행이 없으면 None)"""
+    from models import BuildingCategoriesRent
+
+    def load():
+        rent_info = db.query(BuildingCategoriesRent).filter(
+            BuildingCategoriesRent.building_id == building_id,
+            BuildingCategoriesRent.categories_id == categories_id
+        ).first()
+        return {"monthly_rent": rent_info.monthly_rent} if rent_info else None
+
+    return cache.get_or_set(
+        "building_categories_rent", [str(building_id), str(categories_id)], ("building_categories_rents",), load
+    )
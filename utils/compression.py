@@ -0,0 +1,146 @@
+"""
+응답 압축 (brotli / gzip)
+
+Accept-Encoding으로 협상하여 COMPRESSION_MIN_SIZE 이상인 텍스트 계열 응답(JSON, HTML 등)을 압축한다.
+월간 청구서 미리보기 HTML이나 식사 기록 캘린더처럼 큰 응답의 전송량을 줄이기 위한 것이다.
+
+- brotli 패키지가 설치되어 있으면 brotli를 우선 사용하고, 없으면 gzip만 사용한다.
+- PDF/엑셀 등 스트리밍 응답과 이미 압축된 형식은 그대로 전달한다.
+- 큰 본문은 이벤트 루프를 막지 않도록 스레드에서 압축한다.
+"""
+import gzip
+import os
+from typing import Dict, Optional
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 환경은 gzip만 사용
+    brotli = None
+
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+# 이 크기 이상의 본문은 스레드에서 압축
+COMPRESSION_THREAD_MIN_SIZE = int(os.getenv("COMPRESSION_THREAD_MIN_SIZE", "262144"))
+
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/xml", "image/svg+xml")
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더 → {인코딩: q값}"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """사용할 압축 방식 ("br", "gzip" 또는 None)"""
+    if not accept_encoding:
+        return None
+    accepted = _accepted_encodings(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = ["br", "gzip"] if brotli is not None else ["gzip"]
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    if not content_type:
+        return False
+    content_type = content_type.lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or "+json" in content_type or "+xml" in content_type
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """크기 기준 응답 압축 ASGI 미들웨어 (brotli 우선, gzip 대체)"""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        start_message = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if message["status"] == 304:
+                    # 304에도 원래 응답과 같은 Vary를 붙임
+                    headers = MutableHeaders(raw=list(message.get("headers", [])))
+                    headers.add_vary_header("Accept-Encoding")
+                    passthrough = True
+                    await send({**message, "headers": headers.raw})
+                    return
+                if (
+                    message["status"] == 204
+                    or "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type"))
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+            headers.add_vary_header("Accept-Encoding")
+            body = message.get("body", b"")
+
+            if message.get("more_body", False) or encoding is None or len(body) < self.minimum_size:
+                # 스트리밍 응답, 압축 미지원 클라이언트, 작은 응답은 그대로 전달
+                passthrough = True
+                await send({**start_message, "headers": headers.raw})
+                await send(message)
+                return
+
+            if len(body) >= COMPRESSION_THREAD_MIN_SIZE:
+                compressed = await anyio.to_thread.run_sync(compress, body, encoding)
+            else:
+                compressed = compress(body, encoding)
+
+            headers["content-encoding"] = encoding
+            headers["content-length"] = str(len(compressed))
+            await send({**start_message, "headers": headers.raw})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
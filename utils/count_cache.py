@@ -0,0 +1,186 @@
+"""
+목록 API 전체 건수(total) 계산 전략
+
+목록의 count 쿼리는 페이지 조회와 같은 조인/필터를 다시 실행하므로 페이지를 넘길 때마다 비용이 든다.
+
+- 정확한 건수는 (엔드포인트, 정규화된 필터) 단위로 COUNT_CACHE_TTL_SECONDS 동안 캐시하여
+  2페이지 이후에는 count를 다시 실행하지 않는다.
+- 캐시 항목은 의존 테이블의 "세대"를 함께 기록하며, ORM으로 해당 테이블에 쓰기(flush/commit,
+  Query.update/delete)가 일어나면 세대가 올라가 즉시 무효화된다.
+- 필터가 없는 목록은 estimate_total=true일 때 pg_class.reltuples 추정치를 사용할 수 있다.
+
+캐시는 워커 프로세스별 메모리에 있으므로 다른 워커의 쓰기는 TTL이 지나야 반영된다.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from fastapi import Query
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "30"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "2048"))
+
+ESTIMATE_TOTAL_QUERY = Query(
+    False,
+    description="필터가 없을 때 전체 건수를 통계 기반 추정치(pg_class)로 반환 (응답의 total_is_estimate=true)",
+)
+
+
+def normalize_filters(filters: dict) -> Tuple[Tuple[str, str], ...]:
+    """필터 딕셔너리를 캐시 키로 정규화 (값이 없는 필터 제거, 키 정렬, 문자열 공백 제거)"""
+    normalized = []
+    for key, value in filters.items():
+        if value is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        normalized.append((key, str(value)))
+    return tuple(sorted(normalized))
+
+
+class CountCache:
+    """필터 조합별 전체 건수 캐시 (TTL + 테이블 세대 기반 무효화)"""
+
+    def __init__(self, ttl: float = COUNT_CACHE_TTL_SECONDS, max_entries: int = COUNT_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Tuple[float, tuple, int]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _generation_of(self, tables: Sequence[str]) -> tuple:
+        return tuple(self._generations.get(table, 0) for table in tables)
+
+    def invalidate(self, *tables: str):
+        """테이블에 쓰기가 발생했음을 기록 (해당 테이블에 의존하는 캐시 항목 무효화)"""
+        with self._lock:
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+
+    def get_or_count(self, scope: str, filters: Tuple[Tuple[str, str], ...], tables: Sequence[str],
+                     count: Callable[[], int]) -> int:
+        key = (scope, filters)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, generation, total = entry
+                if expires_at > now and generation == self._generation_of(tables):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return total
+            generation = self._generation_of(tables)
+            self.misses += 1
+
+        total = count()
+
+        with self._lock:
+            # count 도중 쓰기가 있었으면 캐시하지 않음
+            if generation == self._generation_of(tables):
+                self._entries[key] = (now + self.ttl, generation, total)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return total
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache()
+
+# 테이블 쓰기 구독자 (utils/cache.py의 태그 캐시 등)
+_write_listeners: List[Callable[..., None]] = []
+
+
+def add_write_listener(callback: Callable[..., None]):
+    """ORM으로 테이블에 쓰기가 발생하면 callback(*테이블 이름)을 호출하도록 등록"""
+    _write_listeners.append(callback)
+
+
+def _tables_written(*tables: str):
+    count_cache.invalidate(*tables)
+    for callback in _write_listeners:
+        callback(*tables)
+
+
+def estimate_table_rows(db: Session, table: str) -> Optional[int]:
+    """pg_class 통계 기반 테이블 행 수 추정 (ANALYZE 전이거나 조회 실패 시 None)"""
+    try:
+        # 실패해도 요청 트랜잭션이 중단되지 않도록 세이브포인트 안에서 조회
+        with db.begin_nested():
+            estimate = db.execute(
+                text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+                {"table": table}
+            ).scalar()
+    except Exception:
+        return None
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+def count_total(query, scope: str, filters: dict, tables: Sequence[str], estimate: bool = False) -> Tuple[int, bool]:
+    """목록 전체 건수
+
+    Args:
+        query: 필터가 적용된 목록 쿼리 (정확한 건수가 필요할 때만 query.count() 실행)
+        scope: 캐시 구분용 이름 (예: "students.list")
+        filters: 건수에 영향을 주는 필터 값 (권한에 따른 조회 범위 포함)
+        tables: 건수가 의존하는 테이블 (첫 번째가 목록의 기준 테이블)
+        estimate: 필터가 없을 때 pg_class 추정치 사용
+
+    Returns:
+        (전체 건수, 추정치 여부)
+    """
+    normalized = normalize_filters(filters)
+    if estimate and not normalized:
+        estimated = estimate_table_rows(query.session, tables[0])
+        if estimated is not None:
+            return estimated, True
+    return count_cache.get_or_count(scope, normalized, tables, query.count), False
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed_tables(session, flush_context):
+    tables = set()
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            tables.add(table)
+    if tables:
+        _tables_written(*tables)
+        # 커밋 전 다른 요청이 이전 건수를 다시 캐시할 수 있으므로 커밋 시점에도 무효화
+        session.info.setdefault("count_cache_tables", set()).update(tables)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session):
+    tables = session.info.pop("count_cache_tables", None)
+    if tables:
+        _tables_written(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tables(session):
+    session.info.pop("count_cache_tables", None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_bulk_writes(orm_execute_state):
+    # Query.update()/delete() 등 flush를 거치지 않는 일괄 쓰기
+    if orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert:
+        table = getattr(orm_execute_state.statement, "table", None)
+        name = getattr(table, "name", None)
+        if name:
+            _tables_written(name)
+            orm_execute_state.session.info.setdefault("count_cache_tables", set()).add(name)
@@ -1,7 +1,7 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from database import SessionLocal, engine
+from database import get_db
 import os
 from supabase import create_client
 
@@ -15,15 +15,14 @@ supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY) if SUPABASE_URL and SU
 security = HTTPBearer()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
+def get_current_user(request: Request, credentials: HTTPAuthorizationCredentials = Depends(security)):
     """현재 인증된 사용자 정보 반환"""
+    # /batch 하위 요청은 배치 요청에서 검증한 사용자 정보를 그대로 사용 (토큰 재검증 생략)
+    batch_user = getattr(request.state, "batch_current_user", None)
+    if batch_user is not None:
+        return batch_user
+
     try:
         if not supabase:
             # Supabase 설정이 없는 경우 테스트용 더미 사용자 반환
@@ -0,0 +1,108 @@
+"""
+조건부 GET (약한 ETag + If-None-Match → 304)
+
+GET 응답 본문(압축 전)의 해시로 약한 ETag를 붙이고, 클라이언트가 같은 값을 If-None-Match로 보내면
+본문 없이 304 Not Modified를 반환한다. 핸들러는 그대로 실행되지만 바뀌지 않은 목록/상세를
+다시 내려받지 않아도 되므로 모바일 클라이언트의 전송량이 줄어든다.
+
+- 같은 내용이면 압축 방식(br/gzip/없음)과 관계없이 같은 ETag이므로 약한 ETag(W/"...")를 사용한다.
+- 인증된 응답이므로 Cache-Control이 없으면 "private, no-cache"(저장하되 매번 재검증)를 붙인다.
+- 200이 아닌 응답, 스트리밍 응답(PDF/엑셀), 이미 ETag가 있거나 no-store인 응답은 대상이 아니다.
+"""
+import hashlib
+import os
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from utils.metrics import Counter
+
+ETAG_ENABLED = os.getenv("ETAG_ENABLED", "true").lower() == "true"
+
+http_not_modified = Counter(
+    "http_not_modified_total", "If-None-Match 일치로 304를 반환한 요청 수 (라우트 템플릿별)", ("route",)
+)
+
+
+def make_etag(body: bytes) -> str:
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 약한 비교 (W/ 접두어 무시, "*"는 모두 일치)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    expected = _opaque(etag)
+    return any(_opaque(candidate) == expected for candidate in if_none_match.split(","))
+
+
+class ETagMiddleware:
+    """GET 응답에 약한 ETag를 붙이고 If-None-Match가 일치하면 304를 반환하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope.get("method") != "GET" or not ETAG_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start_message = None
+        passthrough = False
+
+        async def send_with_etag(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                if (
+                    message["status"] != 200
+                    or "etag" in headers
+                    or "no-store" in headers.get("cache-control", "")
+                ):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if message.get("more_body", False):
+                # 스트리밍 응답은 본문 전체를 알 수 없으므로 그대로 전달
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            etag = make_etag(message.get("body", b""))
+            headers = MutableHeaders(raw=list(start_message.get("headers", [])))
+            headers["etag"] = etag
+            if "cache-control" not in headers:
+                headers["cache-control"] = "private, no-cache"
+
+            if etag_matches(if_none_match, etag):
+                del headers["content-length"]
+                del headers["content-type"]
+                http_not_modified.labels(getattr(scope.get("route"), "path", None) or "<unmatched>").inc()
+                await send({**start_message, "status": 304, "headers": headers.raw})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send({**start_message, "headers": headers.raw})
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
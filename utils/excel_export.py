@@ -0,0 +1,81 @@
+import os
+import tempfile
+from itertools import groupby
+from typing import Iterable, Sequence, Tuple
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment
+from openpyxl.utils import get_column_letter
+
+# 결과 파일이 이 크기를 넘으면 메모리 대신 디스크 임시 파일에 기록
+EXCEL_SPOOL_MAX_SIZE = int(os.getenv("EXCEL_SPOOL_MAX_SIZE", str(8 * 1024 * 1024)))
+
+MAX_COLUMN_WIDTH = 50
+
+CENTER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
+
+def column_width(max_length: int) -> int:
+    """문자 수 기준 열 너비 계산 (기존 자동 조정 규칙과 동일: 최대 50)"""
+    return min(max_length + 2, MAX_COLUMN_WIDTH)
+
+
+def write_grouped_sheet(
+    sheet_title: str,
+    header: Sequence[str],
+    rows: Iterable[Tuple],
+    widths: Sequence[int],
+    footer_rows: Sequence[Sequence] = ()
+):
+    """그룹별로 첫 열을 병합하는 시트를 write-only 모드로 스트리밍 작성
+
+    rows는 (그룹 키, 첫 열 값, 나머지 열 값...) 튜플을 그룹 키 순으로 정렬해 넘겨야 한다.
+    각 그룹의 첫 열은 그룹 첫 행에만 쓰고 그룹 행 전체를 세로로 병합한다.
+    열 너비는 행을 쓰기 전에 확정되어야 하므로 호출 측에서 미리 계산해 전달한다.
+
+    Returns:
+        처음 위치로 되감긴 SpooledTemporaryFile
+    """
+    workbook = Workbook(write_only=True)
+    ws = workbook.create_sheet(title=sheet_title)
+
+    for index, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(index)].width = width
+
+    def centered(value):
+        cell = WriteOnlyCell(ws, value=value)
+        cell.alignment = CENTER_ALIGNMENT
+        return cell
+
+    ws.append(list(header))
+
+    row_number = 1
+    for _, group_rows in groupby(rows, key=lambda row: row[0]):
+        start_row = row_number + 1
+        for index, row in enumerate(group_rows):
+            first_value = row[1] if index == 0 else ""
+            ws.append([centered(first_value)] + [centered(value) for value in row[2:]])
+            row_number += 1
+        if row_number > start_row:
+            ws.merged_cells.add(f"A{start_row}:A{row_number}")
+
+    for footer in footer_rows:
+        ws.append([centered(value) for value in footer])
+
+    output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE)
+    workbook.save(output)
+    output.seek(0)
+    return output
+
+
+
+def write_invoice_detail_sheet(detail: dict):
+    """청구 상세(学生名/項目名/金額) 시트 작성 (fetch_invoice_detail_rows 결과 사용)"""
+    return write_grouped_sheet(
+        "請求詳細",
+        ["学生名", "項目名", "金額"],
+        detail["rows"],
+        detail["widths"],
+        footer_rows=[[], ["合計", "", detail["total_amount"]]]
+    )
@@ -0,0 +1,103 @@
+"""
+목록 API 응답 필드 선택 (sparse fieldset)
+
+드롭다운/선택 UI처럼 id, name만 필요한 호출도 목록 API는 행마다 모든 필드(여권/재류카드 정보 포함)를
+조회하고 직렬화한다. fields=id,name 처럼 필요한 필드를 지정하면
+
+- SQL은 해당 필드에 필요한 컬럼만 조회하고 (load_only)
+- 필요 없는 관계의 joinedload는 생략하며
+- 응답에는 지정한 키만 포함한다.
+
+fields를 지정하지 않으면 기존과 같은 전체 응답을 반환한다. id는 항상 포함된다.
+"""
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy.orm import joinedload, load_only
+
+
+class ResponseField:
+    """응답 필드 정의
+
+    Args:
+        serialize: (엔티티, context) → 응답 값
+        columns: 이 필드에 필요한 컬럼
+        relations: 이 필드에 필요한 관계 경로 목록 (예: ((Student.department, Department.company),))
+    """
+
+    __slots__ = ("serialize", "columns", "relations")
+
+    def __init__(self, serialize: Callable[[Any, Optional[dict]], Any],
+                 columns: Sequence = (), relations: Sequence[Sequence] = ()):
+        self.serialize = serialize
+        self.columns = tuple(columns)
+        self.relations = tuple(tuple(path) for path in relations)
+
+
+def column_field(column, convert: Optional[Callable[[Any], Any]] = None) -> ResponseField:
+    """컬럼 값을 그대로(또는 convert로 변환하여) 반환하는 필드"""
+    key = column.key
+    if convert is None:
+        return ResponseField(lambda obj, context: getattr(obj, key), columns=(column,))
+    return ResponseField(lambda obj, context: convert(getattr(obj, key)), columns=(column,))
+
+
+def optional_str(value) -> Optional[str]:
+    return str(value) if value else None
+
+
+def fields_query(available: Dict[str, ResponseField]):
+    """fields 쿼리 파라미터 (지정 가능한 필드 목록을 설명에 포함)"""
+    return Query(
+        None,
+        description=f"응답에 포함할 필드 (쉼표 구분, 미지정 시 전체). 지정 가능: {', '.join(available)}",
+    )
+
+
+def select_fields(fields: Optional[str], available: Dict[str, ResponseField]) -> Dict[str, ResponseField]:
+    """fields 파라미터 해석 (알 수 없는 필드가 있으면 400)
+
+    Returns:
+        선택된 필드 정의 (available의 순서 유지, id 항상 포함)
+    """
+    names = {name.strip() for name in (fields or "").split(",") if name.strip()}
+    if not names:
+        return available
+
+    unknown = sorted(names - available.keys())
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"指定できないフィールドです: {', '.join(unknown)}"
+        )
+    names.add("id")
+    return {name: field for name, field in available.items() if name in names}
+
+
+def loader_options(selected: Dict[str, ResponseField], available: Dict[str, ResponseField]) -> list:
+    """선택된 필드에 필요한 관계만 joinedload하고, 일부 필드만 선택된 경우 필요한 컬럼만 조회하는 옵션"""
+    options = []
+    seen_paths = set()
+    for field in selected.values():
+        for path in field.relations:
+            path_key = tuple(attribute.key for attribute in path)
+            if path_key in seen_paths:
+                continue
+            seen_paths.add(path_key)
+            option = joinedload(path[0])
+            for attribute in path[1:]:
+                option = option.joinedload(attribute)
+            options.append(option)
+
+    if len(selected) < len(available):
+        columns = {}
+        for field in selected.values():
+            for column in field.columns:
+                columns[column.key] = column
+        if columns:
+            options.append(load_only(*columns.values()))
+    return options
+
+
+def serialize_fields(obj, selected: Dict[str, ResponseField], context: Optional[dict] = None) -> dict:
+    return {name: field.serialize(obj, context) for name, field in selected.items()}
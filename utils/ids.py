@@ -0,0 +1,20 @@
+import uuid
+from typing import Optional, Union
+
+from fastapi import HTTPException
+
+
+def parse_uuid(value: Union[str, uuid.UUID, None], label: str = "ID") -> Optional[uuid.UUID]:
+    """경로/쿼리 파라미터의 ID 문자열을 UUID로 변환
+
+    UUID 컬럼에 uuid.UUID 값을 바인딩해야 Postgres가 캐스팅 없이 인덱스를 사용한다.
+    잘못된 형식이면 DB 오류(500) 대신 400을 반환한다.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, uuid.UUID):
+        return value
+    try:
+        return uuid.UUID(str(value))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"無効な{label}です: {value}")
@@ -0,0 +1,169 @@
+"""
+이벤트 루프 지연 측정 및 정지(stall) 지점 샘플링
+
+일정 간격으로 asyncio.sleep()을 걸고 예정 시각보다 얼마나 늦게 깨어났는지를 기록한다.
+async 핸들러 안에서 동기 DB/Supabase/webpush 호출이 루프를 막으면 이 값이 커진다.
+
+루프가 막혀 있는 동안에는 루프 안의 코드가 실행되지 않으므로 별도의 감시 스레드가 하트비트를 확인하고,
+LOOP_STALL_THRESHOLD_SECONDS 이상 갱신되지 않으면 sys._current_frames()로 루프 스레드의 스택을 샘플링하여
+막고 있는 핸들러와 호출 지점(프로젝트 코드 중 가장 안쪽 프레임)을 로그와 메트릭으로 남긴다.
+메트릭의 call_site 라벨은 "파일:함수"로만 구분하고(코드가 바뀌어도 시계열 수가 늘지 않도록),
+줄 번호는 /debug/loop-stalls 기록과 로그에만 남긴다.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Dict, List, Optional
+
+from utils.metrics import Counter, event_loop_lag, event_loop_lag_last
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOOP_LAG_INTERVAL_SECONDS = float(os.getenv("LOOP_LAG_INTERVAL_SECONDS", "0.5"))
+LOOP_STALL_THRESHOLD_SECONDS = float(os.getenv("LOOP_STALL_THRESHOLD_SECONDS", "0.2"))
+# 최근 정지 기록 보관 수
+LOOP_STALL_HISTORY_SIZE = int(os.getenv("LOOP_STALL_HISTORY_SIZE", "100"))
+
+event_loop_stalls = Counter(
+    "event_loop_stalls_total", "이벤트 루프 정지 횟수 (막고 있던 핸들러/호출 지점 파일:함수별)", ("handler", "call_site")
+)
+
+
+def _is_project_file(filename: str) -> bool:
+    return (
+        filename.startswith(BASE_DIR)
+        and "site-packages" not in filename
+        and not filename.endswith(os.path.join("utils", "loop_monitor.py"))
+    )
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연 측정 백그라운드 작업 + 정지 지점 감시 스레드"""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL_SECONDS,
+                 stall_threshold: float = LOOP_STALL_THRESHOLD_SECONDS):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.stalls = deque(maxlen=LOOP_STALL_HISTORY_SIZE)
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._last_beat = time.perf_counter()
+        # 라우트 핸들러 코드 객체 → "METHOD 경로"
+        self._handlers: Dict[object, str] = {}
+
+    def bind_routes(self, app):
+        """핸들러 함수와 라우트 경로를 매핑 (스택에서 핸들러를 찾을 때 사용)"""
+        for route in app.routes:
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(endpoint, "__code__", None)
+            if code is None:
+                continue
+            methods = ",".join(sorted(getattr(route, "methods", None) or [])) or "WS"
+            self._handlers[code] = f"{methods} {route.path}"
+
+    async def _run(self):
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self._last_beat = now
+            lag = max(now - expected, 0.0)
+            event_loop_lag.observe(lag)
+            event_loop_lag_last.set(lag)
+
+    def _watch(self):
+        reported_beat = None
+        check_interval = max(self.stall_threshold / 2, 0.01)
+        while not self._stop_event.wait(check_interval):
+            beat = self._last_beat
+            stalled = time.perf_counter() - beat - self.interval
+            # 하트비트 하나당 한 번만 샘플링 (같은 정지를 반복 보고하지 않음)
+            if stalled >= self.stall_threshold and beat != reported_beat:
+                reported_beat = beat
+                self._sample(stalled)
+
+    def _sample(self, stalled: float):
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)
+
+        handler = None
+        frames = frame
+        codes = []
+        while frames is not None:
+            codes.append(frames.f_code)
+            frames = frames.f_back
+        for code in reversed(codes):
+            if code in self._handlers:
+                handler = f"{self._handlers[code]} ({code.co_name})"
+                break
+
+        project_frames = [entry for entry in stack if _is_project_file(entry.filename)]
+        if project_frames:
+            innermost = project_frames[-1]
+            filename = os.path.relpath(innermost.filename, BASE_DIR)
+        else:
+            innermost = stack[-1]
+            filename = innermost.filename
+        call_site = f"{filename}:{innermost.lineno} {innermost.name}"
+        if handler is None and project_frames:
+            outermost = project_frames[0]
+            handler = f"{os.path.relpath(outermost.filename, BASE_DIR)}:{outermost.name}"
+
+        handler = handler or "<unknown>"
+        # 메트릭 라벨에는 줄 번호를 넣지 않음 (줄 번호는 아래 기록/로그에만)
+        event_loop_stalls.labels(handler, f"{filename}:{innermost.name}").inc()
+
+        record = {
+            "timestamp": time.time(),
+            "stalled_ms": round(stalled * 1000, 1),
+            "handler": handler,
+            "call_site": call_site,
+            "stack": [f"{entry.filename}:{entry.lineno} {entry.name}" for entry in stack[-15:]],
+        }
+        self.stalls.append(record)
+        logger.warning(
+            f"이벤트 루프 정지 {record['stalled_ms']}ms 이상: 핸들러 {handler}, 호출 지점 {call_site}\n"
+            + "".join(traceback.format_list(stack[-8:]))
+        )
+
+    def recent_stalls(self, limit: int = 50) -> List[dict]:
+        """최근 정지 기록 (최신순)"""
+        return list(reversed(list(self.stalls)))[:limit]
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._loop_thread_id = threading.get_ident()
+            self._last_beat = time.perf_counter()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            self._stop_event.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="loop-stall-watchdog", daemon=True)
+            self._watchdog.start()
+            logger.info(f"이벤트 루프 지연 측정 시작 (간격 {self.interval}s, 정지 기준 {self.stall_threshold}s)")
+
+    async def stop(self):
+        self._stop_event.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            # 감시 스레드는 check_interval마다 정지 신호를 확인하므로 곧 종료됨 (루프를 막지 않도록 스레드에서 대기)
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+
+loop_monitor = LoopLagMonitor()
@@ -0,0 +1,278 @@
+"""
+Prometheus 형식 운영 메트릭 (/metrics)
+
+요청 처리 경로에서 호출되는 갱신(inc/observe)은 락 없이 단순 숫자 연산만 수행한다.
+라벨 조합별 자식 메트릭 생성은 dict.setdefault(GIL 하에서 원자적)로 처리하고,
+히스토그램은 버킷별 개수만 기록한 뒤 스크레이프 시점에 누적값으로 변환한다.
+스레드 간 경합으로 드물게 증가분이 누락될 수 있으나 모니터링 용도로는 허용 범위로 본다.
+
+DB 풀, WebSocket 연결 수처럼 이미 다른 곳에서 관리하는 값은 스크레이프 시점에 콜백으로 읽는다.
+"""
+import bisect
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 응답 시간 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# PDF 렌더링 시간 버킷 (초)
+PDF_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0, 60.0, 120.0)
+# 이벤트 루프 지연 버킷 (초)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_registry: List["_Metric"] = []
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        _registry.append(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values):
+        """라벨 값 조합별 자식 메트릭 (없으면 생성)"""
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def samples(self) -> List[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for suffix, labels, value in self.samples():
+            lines.append(f"{self.name}{suffix}{labels} {_format_value(value)}")
+        return lines
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        if not self.labelnames:
+            self.labels()
+
+    def _new_child(self):
+        return _Value()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def samples(self):
+        return [("", _format_labels(self.labelnames, key), child.value) for key, child in list(self._children.items())]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+
+class CallbackGauge(_Metric):
+    """스크레이프 시점에 콜백으로 값을 읽는 게이지 (콜백은 {라벨 값 튜플: 값} 반환)"""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...],
+                 callback: Callable[[], Dict[Tuple[str, ...], float]], kind: str = "gauge"):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+        self.kind = kind
+
+    def samples(self):
+        try:
+            values = self.callback()
+        except Exception:
+            return []
+        return [("", _format_labels(self.labelnames, key), value) for key, value in values.items()]
+
+
+class _HistogramValue:
+    __slots__ = ("buckets", "counts", "sum")
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        # 버킷별 개수 (마지막 칸은 +Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        if not self.labelnames:
+            self.labels()
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def samples(self):
+        rows = []
+        for key, child in list(self._children.items()):
+            counts = list(child.counts)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                rows.append(("_bucket", _format_labels(self.labelnames + ("le",), key + (_format_value(float(bound)),)), cumulative))
+            rows.append(("_sum", _format_labels(self.labelnames, key), child.sum))
+            rows.append(("_count", _format_labels(self.labelnames, key), cumulative))
+        return rows
+
+
+def render_metrics() -> str:
+    """등록된 모든 메트릭을 Prometheus 텍스트 형식으로 출력"""
+    lines = []
+    for metric in _registry:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# --- 공용 메트릭 ---
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (라우트 템플릿별)", ("method", "route", "status")
+)
+http_requests_in_flight = Gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+push_outbox_depth = Gauge("push_outbox_depth", "전송 대기/진행 중인 푸시 알림 작업 수")
+pdf_render_duration = Histogram(
+    "pdf_render_duration_seconds", "PDF 렌더링 시간", ("kind",), buckets=PDF_BUCKETS
+)
+event_loop_lag = Histogram(
+    "event_loop_lag_seconds", "이벤트 루프 지연 (예정 시각 대비 늦게 깨어난 시간)", buckets=LOOP_LAG_BUCKETS
+)
+event_loop_lag_last = Gauge("event_loop_lag_last_seconds", "마지막으로 측정한 이벤트 루프 지연")
+
+
+class MetricsMiddleware:
+    """요청 수/처리 시간/동시 처리 수를 기록하는 ASGI 미들웨어
+
+    경로 대신 라우트 템플릿(/students/{student_id})을 라벨로 사용하여 라벨 수가 늘어나지 않도록 하고,
+    매칭되지 않은 요청은 하나의 라벨로 묶는다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+        in_flight = http_requests_in_flight.labels()
+        in_flight.inc()
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_flight.dec()
+            route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+            http_request_duration.labels(scope.get("method", ""), route, status_code).observe(
+                time.perf_counter() - started
+            )
+
+
+def register_runtime_collectors(pool_stats, async_pool=None, ws_manager=None):
+    """DB 풀/WebSocket 상태를 스크레이프 시점에 읽는 게이지 등록"""
+
+    def pool_gauge(field: str, async_getter: Optional[Callable] = None):
+        def collect():
+            values = {("sync",): pool_stats.snapshot()[field]}
+            if async_pool is not None and async_getter is not None:
+                values[("async",)] = async_getter(async_pool)
+            return values
+        return collect
+
+    CallbackGauge("db_pool_size", "커넥션 풀 크기", ("pool",), pool_gauge("pool_size", lambda p: p.size()))
+    CallbackGauge("db_pool_in_use", "사용 중인 커넥션 수", ("pool",), pool_gauge("in_use", lambda p: p.checkedout()))
+    CallbackGauge("db_pool_idle", "유휴 커넥션 수", ("pool",), pool_gauge("idle", lambda p: p.checkedin()))
+    CallbackGauge("db_pool_overflow", "오버플로 커넥션 수", ("pool",), pool_gauge("overflow", lambda p: max(p.overflow(), 0)))
+    CallbackGauge("db_pool_checkouts_total", "커넥션 체크아웃 횟수", ("pool",), pool_gauge("checkouts"), kind="counter")
+    CallbackGauge("db_pool_timeouts_total", "커넥션 대기 타임아웃 횟수", ("pool",), pool_gauge("timeouts"), kind="counter")
+    CallbackGauge("db_pool_connect_errors_total", "새 커넥션 생성 실패 횟수", ("pool",), pool_gauge("connect_errors"), kind="counter")
+    CallbackGauge("db_pool_invalidations_total", "커넥션 무효화 횟수", ("pool",), pool_gauge("invalidations"), kind="counter")
+    CallbackGauge(
+        "db_pool_wait_seconds_max", "커넥션 체크아웃 최대 대기 시간", ("pool",),
+        lambda: {("sync",): pool_stats.snapshot()["wait_max_ms"] / 1000}
+    )
+
+    if ws_manager is not None:
+        CallbackGauge(
+            "websocket_online_users", "WebSocket으로 접속 중인 사용자 수", (),
+            lambda: {(): ws_manager.get_online_users_count()}
+        )
+        CallbackGauge(
+            "websocket_room_connections", "대화방 WebSocket 연결 수", (),
+            lambda: {(): sum(len(users) for users in list(ws_manager.room_connections.values()))}
+        )
+        CallbackGauge(
+            "websocket_active_conversations", "활성 대화방 수", (),
+            lambda: {(): ws_manager.get_active_conversations_count()}
+        )
@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session, contains_eager
+
+from models import BillingMonthlyItem, Student
+from utils.excel_export import column_width
+from utils.ids import parse_uuid
+
+
+def monthly_items_query(
+    db: Session,
+    year: int,
+    month: int,
+    company_id: Optional[str] = None,
+    department_id: Optional[str] = None,
+    student_type: Optional[str] = None
+) -> Query:
+    """회사/부서/월 조건으로 월별 청구 항목과 학생을 조인한 기본 쿼리
+
+    (student_id, year, month) 복합 인덱스를 사용하도록 조건을 구성한다.
+    집계나 컬럼 단위 조회가 필요한 경우 with_entities()로 재사용한다.
+    """
+    query = db.query(BillingMonthlyItem).join(
+        Student, BillingMonthlyItem.student_id == Student.id
+    ).filter(
+        BillingMonthlyItem.year == year,
+        BillingMonthlyItem.month == month
+    )
+
+    if company_id:
+        query = query.filter(Student.company_id == parse_uuid(company_id, "会社ID"))
+    if department_id:
+        query = query.filter(Student.department_id == parse_uuid(department_id, "部署ID"))
+    if student_type:
+        query = query.filter(Student.student_type == student_type)
+
+    return query
+
+
+def fetch_monthly_items(
+    db: Session,
+    year: int,
+    month: int,
+    company_id: Optional[str] = None,
+    department_id: Optional[str] = None,
+    student_type: Optional[str] = None
+) -> List[BillingMonthlyItem]:
+    """월별 청구 항목을 한 번의 쿼리로 조회 (학생명, 정렬순서 순)
+
+    학생 정보는 같은 쿼리에서 조인해 item.student로 함께 로드되므로
+    학생별로 다시 쿼리하거나 학생 목록을 선형 탐색할 필요가 없다.
+    """
+    return monthly_items_query(
+        db, year, month,
+        company_id=company_id,
+        department_id=department_id,
+        student_type=student_type
+    ).options(
+        contains_eager(BillingMonthlyItem.student)
+    ).order_by(
+        Student.name, Student.id, BillingMonthlyItem.sort_order
+    ).all()
+
+
+def group_items_by_student(items: List[BillingMonthlyItem]) -> Dict:
+    """월별 청구 항목을 student_id 기준으로 그룹화 (조회 순서 유지)"""
+    groups = {}
+    for item in items:
+        groups.setdefault(item.student_id, []).append(item)
+    return groups
+
+
+def fetch_invoice_detail_rows(
+    db: Session,
+    year: int,
+    month: int,
+    company_id: str,
+    student_type: Optional[str] = None,
+    stream: bool = False
+) -> Optional[dict]:
+    """청구 상세 엑셀용 데이터 조회 (항목이 없으면 None)
+
+    총액, 항목 수, 열 너비 계산용 최대 길이를 집계 쿼리로 먼저 조회한 뒤
+    (write-only 시트는 행을 쓰기 전에 열 너비가 확정되어야 함)
+    0원이 아닌 항목을 학생별로 정렬해 (student_id, 학생명, 항목명, 금액) 행으로 반환한다.
+    stream=True이면 행을 리스트로 만들지 않고 yield_per로 순회하는 쿼리를 반환한다.
+    """
+    items_query = monthly_items_query(db, year, month, company_id=company_id, student_type=student_type)
+
+    item_count, total_amount, max_name_length, max_item_name_length = items_query.with_entities(
+        func.count(BillingMonthlyItem.id),
+        func.coalesce(func.sum(BillingMonthlyItem.amount), 0),
+        func.max(func.length(Student.name)),
+        func.max(func.length(BillingMonthlyItem.item_name))
+    ).one()
+    if not item_count:
+        return None
+
+    total_amount = float(total_amount)
+    rows = items_query.with_entities(
+        Student.id,
+        Student.name,
+        BillingMonthlyItem.item_name,
+        BillingMonthlyItem.amount
+    ).filter(
+        BillingMonthlyItem.amount > 0
+    ).order_by(
+        Student.name, Student.id, BillingMonthlyItem.sort_order
+    )
+
+    return {
+        "rows": rows.yield_per(1000) if stream else [tuple(row) for row in rows.all()],
+        "widths": [
+            column_width(max(len("学生名"), len("合計"), max_name_length or 0)),
+            column_width(max(len("項目名"), max_item_name_length or 0)),
+            column_width(max(len("金額"), len(str(total_amount))))
+        ],
+        "total_amount": total_amount,
+    }
@@ -0,0 +1,162 @@
+"""
+커서(키셋) 페이지네이션 공용 헬퍼
+
+offset 방식은 뒤쪽 페이지로 갈수록 앞의 행을 모두 읽고 버리며 매번 전체 count를 다시 실행한다.
+커서 방식은 마지막 행의 (정렬 키, id)를 불투명한 next_cursor로 내려주고, 다음 요청에서
+"그 행 다음"부터 page_size + 1건만 조회하므로 위치와 관계없이 페이지 크기만큼의 비용만 든다.
+
+목록 API는 cursor 파라미터가 주어졌을 때만(첫 페이지는 빈 값 cursor=) 커서 방식으로 동작하고,
+기존 page/page_size 방식 응답은 그대로 유지한다.
+"""
+import base64
+import json
+import uuid
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import and_, or_
+
+CURSOR_QUERY = Query(
+    None,
+    description="커서 페이지네이션 (첫 페이지는 빈 값, 이후 응답의 next_cursor 전달). 지정 시 page는 무시",
+)
+
+
+def _to_json(value: Any):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (uuid.UUID, Decimal)):
+        return str(value)
+    return value
+
+
+def _from_json(value: Any, column):
+    """커서에 저장된 값을 컬럼 타입의 파이썬 값으로 복원"""
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return value
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if python_type is uuid.UUID:
+        return uuid.UUID(value)
+    if python_type is Decimal:
+        return Decimal(value)
+    return value
+
+
+def encode_cursor(sort_name: str, sort_value: Any, row_id: Any) -> str:
+    payload = json.dumps([sort_name, _to_json(sort_value), _to_json(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_name: str) -> Tuple[Any, Any]:
+    """커서 해석 (다른 정렬 조건으로 만든 커서면 400)
+
+    Returns:
+        (정렬 키 값, id)
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        name, sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except Exception:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="無効なカーソルです")
+    if name != sort_name:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="カーソルと並び替え条件が一致しません。最初のページから取得してください"
+        )
+    return sort_value, row_id
+
+
+def _after(sort_column, id_column, sort_value, row_id, descending: bool):
+    """(정렬 키, id) 순서에서 커서 행 다음에 오는 행 조건
+
+    ASC는 NULLS LAST, DESC는 NULLS FIRST (PostgreSQL 기본값) 순서를 전제로 한다.
+    """
+    if sort_column is None:
+        return id_column < row_id if descending else id_column > row_id
+
+    if descending:
+        if sort_value is None:
+            return or_(and_(sort_column.is_(None), id_column < row_id), sort_column.isnot(None))
+        return or_(sort_column < sort_value, and_(sort_column == sort_value, id_column < row_id))
+
+    if sort_value is None:
+        return and_(sort_column.is_(None), id_column > row_id)
+    return or_(
+        sort_column > sort_value,
+        and_(sort_column == sort_value, id_column > row_id),
+        sort_column.is_(None),
+    )
+
+
+def paginate_by_cursor(
+    query,
+    id_column,
+    cursor: str,
+    page_size: int,
+    sort_column=None,
+    descending: bool = False,
+    sort_name: Optional[str] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """정렬 키 + id 기준 키셋 페이지네이션
+
+    query에 지정된 기존 order_by는 (sort_column, id_column) 정렬로 대체된다.
+    sort_column이 다른 테이블 컬럼이면 query에 해당 조인이 포함되어 있어야 한다.
+
+    Args:
+        cursor: 이전 응답의 next_cursor (빈 문자열이면 첫 페이지)
+        sort_name: 커서에 기록할 정렬 식별자 (정렬 조건이 바뀐 커서 재사용 방지)
+
+    Returns:
+        (엔티티 목록, 다음 페이지 커서 또는 None)
+    """
+    if sort_name is None:
+        key = sort_column.key if sort_column is not None else id_column.key
+        sort_name = f"{key}:{'desc' if descending else 'asc'}"
+
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, sort_name)
+        if sort_column is not None:
+            sort_value = _from_json(sort_value, sort_column)
+        row_id = _from_json(row_id, id_column)
+        query = query.filter(_after(sort_column, id_column, sort_value, row_id, descending))
+
+    ordering = []
+    if sort_column is not None:
+        # NULL 위치를 명시하여 _after()의 조건과 항상 일치시킴 (PostgreSQL 기본값과 동일)
+        ordering.append(sort_column.desc().nulls_first() if descending else sort_column.asc().nulls_last())
+    ordering.append(id_column.desc() if descending else id_column.asc())
+    query = query.order_by(None).order_by(*ordering)
+
+    if sort_column is not None:
+        rows = query.add_columns(sort_column.label("_cursor_sort_key")).limit(page_size + 1).all()
+        items = [row[0] for row in rows]
+        sort_values = [row[1] for row in rows]
+    else:
+        items = query.limit(page_size + 1).all()
+        sort_values = [None] * len(items)
+
+    next_cursor = None
+    if len(items) > page_size:
+        items = items[:page_size]
+        last = items[-1]
+        next_cursor = encode_cursor(sort_name, sort_values[page_size - 1], getattr(last, id_column.key))
+    return items, next_cursor
+
+
+def cursor_page_response(items: list, page_size: int, next_cursor: Optional[str]) -> dict:
+    """커서 방식 목록 응답 (전체 건수는 계산하지 않음)"""
+    return {
+        "items": items,
+        "page_size": page_size,
+        "next_cursor": next_cursor,
+        "has_next": next_cursor is not None,
+    }
@@ -0,0 +1,400 @@
+import os
+import base64
+import logging
+import tempfile
+import threading
+import time
+from typing import Iterator, List, Optional
+
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache
+from fastapi.templating import Jinja2Templates
+from pypdf import PdfWriter
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+
+from utils.metrics import pdf_render_duration
+
+logger = logging.getLogger(__name__)
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEMPLATE_DIR = os.path.join(BASE_DIR, "templates")
+FONT_PATH = os.path.join(BASE_DIR, "static", "fonts", "NotoSansJP-Regular.ttf")
+
+# Jinja 바이트코드 캐시 디렉토리 (워커 재시작 시에도 컴파일 결과 재사용)
+JINJA_BYTECODE_CACHE_DIR = os.getenv(
+    "JINJA_BYTECODE_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "sousei-jinja-cache")
+)
+
+# 분할 렌더링 청크 크기 (학생 수 기준) 및 스트리밍 설정
+PDF_CHUNK_SIZE = int(os.getenv("PDF_CHUNK_SIZE", "200"))
+PDF_SPOOL_MAX_SIZE = int(os.getenv("PDF_SPOOL_MAX_SIZE", str(8 * 1024 * 1024)))
+PDF_STREAM_BLOCK_SIZE = 64 * 1024
+
+# 템플릿 → 템플릿 전용 CSS 파일 (TEMPLATE_DIR 기준). 렌더링마다 <style>을 다시 파싱하지 않도록
+# 렌더링 컨텍스트에서 미리 파싱해 두고 stylesheets로 전달한다.
+TEMPLATE_STYLESHEETS = {
+    "company_invoice.html": "company_invoice.css",
+}
+
+FONT_FAMILY = '"Noto Sans JP", "Hiragino Sans", "ヒラギノ角ゴシック", "Yu Gothic Medium", "Yu Gothic", "メイリオ", "Meiryo", "MS PGothic", "MS Pゴシック", "Takao Gothic", "IPAexGothic", "IPAPGothic", "VL PGothic", "Noto Sans CJK JP", sans-serif'
+
+
+def _create_jinja_env() -> Environment:
+    """바이트코드 캐시가 적용된 Jinja 환경 생성 (워커당 1회)"""
+    bytecode_cache = None
+    try:
+        os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(JINJA_BYTECODE_CACHE_DIR)
+    except OSError as e:
+        logger.warning(f"Jinja 바이트코드 캐시 디렉토리 생성 실패, 캐시 없이 진행: {e}")
+
+    return Environment(
+        loader=FileSystemLoader(TEMPLATE_DIR),
+        autoescape=True,
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        cache_size=-1,
+    )
+
+
+# 전역 Jinja 환경 및 템플릿 인스턴스 (라우터마다 따로 만들지 않고 공유)
+jinja_env = _create_jinja_env()
+templates = Jinja2Templates(env=jinja_env)
+
+
+def render_template(template_name: str, **context) -> str:
+    """컴파일된 템플릿을 재사용하여 HTML 렌더링"""
+    return jinja_env.get_template(template_name).render(**context)
+
+
+def _load_font_css() -> str:
+    """Noto Sans JP 폰트를 base64로 임베드한 기본 CSS 문자열 생성"""
+    font_base64 = ""
+    try:
+        if os.path.exists(FONT_PATH):
+            with open(FONT_PATH, "rb") as font_file:
+                font_data = font_file.read()
+                font_base64 = base64.b64encode(font_data).decode('utf-8')
+                logger.info(f"Noto Sans JP 폰트 로드 성공: {len(font_data)} bytes")
+        else:
+            logger.warning(f"폰트 파일을 찾을 수 없음: {FONT_PATH}")
+    except Exception as e:
+        logger.warning(f"폰트 로드 실패: {str(e)}")
+
+    return f"""
+    @font-face {{
+        font-family: "Noto Sans JP";
+        src: url("data:font/ttf;base64,{font_base64}") format("truetype");
+        font-weight: normal;
+        font-style: normal;
+    }}
+
+    @page {{
+        size: A4;
+        margin: 20mm;
+    }}
+
+    body {{
+        font-family: {FONT_FAMILY};
+        font-size: 8pt;
+        line-height: 1.4;
+        -webkit-font-smoothing: antialiased;
+        -moz-osx-font-smoothing: grayscale;
+    }}
+
+    * {{
+        font-family: {FONT_FAMILY} !important;
+    }}
+    """
+
+
+class PdfRenderContext:
+    """FontConfiguration과 파싱된 CSS를 보관하는 렌더링 컨텍스트
+
+    WeasyPrint/Pango 객체는 스레드 간 공유가 안전하지 않으므로
+    스레드마다 한 번만 생성하여 이후 요청에서 재사용한다.
+    템플릿 전용 CSS(TEMPLATE_STYLESHEETS)는 처음 사용할 때 파싱하여 보관한다.
+    """
+
+    def __init__(self):
+        self.font_config = FontConfiguration()
+        self.font_stylesheet = CSS(string=_load_font_css(), font_config=self.font_config)
+        self.template_stylesheets = {}
+
+    def template_stylesheet(self, template_name: str) -> Optional[CSS]:
+        css_name = TEMPLATE_STYLESHEETS.get(template_name)
+        if css_name is None:
+            return None
+        stylesheet = self.template_stylesheets.get(css_name)
+        if stylesheet is None:
+            stylesheet = CSS(filename=os.path.join(TEMPLATE_DIR, css_name), font_config=self.font_config)
+            self.template_stylesheets[css_name] = stylesheet
+        return stylesheet
+
+    def stylesheets(self, embed_font: bool, template_name: Optional[str] = None) -> List[CSS]:
+        """렌더링에 전달할 스타일시트 (템플릿 CSS → 폰트 CSS 순, 기존 <style> 뒤에 폰트 CSS가 오던 순서 유지)"""
+        stylesheets = []
+        template_stylesheet = self.template_stylesheet(template_name) if template_name else None
+        if template_stylesheet is not None:
+            stylesheets.append(template_stylesheet)
+        if embed_font:
+            stylesheets.append(self.font_stylesheet)
+        return stylesheets
+
+
+def inline_template_stylesheet(html_content: str, template_name: str) -> str:
+    """템플릿 전용 CSS를 <style>로 HTML에 포함 (PDF 생성 실패 시 HTML 파일로 대체할 때 사용)
+
+    PDF 렌더링에서는 TEMPLATE_STYLESHEETS의 CSS를 stylesheets로 따로 전달하므로
+    렌더링된 HTML만으로는 스타일이 적용되지 않는다.
+    """
+    css_name = TEMPLATE_STYLESHEETS.get(template_name)
+    if css_name is None:
+        return html_content
+    with open(os.path.join(TEMPLATE_DIR, css_name), encoding="utf-8") as css_file:
+        style = f"<style>\n{css_file.read()}\n</style>\n"
+    # stylesheets는 문서의 <style> 뒤에 적용되므로 </head> 바로 앞에 두어 같은 순서 유지
+    head_end = html_content.find("</head>")
+    if head_end == -1:
+        return style + html_content
+    return html_content[:head_end] + style + html_content[head_end:]
+
+
+_local = threading.local()
+
+
+def get_render_context() -> PdfRenderContext:
+    """현재 스레드의 렌더링 컨텍스트 반환 (없으면 생성)"""
+    context = getattr(_local, "context", None)
+    if context is None:
+        context = PdfRenderContext()
+        _local.context = context
+    return context
+
+
+def html_to_pdf_bytes(html_content: str, embed_font: bool = True, template_name: Optional[str] = None) -> bytes:
+    """HTML 내용을 PDF로 변환 (폰트/CSS 컨텍스트 재사용)
+
+    Args:
+        html_content: 렌더링된 HTML 문자열
+        embed_font: Noto Sans JP 임베드 CSS 적용 여부
+        template_name: HTML을 렌더링한 템플릿 (TEMPLATE_STYLESHEETS에 있으면 미리 파싱한 CSS 적용)
+    """
+    context = get_render_context()
+    started = time.perf_counter()
+    pdf_bytes = HTML(string=html_content).write_pdf(
+        stylesheets=context.stylesheets(embed_font, template_name),
+        font_config=context.font_config
+    )
+    elapsed = time.perf_counter() - started
+    pdf_render_duration.labels("single").observe(elapsed)
+    logger.info(f"PDF 변환 완료: {len(pdf_bytes)} bytes, {elapsed * 1000:.1f}ms")
+    return pdf_bytes
+
+
+def render_chunked_pdf(
+    template_name: str,
+    data: dict,
+    list_key: str,
+    chunk_size: Optional[int] = None,
+    embed_font: bool = True
+):
+    """리스트 데이터를 고정 크기 청크로 나누어 렌더링한 뒤 하나의 PDF로 병합
+
+    전체 학생을 담은 거대한 HTML 하나를 파싱하지 않고 청크 단위로 렌더링한다.
+    각 청크는 레이아웃 직후 자신의 PDF(임시 파일)로 기록하고 Document를 해제한 뒤 다음 청크를 렌더링하므로,
+    DOM/스타일/페이지 박스에 필요한 메모리는 청크 크기로 제한된다. 청크 PDF는 pypdf로 차례대로 병합하며,
+    병합 중에는 압축된 PDF 객체만 유지된다 (폰트 서브셋은 청크마다 포함되어 파일 크기가 조금 커진다).
+    결과는 일정 크기를 넘으면 디스크로 내려가는 임시 파일에 저장된다.
+
+    첫 청크는 1페이지 청구서와 리스트 제목을 포함하고, 이후 청크는 data.list_only=True로
+    리스트 행만 렌더링한다. 합계 행은 마지막 청크에만 표시된다 (data.hide_total_row).
+
+    Returns:
+        처음 위치로 되감긴 SpooledTemporaryFile (iter_spooled_file로 스트리밍)
+    """
+    chunk_size = chunk_size or PDF_CHUNK_SIZE
+    items = data.get(list_key) or []
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)] or [[]]
+
+    context = get_render_context()
+    stylesheets = context.stylesheets(embed_font, template_name)
+    started = time.perf_counter()
+
+    writer = PdfWriter()
+    chunk_files = []
+    page_count = 0
+    try:
+        for index, chunk in enumerate(chunks):
+            chunk_data = dict(data)
+            chunk_data[list_key] = chunk
+            chunk_data["list_only"] = index > 0
+            chunk_data["hide_total_row"] = index < len(chunks) - 1
+
+            html_content = render_template(template_name, data=chunk_data)
+            document = HTML(string=html_content).render(
+                stylesheets=stylesheets,
+                font_config=context.font_config
+            )
+            chunk_file = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+            chunk_files.append(chunk_file)
+            document.write_pdf(target=chunk_file)
+            page_count += len(document.pages)
+            # 다음 청크를 렌더링하기 전에 레이아웃 결과(페이지 박스) 해제
+            del document, html_content
+
+            chunk_file.seek(0)
+            writer.append(chunk_file)
+
+        output = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_MAX_SIZE)
+        writer.write(output)
+    finally:
+        writer.close()
+        for chunk_file in chunk_files:
+            chunk_file.close()
+    size = output.tell()
+    output.seek(0)
+
+    elapsed = time.perf_counter() - started
+    pdf_render_duration.labels("chunked").observe(elapsed)
+    logger.info(
+        f"분할 PDF 렌더링 완료: {len(items)}건, 청크 {len(chunks)}개, 페이지 {page_count}개, "
+        f"{size} bytes, {elapsed * 1000:.1f}ms"
+    )
+    return output
+
+
+def iter_spooled_file(file_obj, block_size: int = PDF_STREAM_BLOCK_SIZE) -> Iterator[bytes]:
+    """임시 파일에 기록된 결과(PDF/엑셀)를 고정 크기 블록으로 읽어 스트리밍 (완료 후 파일 닫기)"""
+    try:
+        while True:
+            block = file_obj.read(block_size)
+            if not block:
+                break
+            yield block
+    finally:
+        file_obj.close()
+
+
+class SharedSpooledFile:
+    """여러 응답이 함께 스트리밍하는 임시 파일 (동일 요청 병합으로 PDF를 공유할 때 사용)
+
+    리더마다 자신의 읽기 위치를 가지고 잠금 안에서 seek/read하므로 서로의 위치에 영향을 주지 않는다.
+    결과를 받은 호출 수(single_flight.do()가 expect_readers로 알려줌, 기본 1)만큼 리더가 읽기를 시작하고
+    모두 끝나면(중간에 연결이 끊긴 경우 포함) 마지막 리더가 파일을 닫는다.
+    """
+
+    def __init__(self, file_obj):
+        self._file = file_obj
+        self._lock = threading.Lock()
+        # 결과를 받았지만 아직 읽기를 시작하지 않은 호출 수 / 읽는 중인 리더 수
+        self._pending = 1
+        self._readers = 0
+
+    def expect_readers(self, count: int):
+        """결과를 받을 호출 수 설정 (새 호출이 더 합류할 수 없게 된 뒤, 읽기 시작 전에 호출)"""
+        with self._lock:
+            self._pending = count
+
+    def iter_blocks(self, block_size: int = PDF_STREAM_BLOCK_SIZE) -> Iterator[bytes]:
+        with self._lock:
+            if self._file.closed:
+                raise RuntimeError("이미 닫힌 공유 파일입니다")
+            self._pending = max(self._pending - 1, 0)
+            self._readers += 1
+        try:
+            offset = 0
+            while True:
+                with self._lock:
+                    self._file.seek(offset)
+                    block = self._file.read(block_size)
+                if not block:
+                    break
+                offset += len(block)
+                yield block
+        finally:
+            with self._lock:
+                self._readers -= 1
+                if self._readers == 0 and self._pending == 0:
+                    self._file.close()
+
+
+def benchmark_render(page_counts: Optional[List[int]] = None, template_name: str = "company_invoice.html") -> List[dict]:
+    """청구서 페이지 수별 렌더링 시간 측정
+
+    사용법: python -m utils.pdf_renderer
+    """
+    page_counts = page_counts or [1, 50, 500]
+    # 상세 리스트 1페이지(가로 A4)에 들어가는 대략적인 학생 행 수
+    rows_per_page = 25
+    results = []
+
+    # 첫 측정에 폰트/CSS 초기화 비용이 섞이지 않도록 미리 워밍업
+    html_to_pdf_bytes(render_template(template_name, data=_sample_invoice_data(1)), template_name=template_name)
+
+    for pages in page_counts:
+        data = _sample_invoice_data(max(pages - 1, 0) * rows_per_page)
+        started = time.perf_counter()
+        html_content = render_template(template_name, data=data)
+        pdf_bytes = html_to_pdf_bytes(html_content, template_name=template_name)
+        elapsed = time.perf_counter() - started
+        results.append({
+            "pages": pages,
+            "total_ms": round(elapsed * 1000, 1),
+            "per_page_ms": round(elapsed * 1000 / pages, 2),
+            "pdf_bytes": len(pdf_bytes),
+        })
+    return results
+
+
+def _sample_invoice_data(student_count: int) -> dict:
+    """벤치마크용 company_invoice.html 더미 데이터"""
+    students = [
+        {
+            "student_name": f"学生 {i}",
+            "building_name": "サンプル物件",
+            "room_number": f"{100 + i % 50}",
+            "company_name": "株式会社サンプル",
+            "rent_amount": 30000,
+            "management_fee": 5000,
+            "wifi_amount": 2000,
+            "total_amount": 37000,
+            "category": "技能",
+            "generation": "3期生",
+            "billingMonth": 1,
+            "billingYear": 2025,
+        }
+        for i in range(student_count)
+    ]
+    return {
+        "recipient_name": "株式会社サンプル 御中",
+        "recipient_address": "大阪市",
+        "sender_name": "株式会社 ミシマ",
+        "sender_address": "〒546-0003 大阪市東住吉区今川4-5-9-201",
+        "sender_tel": "06-6760-7400",
+        "sender_fax": "06-6760-7401",
+        "registration_number": "T4120001018934",
+        "invoice_date": "2025年1月10日",
+        "year": 2025,
+        "month": 1,
+        "categories": [],
+        "subtotal": 37000 * student_count,
+        "tax_amount": 0,
+        "total_amount": 37000 * student_count,
+        "bank_name": "関西みらい銀行",
+        "branch_name": "八尾本町",
+        "account_type": "普通",
+        "account_number": "0043448",
+        "account_holder": "株式会社ミシマ",
+        "payment_deadline": "2025年2月31日",
+        "students": students,
+        "total_rent": 30000 * student_count,
+        "total_management": 5000 * student_count,
+        "total_wifi": 2000 * student_count,
+    }
+
+
+if __name__ == "__main__":
+    for row in benchmark_render():
+        print(f"{row['pages']:>4} pages: total {row['total_ms']}ms, {row['per_page_ms']}ms/page, {row['pdf_bytes']} bytes")
@@ -0,0 +1,297 @@
+"""
+핫 쿼리 실행 계획 점검
+
+주요 조회 쿼리에 EXPLAIN을 실행하여 기대하는 인덱스를 사용하는지 확인한다.
+시드 데이터가 적은 로컬 DB에서는 플래너가 순차 스캔을 고르므로 기본으로 enable_seqscan=off를 적용해
+"인덱스를 사용할 수 있는 쿼리인지"(타입 불일치 캐스팅 등으로 인덱스가 막히지 않았는지)를 확인한다.
+
+--analyze를 지정하면 플래너 설정을 그대로 두고 EXPLAIN ANALYZE로 실제 실행 시간을 측정한다.
+(인덱스 추가 전후 비교: alembic downgrade/upgrade 후 각각 실행, 채팅 시드 데이터는 utils.seed_chat 참고)
+
+샘플 데이터가 없어 실행하지 못한 점검도 실패로 본다. 빈 DB에서는 --seed로 시드 데이터(utils.seed_plans,
+utils.seed_chat)를 만든 뒤 점검하고 끝나면 삭제한다.
+
+사용법:
+    python -m utils.query_plans --seed     # 시드 → 점검 → 삭제, 인덱스 미사용/점검 누락 시 종료 코드 1
+    python -m utils.query_plans            # 기존 데이터로 점검
+    python -m utils.query_plans --verbose  # 실행 계획 전체 출력
+    python -m utils.query_plans --analyze  # 실제 실행 시간 측정
+    python -m utils.query_plans --allow-empty  # 샘플 데이터가 없는 점검은 건너뜀 (실패로 보지 않음)
+"""
+import argparse
+import json
+import sys
+from datetime import date
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+
+def explain(db: Session, query, analyze: bool = False, allow_seqscan: bool = False) -> dict:
+    """Query/select 객체의 실행 계획(JSON) 조회
+
+    Returns:
+        EXPLAIN 결과 (최상위 "Plan" 노드, analyze=True이면 "Execution Time" 포함)
+    """
+    statement = query.statement if isinstance(query, Query) else query
+    compiled = statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+
+    try:
+        if not allow_seqscan:
+            db.execute(text("SET LOCAL enable_seqscan = off"))
+        result = db.execute(text(f"EXPLAIN ({options}) {compiled}")).scalar()
+    finally:
+        # SET LOCAL 설정과 ANALYZE로 실행된 쿼리의 영향을 되돌림
+        db.rollback()
+
+    plan = result if isinstance(result, list) else json.loads(result)
+    return plan[0]
+
+
+def used_indexes(plan: dict) -> List[str]:
+    """실행 계획 트리에서 사용된 인덱스 이름 목록"""
+    names = []
+    if plan.get("Index Name"):
+        names.append(plan["Index Name"])
+    for child in plan.get("Plans", []):
+        names.extend(used_indexes(child))
+    return names
+
+
+def seq_scanned_tables(plan: dict) -> List[str]:
+    """실행 계획 트리에서 순차 스캔된 테이블 목록"""
+    tables = []
+    if plan.get("Node Type") == "Seq Scan":
+        tables.append(plan.get("Relation Name"))
+    for child in plan.get("Plans", []):
+        tables.extend(seq_scanned_tables(child))
+    return tables
+
+
+# 점검 항목: 이름 → (쿼리 생성 함수, 기대 인덱스 목록)
+CHECKS: Dict[str, Tuple[Callable[[Session], Optional[Query]], Tuple[str, ...]]] = {}
+
+
+def plan_check(name: str, expected_index: Union[str, Tuple[str, ...]]):
+    """점검 쿼리 등록 데코레이터 (함수는 db를 받아 Query를 반환, 샘플 데이터가 없으면 None)
+
+    expected_index에 튜플을 주면 그중 하나만 사용해도 통과로 본다.
+    """
+    expected = (expected_index,) if isinstance(expected_index, str) else tuple(expected_index)
+
+    def decorator(func: Callable[[Session], Optional[Query]]):
+        CHECKS[name] = (func, expected)
+        return func
+    return decorator
+
+
+@plan_check("거주자별 기간 겹침 조회", "idx_residents_resident_period")
+def _resident_period(db: Session):
+    from models import Resident
+    sample = db.query(Resident.resident_id).first()
+    if not sample:
+        return None
+    return db.query(Resident).filter(
+        Resident.resident_id == sample.resident_id,
+        Resident.check_in_date <= date(2025, 7, 31),
+        (Resident.check_out_date.is_(None) | (Resident.check_out_date >= date(2025, 7, 1)))
+    )
+
+
+@plan_check("방별 현재 거주자 수", "idx_residents_room_active_check_out")
+def _room_active_residents(db: Session):
+    from models import Resident
+    sample = db.query(Resident.room_id).first()
+    if not sample:
+        return None
+    return db.query(Resident).filter(
+        Resident.room_id == sample.room_id,
+        Resident.is_active == True,
+        Resident.check_out_date.is_(None)
+    )
+
+
+@plan_check("현재 거주 중인 방 조회", "idx_residents_current_by_resident")
+def _current_residence(db: Session):
+    from models import Resident
+    sample = db.query(Resident.resident_id).first()
+    if not sample:
+        return None
+    return db.query(Resident).filter(
+        Resident.resident_id == sample.resident_id,
+        Resident.resident_type == "elderly",
+        Resident.check_out_date.is_(None)
+    )
+
+
+@plan_check("방별 월 공과금 조회", "idx_room_utilities_room_charge_month")
+def _room_utilities(db: Session):
+    from models import RoomUtility
+    sample = db.query(RoomUtility.room_id, RoomUtility.charge_month).first()
+    if not sample:
+        return None
+    return db.query(RoomUtility).filter(
+        RoomUtility.room_id == sample.room_id,
+        RoomUtility.charge_month == sample.charge_month
+    )
+
+
+@plan_check("학생별 월별 청구 항목", "idx_billing_monthly_items_student_year_month")
+def _billing_monthly_items(db: Session):
+    from models import BillingMonthlyItem
+    sample = db.query(BillingMonthlyItem.student_id, BillingMonthlyItem.year, BillingMonthlyItem.month).first()
+    if not sample:
+        return None
+    return db.query(BillingMonthlyItem).filter(
+        BillingMonthlyItem.student_id == sample.student_id,
+        BillingMonthlyItem.year == sample.year,
+        BillingMonthlyItem.month == sample.month
+    )
+
+
+@plan_check("식사 결식 기록 기간 조회", "unique_skip_per_meal_per_day")
+def _meal_records(db: Session):
+    from models import ElderlyMealRecord
+    sample = db.query(ElderlyMealRecord.resident_id).first()
+    if not sample:
+        return None
+    return db.query(ElderlyMealRecord).filter(
+        ElderlyMealRecord.resident_id == sample.resident_id,
+        ElderlyMealRecord.skip_date >= date(2025, 7, 1),
+        ElderlyMealRecord.skip_date <= date(2025, 7, 31)
+    )
+
+
+@plan_check("회사별 학생 조회 (회사 조인)", "idx_students_company_id")
+def _company_students(db: Session):
+    from models import Company, Student
+    sample = db.query(Company.id, Company.name).first()
+    if not sample:
+        return None
+    return db.query(Student).join(Company, Student.company_id == Company.id).filter(
+        Company.name == sample.name
+    )
+
+
+@plan_check("학생별 인보이스 조회", "unique_invoice_per_month")
+def _student_invoices(db: Session):
+    from models import Invoice
+    sample = db.query(Invoice.student_id).first()
+    if not sample:
+        return None
+    return db.query(Invoice).filter(Invoice.student_id == sample.student_id)
+
+
+@plan_check("대화방 최신 메시지 페이지", "idx_messages_conversation_created_live")
+def _conversation_messages(db: Session):
+    from models import Message
+    sample = db.query(Message.conversation_id).first()
+    if not sample:
+        return None
+    return db.query(Message).filter(
+        Message.conversation_id == sample.conversation_id,
+        Message.deleted_at.is_(None)
+    ).order_by(Message.created_at.desc()).limit(50)
+
+
+@plan_check("사용자별 메시지 읽음 여부 배치 조회", ("idx_message_reads_user_message", "message_reads_pkey"))
+def _message_reads(db: Session):
+    from models import Message, MessageRead
+    sample = db.query(MessageRead.user_id).first()
+    message_ids = [row.id for row in db.query(Message.id).limit(50).all()]
+    if not sample or not message_ids:
+        return None
+    return db.query(MessageRead).filter(
+        MessageRead.user_id == sample.user_id,
+        MessageRead.message_id.in_(message_ids)
+    )
+
+
+@plan_check("사용자 참여 대화방 조회", "idx_conversation_members_user_id")
+def _user_conversations(db: Session):
+    from models import ConversationMember
+    sample = db.query(ConversationMember.user_id).first()
+    if not sample:
+        return None
+    return db.query(ConversationMember).filter(ConversationMember.user_id == sample.user_id)
+
+
+def run_checks(db: Session, verbose: bool = False, analyze: bool = False) -> List[dict]:
+    """등록된 모든 점검 실행 (analyze=True이면 실제 플래너 설정으로 실행 시간 측정)"""
+    results = []
+    for name, (build_query, expected) in CHECKS.items():
+        query = build_query(db)
+        if query is None:
+            results.append({"name": name, "status": "skipped", "expected": expected, "indexes": []})
+            continue
+
+        explained = explain(db, query, analyze=analyze, allow_seqscan=analyze)
+        plan = explained["Plan"]
+        indexes = used_indexes(plan)
+        results.append({
+            "name": name,
+            "status": "ok" if any(index in indexes for index in expected) else "missing",
+            "expected": expected,
+            "indexes": indexes,
+            "seq_scans": seq_scanned_tables(plan),
+            "execution_ms": explained.get("Execution Time"),
+            "plan": plan if verbose else None,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="핫 쿼리 인덱스 사용 여부 점검")
+    parser.add_argument("--verbose", action="store_true", help="실행 계획 전체 출력")
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE로 실제 실행 시간 측정")
+    parser.add_argument("--seed", action="store_true", help="점검 전 시드 데이터 생성, 점검 후 삭제 (로컬 DB 전용)")
+    parser.add_argument("--allow-empty", action="store_true", help="샘플 데이터가 없는 점검을 실패로 보지 않음")
+    args = parser.parse_args()
+
+    load_dotenv()
+    from database import SessionLocal
+    from utils.seed_chat import cleanup_chat, seed_chat
+    from utils.seed_plans import cleanup_plan_data, seed_plan_data
+
+    db = SessionLocal()
+    try:
+        try:
+            if args.seed:
+                seed_plan_data(db, students=2000, rooms=200)
+                seed_chat(db, messages=20000, conversations=20, members=4)
+            results = run_checks(db, verbose=args.verbose, analyze=args.analyze)
+        finally:
+            if args.seed:
+                # 시드 도중 실패한 트랜잭션을 정리한 뒤 삭제
+                db.rollback()
+                cleanup_chat(db)
+                cleanup_plan_data(db)
+    finally:
+        db.close()
+
+    failed = False
+    for row in results:
+        if row["status"] == "skipped":
+            failed = failed or not args.allow_empty
+            label = "SKIP" if args.allow_empty else "FAIL"
+            print(f"[{label}] {row['name']}: 샘플 데이터 없음 (--seed로 시드 데이터 생성)")
+            continue
+        failed = failed or row["status"] != "ok"
+        label = "OK  " if row["status"] == "ok" else "FAIL"
+        timing = f", 실행 {row['execution_ms']:.3f}ms" if row["execution_ms"] is not None else ""
+        print(
+            f"[{label}] {row['name']}: 기대 {' / '.join(row['expected'])}, "
+            f"사용 {row['indexes'] or '-'}, 순차 스캔 {row['seq_scans'] or '-'}{timing}"
+        )
+        if row["plan"]:
+            print(json.dumps(row["plan"], ensure_ascii=False, indent=2))
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
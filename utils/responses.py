@@ -0,0 +1,163 @@
+"""
+orjson 기반 JSON 응답 클래스
+
+main.py에서 앱 기본 응답 클래스로 사용한다. 표준 json 모듈보다 빠르고, UUID/datetime/date를 직접 직렬화한다.
+기존 응답 형식(jsonable_encoder 결과)과 같도록 Decimal은 숫자(정수 또는 실수)로, set은 리스트로 변환한다.
+
+라우터가 dict를 반환하면 FastAPI가 jsonable_encoder로 한 번 더 순회하므로,
+목록 API처럼 응답이 큰 엔드포인트는 response_model(schemas.py)을 지정하여
+pydantic-core 직렬화 경로를 사용한다.
+
+벤치마크:
+    python -m utils.responses --rows 100 --runs 200
+"""
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any):
+    """orjson이 직접 지원하지 않는 타입 변환 (jsonable_encoder와 같은 결과)"""
+    if isinstance(value, Decimal):
+        # jsonable_encoder의 decimal_encoder와 동일: 소수부가 없으면 int
+        if value.as_tuple().exponent >= 0:
+            return int(value)
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, bytes):
+        return value.decode()
+    raise TypeError(f"JSON으로 변환할 수 없는 타입입니다: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSONResponse"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# --- 벤치마크 ---
+
+def _sample_rows(count: int) -> list:
+    """학생 목록 응답과 같은 형태의 샘플 데이터"""
+    rows = []
+    for index in range(count):
+        rows.append({
+            "id": uuid.uuid4(),
+            "name": f"NGUYEN VAN AN {index}",
+            "email": f"student{index}@example.com",
+            "created_at": datetime(2025, 4, 1, 9, 30, 15, 123456) + timedelta(minutes=index),
+            "department_id": uuid.uuid4(),
+            "consultant": index % 5,
+            "phone": "090-1234-5678",
+            "avatar": None,
+            "grade_id": uuid.uuid4(),
+            "cooperation_submitted_date": date(2025, 3, 1),
+            "cooperation_submitted_place": "東京",
+            "assignment_date": date(2025, 4, 1),
+            "ward": "新宿区",
+            "name_katakana": "グエン ヴァン アン",
+            "gender": "男性",
+            "birth_date": date(2000, 1, 1),
+            "nationality": "ベトナム",
+            "has_spouse": False,
+            "japanese_level": "N3",
+            "passport_number": "C1234567",
+            "residence_card_number": "AB12345678CD",
+            "residence_card_start": date(2025, 4, 1),
+            "residence_card_expiry": date(2028, 4, 1),
+            "resignation_date": None,
+            "local_address": "Ha Noi",
+            "address": "東京都新宿区1-2-3",
+            "experience_over_2_years": True,
+            "status": "ACTIVE",
+            "arrival_type": "NEW",
+            "student_type": "GENERAL",
+            "note": None,
+            "department": {"id": str(uuid.uuid4()), "name": "会社 - 部署", "department_name": "部署", "company_name": "会社"},
+            "grade": {"name": "A"},
+            "current_room": {"room_number": "101", "building_name": "第1寮"},
+        })
+    return rows
+
+
+def _stringify(rows: list) -> list:
+    """라우터가 직접 str()/isoformat()으로 변환하던 방식과 같은 입력"""
+    return [
+        {key: str(value) if isinstance(value, uuid.UUID) else value for key, value in row.items()}
+        for row in rows
+    ]
+
+
+def run_benchmark(rows: int = 100, runs: int = 200) -> dict:
+    """응답 직렬화 방식별 1회 소요 시간(ms, 중앙값)
+
+    - jsonable_encoder + json: 기존 기본 경로 (dict 반환 → jsonable_encoder → JSONResponse)
+    - jsonable_encoder + orjson: 기본 응답 클래스만 교체한 경로
+    - pydantic + orjson: response_model 지정 경로 (검증 + pydantic-core 직렬화 → FastJSONResponse)
+    """
+    from schemas import StudentListResponse
+
+    items = _stringify(_sample_rows(rows))
+    content = {"items": items, "total": rows * 10, "total_is_estimate": False, "page": 1,
+               "page_size": rows, "total_pages": 10, "has_next": True, "has_previous": False}
+
+    def legacy():
+        return json.dumps(jsonable_encoder(content), ensure_ascii=False, separators=(",", ":")).encode()
+
+    def encoder_orjson():
+        return dumps(jsonable_encoder(content))
+
+    def pydantic_orjson():
+        model = StudentListResponse.model_validate(content)
+        return dumps(model.model_dump(mode="json", exclude_unset=True))
+
+    results = {}
+    for label, serialize in (("jsonable_encoder + json", legacy),
+                             ("jsonable_encoder + orjson", encoder_orjson),
+                             ("pydantic + orjson", pydantic_orjson)):
+        serialize()
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            body = serialize()
+            samples.append((time.perf_counter() - started) * 1000)
+        results[label] = {"ms": round(statistics.median(samples), 3), "bytes": len(body)}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 직렬화 마이크로 벤치마크")
+    parser.add_argument("--rows", type=int, default=100, help="목록 행 수")
+    parser.add_argument("--runs", type=int, default=200, help="반복 횟수")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.rows, args.runs)
+    baseline = results["jsonable_encoder + json"]["ms"]
+    for label, result in results.items():
+        print(f"{label:>26}: {result['ms']:>8}ms  ({result['bytes']} bytes, x{baseline / result['ms']:.1f})")
+
+
+if __name__ == "__main__":
+    main()
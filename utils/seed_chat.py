@@ -0,0 +1,121 @@
+"""
+채팅 벤치마크용 시드 데이터 생성 (로컬 DB 전용)
+
+generate_series로 DB 안에서 직접 대화방/멤버/메시지/읽음 기록을 생성하므로
+100만 건 단위도 네트워크 왕복 없이 수십 초 안에 만들어진다.
+생성된 대화방은 제목 앞에 BENCH_TITLE_PREFIX가 붙으며 --cleanup으로 한 번에 삭제할 수 있다.
+
+사용법:
+    python -m utils.seed_chat --messages 1000000 --conversations 200 --members 8
+    python -m utils.query_plans --analyze   # 인덱스 적용 전후로 실행하여 비교
+    python -m utils.seed_chat --cleanup
+"""
+import argparse
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+BENCH_TITLE_PREFIX = "[bench] "
+BENCH_USER_PREFIX = "bench-user-"
+
+
+def seed_chat(db: Session, messages: int, conversations: int, members: int, read_ratio: float = 0.7) -> dict:
+    """벤치마크용 채팅 데이터 생성
+
+    메시지의 약 2%는 삭제된 상태(deleted_at)로, 각 메시지는 read_ratio 확률로 bench-user-0이 읽은 상태로 만든다.
+    """
+    params = {
+        "prefix": BENCH_TITLE_PREFIX,
+        "user_prefix": BENCH_USER_PREFIX,
+        "conversations": conversations,
+        "members": members,
+        "messages": messages,
+        "read_ratio": read_ratio,
+    }
+    timings = {}
+
+    statements = [
+        ("conversations", """
+            INSERT INTO conversations (id, title, is_group, created_by, created_at)
+            SELECT gen_random_uuid(), :prefix || g, true, :user_prefix || '0', now()
+            FROM generate_series(1, :conversations) g
+        """),
+        ("conversation_members", """
+            INSERT INTO conversation_members (conversation_id, user_id, role, joined_at)
+            SELECT c.id, :user_prefix || u, 'member', now()
+            FROM conversations c CROSS JOIN generate_series(0, :members - 1) u
+            WHERE c.title LIKE :prefix || '%'
+        """),
+        ("messages", """
+            INSERT INTO messages (id, conversation_id, sender_id, body, created_at, deleted_at)
+            SELECT
+                gen_random_uuid(),
+                c.ids[1 + g % c.n],
+                :user_prefix || (g % :members),
+                'message ' || g,
+                now() - make_interval(secs => :messages - g),
+                CASE WHEN g % 50 = 0 THEN now() ELSE NULL END
+            FROM generate_series(1, :messages) g,
+                 (SELECT array_agg(id) AS ids, count(*) AS n FROM conversations WHERE title LIKE :prefix || '%') c
+        """),
+        ("message_reads", """
+            INSERT INTO message_reads (message_id, user_id, read_at)
+            SELECT m.id, :user_prefix || '0', now()
+            FROM messages m JOIN conversations c ON c.id = m.conversation_id
+            WHERE c.title LIKE :prefix || '%'
+              AND m.sender_id <> :user_prefix || '0'
+              AND random() < :read_ratio
+        """),
+    ]
+
+    for name, statement in statements:
+        started = time.perf_counter()
+        db.execute(text(statement), params)
+        db.commit()
+        timings[name] = round(time.perf_counter() - started, 2)
+
+    # 통계 갱신 (플래너가 새 데이터 분포를 반영하도록)
+    for table in ("conversations", "conversation_members", "messages", "message_reads"):
+        db.execute(text(f"ANALYZE {table}"))
+    db.commit()
+    return timings
+
+
+def cleanup_chat(db: Session) -> int:
+    """시드 데이터 삭제 (멤버/메시지/읽음 기록은 FK CASCADE로 함께 삭제)"""
+    result = db.execute(
+        text("DELETE FROM conversations WHERE title LIKE :prefix || '%'"),
+        {"prefix": BENCH_TITLE_PREFIX}
+    )
+    db.commit()
+    return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="채팅 벤치마크 시드 데이터 생성 (로컬 DB 전용)")
+    parser.add_argument("--messages", type=int, default=1_000_000)
+    parser.add_argument("--conversations", type=int, default=200)
+    parser.add_argument("--members", type=int, default=8, help="대화방당 멤버 수")
+    parser.add_argument("--cleanup", action="store_true", help="시드 데이터 삭제")
+    args = parser.parse_args()
+
+    load_dotenv()
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            print(f"시드 대화방 {cleanup_chat(db)}개 삭제")
+            return
+        timings = seed_chat(db, args.messages, args.conversations, args.members)
+        print(f"시드 완료: 메시지 {args.messages}건, 대화방 {args.conversations}개, 대화방당 멤버 {args.members}명")
+        for table, seconds in timings.items():
+            print(f"  {table}: {seconds}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
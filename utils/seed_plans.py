@@ -0,0 +1,168 @@
+"""
+쿼리 실행 계획 점검용 시드 데이터 생성 (로컬 DB 전용)
+
+utils.query_plans의 점검 쿼리가 사용하는 테이블(회사/건물/방/학생/거주 기록/공과금/월별 청구 항목/
+인보이스/식사 결식 기록)에 대표적인 분포의 행을 generate_series로 DB 안에서 직접 생성한다.
+생성된 회사/건물은 이름 앞에 BENCH_NAME_PREFIX가, 학생은 이메일 끝에 BENCH_EMAIL_DOMAIN이 붙으며
+--cleanup으로 한 번에 삭제할 수 있다.
+
+사용법:
+    python -m utils.seed_plans --students 2000
+    python -m utils.query_plans
+    python -m utils.seed_plans --cleanup
+
+    python -m utils.query_plans --seed     # 시드 → 점검 → 삭제를 한 번에 실행
+"""
+import argparse
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+BENCH_NAME_PREFIX = "[bench] "
+BENCH_EMAIL_DOMAIN = "@plan-bench.local"
+
+# 시드 학생/방/건물을 고르는 조건 (각 문장에서 공통 사용)
+_BENCH_STUDENTS = "SELECT id FROM students WHERE email LIKE '%' || :domain"
+_BENCH_ROOMS = (
+    "SELECT rooms.id FROM rooms JOIN buildings ON buildings.id = rooms.building_id "
+    "WHERE buildings.name = :prefix || 'building'"
+)
+
+
+def seed_plan_data(db: Session, students: int, rooms: int) -> dict:
+    """점검 쿼리용 데이터 생성
+
+    학생마다 거주 기록 1건(3명 중 1명은 퇴거 완료), 월별 청구 항목/인보이스 6개월분을,
+    방마다 공과금 12개월 × 3종류를, 거주 기록마다 식사 결식 기록 3건을 만든다.
+    """
+    params = {"prefix": BENCH_NAME_PREFIX, "domain": BENCH_EMAIL_DOMAIN, "students": students, "rooms": rooms}
+    timings = {}
+
+    statements = [
+        ("companies", """
+            INSERT INTO companies (id, name, address, billing_scope, created_at)
+            VALUES (gen_random_uuid(), :prefix || 'company', '', false, now())
+        """),
+        ("buildings", """
+            INSERT INTO buildings (id, name, resident_type)
+            VALUES (gen_random_uuid(), :prefix || 'building', 'student')
+        """),
+        ("rooms", """
+            INSERT INTO rooms (id, building_id, room_number, capacity, is_available)
+            SELECT gen_random_uuid(), b.id, 'B' || g, 4, true
+            FROM buildings b, generate_series(1, :rooms) g
+            WHERE b.name = :prefix || 'building'
+        """),
+        ("students", """
+            INSERT INTO students (id, name, email, status, student_type, company_id, created_at)
+            SELECT gen_random_uuid(), 'BENCH STUDENT ' || g, 'plan' || g || :domain, 'ACTIVE', 'GENERAL', c.id, now()
+            FROM companies c, generate_series(1, :students) g
+            WHERE c.name = :prefix || 'company'
+        """),
+        ("residents", f"""
+            INSERT INTO residents (id, room_id, resident_id, resident_type, check_in_date, check_out_date, is_active, created_at)
+            SELECT
+                gen_random_uuid(),
+                r.ids[(1 + s.n % r.cnt)::int],
+                s.id,
+                'student',
+                date '2024-04-01' + (s.n % 300)::int,
+                CASE WHEN s.n % 3 = 0 THEN date '2025-06-30' ELSE NULL END,
+                s.n % 3 <> 0,
+                now()
+            FROM (SELECT id, row_number() OVER () AS n FROM ({_BENCH_STUDENTS}) bench_students) s,
+                 (SELECT array_agg(id) AS ids, count(*) AS cnt FROM ({_BENCH_ROOMS}) bench_rooms) r
+        """),
+        ("room_utilities", f"""
+            INSERT INTO room_utilities (id, room_id, utility_type, period_start, period_end,
+                                        usage, unit_price, total_amount, charge_month, created_at)
+            SELECT
+                gen_random_uuid(),
+                rm.id,
+                (ARRAY['electricity', 'water', 'gas'])[1 + t],
+                m::date,
+                (m + interval '1 month' - interval '1 day')::date,
+                100, 30, 3000,
+                m::date,
+                now()
+            FROM ({_BENCH_ROOMS}) rm,
+                 generate_series(0, 2) t,
+                 generate_series(date '2024-08-01', date '2025-07-01', interval '1 month') m
+        """),
+        ("billing_monthly_items", f"""
+            INSERT INTO billing_monthly_items (id, student_id, year, month, item_name, amount, sort_order, created_at)
+            SELECT gen_random_uuid(), s.id, 2025, g, '家賃', 30000, 0, now()
+            FROM ({_BENCH_STUDENTS}) s, generate_series(1, 6) g
+        """),
+        ("invoices", f"""
+            INSERT INTO invoices (id, student_id, invoice_number, year, month, total_amount, status)
+            SELECT gen_random_uuid(), s.id, 'BENCH-' || g || '-' || left(s.id::text, 8), 2025, g, 30000, 'draft'
+            FROM ({_BENCH_STUDENTS}) s, generate_series(1, 6) g
+        """),
+        ("elderly_meal_records", f"""
+            INSERT INTO elderly_meal_records (id, resident_id, skip_date, meal_type, created_at)
+            SELECT gen_random_uuid(), res.id, date '2025-07-01' + g, (ARRAY['breakfast', 'lunch', 'dinner'])[1 + g], now()
+            FROM residents res, generate_series(0, 2) g
+            WHERE res.room_id IN ({_BENCH_ROOMS})
+        """),
+    ]
+
+    for name, statement in statements:
+        started = time.perf_counter()
+        db.execute(text(statement), params)
+        db.commit()
+        timings[name] = round(time.perf_counter() - started, 2)
+
+    # 통계 갱신 (플래너가 새 데이터 분포를 반영하도록)
+    for table in ("companies", "buildings", "rooms", "students", "residents", "room_utilities",
+                  "billing_monthly_items", "invoices", "elderly_meal_records"):
+        db.execute(text(f"ANALYZE {table}"))
+    db.commit()
+    return timings
+
+
+def cleanup_plan_data(db: Session) -> int:
+    """시드 데이터 삭제
+
+    인보이스/월별 청구 항목은 학생 삭제 시, 방/거주 기록/식사 결식 기록은 건물 삭제 시 FK CASCADE로 함께 삭제된다.
+    공과금은 CASCADE가 없으므로 먼저 삭제한다.
+
+    Returns:
+        삭제한 학생 수
+    """
+    params = {"prefix": BENCH_NAME_PREFIX, "domain": BENCH_EMAIL_DOMAIN}
+    db.execute(text(f"DELETE FROM room_utilities WHERE room_id IN ({_BENCH_ROOMS})"), params)
+    result = db.execute(text(f"DELETE FROM students WHERE id IN ({_BENCH_STUDENTS})"), params)
+    db.execute(text("DELETE FROM buildings WHERE name = :prefix || 'building'"), params)
+    db.execute(text("DELETE FROM companies WHERE name = :prefix || 'company'"), params)
+    db.commit()
+    return result.rowcount
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쿼리 실행 계획 점검용 시드 데이터 생성 (로컬 DB 전용)")
+    parser.add_argument("--students", type=int, default=2000)
+    parser.add_argument("--rooms", type=int, default=200)
+    parser.add_argument("--cleanup", action="store_true", help="시드 데이터 삭제")
+    args = parser.parse_args()
+
+    load_dotenv()
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.cleanup:
+            print(f"시드 학생 {cleanup_plan_data(db)}명 삭제")
+            return
+        timings = seed_plan_data(db, args.students, args.rooms)
+        print(f"시드 완료: 학생 {args.students}명, 방 {args.rooms}개")
+        for table, seconds in timings.items():
+            print(f"  {table}: {seconds}s")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+동일 요청 병합 (single-flight)
+
+월말에 여러 직원이 같은 회사의 월간 청구서 미리보기/PDF를 동시에 열면 요청마다 같은 계산이 반복된다.
+같은 파라미터의 호출이 진행 중이면 새로 계산하지 않고 진행 중인 계산이 끝나기를 기다려 결과를 함께 사용한다.
+
+- 병합은 진행 중인 호출끼리만 일어나며 결과를 저장하지 않는다 (끝난 뒤의 호출은 새로 계산).
+- 키는 정규화한 파라미터로 만든다 (문자열 앞뒤 공백 제거, 빈 문자열은 None, UUID는 소문자 표준 표기).
+- 먼저 온 호출(leader)의 예외(HTTPException 포함)는 기다리던 호출에도 그대로 전달된다.
+- 결과는 여러 요청이 공유하므로 호출자는 수정하지 않는다. 스트리밍 응답처럼 공유할 수 없는 결과는
+  엔드포인트 안에서 single_flight.do()로 공유 가능한 부분(예: SharedSpooledFile)만 병합한다.
+  결과에 expect_readers(count)가 있으면 더 이상 합류할 수 없게 된 시점에 결과를 받을 호출 수를 알려준다
+  (마지막 리더가 끝날 때 파일을 닫기 위해 사용).
+- 동기 엔드포인트(스레드풀)용이며, 워커 프로세스 단위로 병합된다.
+"""
+import functools
+import inspect
+import threading
+import uuid
+from typing import Any, Callable, Optional
+
+from utils.cache import TaggedCache, endpoint_key_parts
+from utils.metrics import CallbackGauge, Counter
+
+single_flight_calls = Counter(
+    "single_flight_calls_total",
+    "병합 대상 호출 수 (result=leader: 직접 계산, coalesced: 진행 중인 계산 결과를 공유)",
+    ("scope", "result"),
+)
+
+
+def normalize_parts(value: Any) -> Any:
+    """키 구성 요소 정규화"""
+    if isinstance(value, dict):
+        return {name: normalize_parts(item) for name, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_parts(item) for item in value]
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return str(uuid.UUID(value))
+        except ValueError:
+            return value
+    return value
+
+
+class _Flight:
+    __slots__ = ("done", "result", "error", "callers")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        # 결과를 받을 호출 수 (leader 포함)
+        self.callers = 1
+
+
+class SingleFlight:
+    """키별로 진행 중인 계산을 하나로 합치는 실행기"""
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+
+    def do(self, scope: str, parts: Any, compute: Callable[[], Any]) -> Any:
+        """같은 키의 계산이 진행 중이면 그 결과를, 없으면 compute()를 실행한 결과를 반환
+
+        Args:
+            scope: 병합 구분 이름 (메트릭 라벨로도 사용, 예: "buildings.invoice_preview.company")
+            parts: 키 구성 요소 (정규화 후 JSON으로 직렬화)
+        """
+        key = TaggedCache.make_key(scope, normalize_parts(parts))
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                flight.callers += 1
+
+        if not leader:
+            single_flight_calls.labels(scope, "coalesced").inc()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        single_flight_calls.labels(scope, "leader").inc()
+        try:
+            flight.result = compute()
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            # 이제 새 호출이 합류할 수 없으므로, 결과를 돌려주기 전에 받을 호출 수 확정
+            expect_readers = getattr(flight.result, "expect_readers", None)
+            if flight.error is None and expect_readers is not None:
+                expect_readers(flight.callers)
+            flight.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+
+single_flight = SingleFlight()
+
+CallbackGauge(
+    "single_flight_in_flight", "진행 중인 병합 대상 계산 수", (), lambda: {(): single_flight.in_flight()}
+)
+
+
+def coalesced(scope: str, key: Optional[Callable[..., Any]] = None):
+    """동기 엔드포인트 동일 요청 병합 데코레이터
+
+    의존성(인증 포함)은 FastAPI가 매 요청 실행하고, 엔드포인트 본문만 병합된다.
+
+    Args:
+        key: 엔드포인트 인자로 키 구성 요소를 만드는 함수.
+            미지정 시 db/current_user를 제외한 모든 인자를 사용하므로 사용자별로 결과가 다르면 반드시 지정한다.
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            raise TypeError("coalesced는 동기 엔드포인트에만 사용할 수 있습니다")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            parts = key(**kwargs) if key is not None else endpoint_key_parts(kwargs)
+            return single_flight.do(scope, parts, lambda: func(*args, **kwargs))
+
+        return wrapper
+
+    return decorator
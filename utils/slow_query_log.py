@@ -0,0 +1,178 @@
+"""
+느린 쿼리 로그 (링 버퍼)
+
+SLOW_QUERY_THRESHOLD_MS 이상 걸린 쿼리를 파라미터, 호출한 엔드포인트와 함께 로그로 남기고
+최근 SLOW_QUERY_BUFFER_SIZE건을 메모리 링 버퍼에 보관한다(관리자용 /debug/slow-queries에서 조회).
+
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE(0~1)를 지정하면 그 비율만큼 별도 연결에서 EXPLAIN (ANALYZE, BUFFERS)를 실행하여
+실행 계획을 함께 기록한다. EXPLAIN은 백그라운드 스레드에서 실행되어 요청 응답을 늦추지 않으며,
+ANALYZE는 쿼리를 실제로 실행하므로 SELECT 문만 대상으로 하고 트랜잭션은 항상 롤백한다.
+
+여러 엔진(동기/비동기)에 install해도 쿼리 리스너는 한 번만 등록되므로 느린 쿼리 하나는 한 건으로 기록된다.
+자체 점검: python -m utils.slow_query_log
+"""
+import itertools
+import logging
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+
+from utils.sql_profiler import RequestQueryProfile, add_query_listener
+
+logger = logging.getLogger(__name__)
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "200"))
+SLOW_QUERY_EXPLAIN_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0"))
+SLOW_QUERY_EXPLAIN_TIMEOUT_MS = int(os.getenv("SLOW_QUERY_EXPLAIN_TIMEOUT_MS", "5000"))
+# 로그/버퍼에 남길 SQL, 파라미터 최대 길이
+_MAX_TEXT_LENGTH = 4000
+
+
+def _truncate(value: str) -> str:
+    return value if len(value) <= _MAX_TEXT_LENGTH else value[:_MAX_TEXT_LENGTH] + "...(생략)"
+
+
+class SlowQueryLog:
+    """느린 쿼리 링 버퍼
+
+    deque(maxlen)의 append는 스레드 안전하므로 기록 경로에는 락을 사용하지 않는다.
+    """
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_THRESHOLD_MS, size: int = SLOW_QUERY_BUFFER_SIZE,
+                 explain_sample_rate: float = SLOW_QUERY_EXPLAIN_SAMPLE_RATE):
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.entries = deque(maxlen=size)
+        self.total = 0
+        self._ids = itertools.count(1)
+        self._explain_engine = None
+        self._explain_url = None
+        self._installed = False
+        self._install_lock = threading.Lock()
+        # EXPLAIN은 한 번에 하나씩만 실행하고, 실행 중인 작업이 있으면 새 샘플은 건너뜀
+        self._explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="slow-query-explain")
+        self._explain_pending = threading.Semaphore(1)
+
+    def install(self, engine, explain: bool = False):
+        """엔진의 쿼리를 감시 (engine에 sql_profiler가 설치되어 있어야 함)
+
+        explain=True이면 같은 URL로 별도 연결(NullPool)을 만들어 EXPLAIN을 실행한다.
+        비동기 엔진(asyncpg)은 파라미터 형식이 달라 EXPLAIN 대상에서 제외한다.
+        쿼리 리스너는 sql_profiler가 설치된 모든 엔진에 공통이므로 처음 호출할 때 한 번만 등록한다.
+        """
+        if explain:
+            self._explain_url = engine.url
+        with self._install_lock:
+            if self._installed:
+                return
+            self._installed = True
+        add_query_listener(self._on_query)
+
+    def _on_query(self, statement: str, parameters, seconds: float,
+                  profile: Optional[RequestQueryProfile], conn):
+        duration_ms = seconds * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        entry = {
+            "id": next(self._ids),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration_ms, 2),
+            "statement": _truncate(statement),
+            "parameters": _truncate(repr(parameters)),
+            "method": profile.method if profile else None,
+            "path": profile.path if profile else None,
+            "route": profile.route_path if profile else None,
+            "endpoint": profile.endpoint_name if profile else None,
+            "explain": None,
+        }
+        self.total += 1
+        self.entries.append(entry)
+        logger.warning(
+            f"느린 쿼리 {entry['duration_ms']}ms [{entry['method']} {entry['route']} → {entry['endpoint']}]: "
+            f"{statement[:500]} | params={entry['parameters'][:500]}"
+        )
+
+        if self._should_explain(statement, conn):
+            if self._explain_pending.acquire(blocking=False):
+                self._explain_executor.submit(self._run_explain, entry, statement, parameters)
+
+    def _should_explain(self, statement: str, conn) -> bool:
+        if not self._explain_url or self.explain_sample_rate <= 0:
+            return False
+        if conn.engine.url != self._explain_url:
+            return False
+        if not statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            return False
+        return random.random() < self.explain_sample_rate
+
+    def _get_explain_engine(self):
+        # 메인 풀의 연결을 빼앗지 않도록 전용 엔진(NullPool) 사용
+        if self._explain_engine is None:
+            self._explain_engine = create_engine(self._explain_url, poolclass=NullPool)
+        return self._explain_engine
+
+    def _run_explain(self, entry: dict, statement: str, parameters):
+        try:
+            with self._get_explain_engine().connect() as conn:
+                try:
+                    conn.execute(text(f"SET LOCAL statement_timeout = {SLOW_QUERY_EXPLAIN_TIMEOUT_MS}"))
+                    result = conn.exec_driver_sql(
+                        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+                    ).scalar()
+                    entry["explain"] = result[0] if isinstance(result, list) else result
+                finally:
+                    conn.rollback()
+        except Exception as e:
+            entry["explain"] = {"error": str(e)[:500]}
+            logger.warning(f"느린 쿼리 EXPLAIN 실패 (id={entry['id']}): {e}")
+        finally:
+            self._explain_pending.release()
+
+    def recent(self, limit: int = 50, min_duration_ms: float = 0, path: Optional[str] = None) -> List[dict]:
+        """최근 느린 쿼리 (최신순)"""
+        rows = []
+        for entry in reversed(list(self.entries)):
+            if entry["duration_ms"] < min_duration_ms:
+                continue
+            if path and path not in (entry["path"], entry["route"]):
+                continue
+            rows.append(entry)
+            if len(rows) >= limit:
+                break
+        return rows
+
+    def clear(self):
+        self.entries.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+def _self_check() -> bool:
+    """엔진 두 개에 install한 뒤 느린 쿼리 하나가 한 건으로 기록되는지 확인 (SQLite 메모리 DB)"""
+    from utils.sql_profiler import install_sql_profiler
+
+    engines = [create_engine("sqlite://"), create_engine("sqlite://")]
+    log = SlowQueryLog(threshold_ms=0)
+    for engine in engines:
+        install_sql_profiler(engine)
+        log.install(engine)
+
+    with engines[0].connect() as conn:
+        conn.execute(text("SELECT 1"))
+    return log.total == 1 and len(log.entries) == 1
+
+
+if __name__ == "__main__":
+    ok = _self_check()
+    print("OK: 느린 쿼리 1건 → 기록 1건" if ok else "FAIL: 느린 쿼리 하나가 여러 번 기록됨")
+    raise SystemExit(0 if ok else 1)
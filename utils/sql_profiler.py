@@ -0,0 +1,266 @@
+"""
+요청 단위 SQL 계측 (쿼리 수, DB 시간, 반복 쿼리 지문)
+
+SQLAlchemy before/after_cursor_execute 이벤트로 실행된 모든 쿼리를 현재 요청의 프로파일에 기록한다.
+같은 지문(리터럴/바인드 파라미터를 제거한 SQL)의 쿼리가 한 요청에서 여러 번 실행되면 N+1로 의심하여 경고 로그를 남기고,
+응답에는 Server-Timing 헤더(db;dur=...;desc="queries=N")를 추가한다.
+
+테스트/스크립트에서는 query_budget()으로 엔드포인트별 쿼리 수 한도를 검증할 수 있다.
+
+    with query_budget(5):
+        client.get("/students")
+"""
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+SQL_PROFILE_ENABLED = os.getenv("SQL_PROFILE_ENABLED", "true").lower() == "true"
+# 같은 지문의 쿼리가 요청 하나에서 이 횟수 이상 실행되면 N+1 의심 경고
+SQL_REPEAT_WARN_THRESHOLD = int(os.getenv("SQL_REPEAT_WARN_THRESHOLD", "5"))
+# 요청 하나의 쿼리 수가 이 값 이상이면 경고 (0이면 사용 안 함)
+SQL_QUERY_COUNT_WARN_THRESHOLD = int(os.getenv("SQL_QUERY_COUNT_WARN_THRESHOLD", "50"))
+
+_BIND_PARAM = re.compile(r"%\(\w+\)s|\$\d+|:\w+|\?")
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """SQL 지문 생성 (파라미터/리터럴/IN 목록 길이 차이를 제거하여 같은 형태의 쿼리를 묶음)"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _BIND_PARAM.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class RequestQueryProfile:
+    """요청 하나에서 실행된 쿼리 통계"""
+
+    def __init__(self, method: str = "", path: str = "", scope: Optional[dict] = None):
+        self.method = method
+        self.path = path
+        # 라우팅 이후 Starlette가 scope에 endpoint/route를 채워 넣으므로 참조를 보관
+        self.scope = scope
+        self.query_count = 0
+        self.db_seconds = 0.0
+        self.fingerprints: Counter = Counter()
+        self.fingerprint_seconds: Dict[str, float] = {}
+
+    def record(self, statement: str, seconds: float):
+        key = fingerprint(statement)
+        self.query_count += 1
+        self.db_seconds += seconds
+        self.fingerprints[key] += 1
+        self.fingerprint_seconds[key] = self.fingerprint_seconds.get(key, 0.0) + seconds
+
+    @property
+    def route_path(self) -> str:
+        """라우트 템플릿 (예: /students/{student_id}), 라우팅 전이거나 매칭 실패 시 실제 경로"""
+        route = self.scope.get("route") if self.scope else None
+        return getattr(route, "path", None) or self.path
+
+    @property
+    def endpoint_name(self) -> Optional[str]:
+        """요청을 처리한 핸들러 (모듈.함수명)"""
+        endpoint = self.scope.get("endpoint") if self.scope else None
+        if endpoint is None:
+            return None
+        return f"{getattr(endpoint, '__module__', '')}.{getattr(endpoint, '__qualname__', repr(endpoint))}"
+
+    def repeated(self, threshold: int = SQL_REPEAT_WARN_THRESHOLD) -> List[dict]:
+        """threshold회 이상 반복된 쿼리 지문 목록 (많은 순)"""
+        return [
+            {
+                "fingerprint": key,
+                "count": count,
+                "total_ms": round(self.fingerprint_seconds[key] * 1000, 2),
+            }
+            for key, count in self.fingerprints.most_common()
+            if count >= threshold
+        ]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_seconds * 1000:.2f};desc="queries={self.query_count}"'
+
+    def summary(self) -> dict:
+        return {
+            "method": self.method,
+            "path": self.path,
+            "route": self.route_path,
+            "endpoint": self.endpoint_name,
+            "query_count": self.query_count,
+            "db_ms": round(self.db_seconds * 1000, 2),
+            "repeated": self.repeated(),
+        }
+
+
+_current_profile: ContextVar[Optional[RequestQueryProfile]] = ContextVar("sql_profile", default=None)
+
+# 요청 종료 시 프로파일을 전달받는 구독자 (query_budget, 메트릭 수집 등)
+_observers: List[Callable[[RequestQueryProfile], None]] = []
+_observers_lock = threading.Lock()
+
+# 쿼리 실행마다 호출되는 리스너 (statement, parameters, seconds, profile, conn) - 느린 쿼리 로그 등
+_query_listeners: List[Callable] = []
+
+
+def current_profile() -> Optional[RequestQueryProfile]:
+    """현재 요청(컨텍스트)의 쿼리 프로파일"""
+    return _current_profile.get()
+
+
+def add_observer(callback: Callable[[RequestQueryProfile], None]):
+    with _observers_lock:
+        _observers.append(callback)
+
+
+def remove_observer(callback: Callable[[RequestQueryProfile], None]):
+    with _observers_lock:
+        if callback in _observers:
+            _observers.remove(callback)
+
+
+def add_query_listener(callback: Callable):
+    """쿼리 실행마다 (statement, parameters, seconds, profile, conn)으로 호출될 콜백 등록
+
+    쿼리 실행 경로에서 직접 호출되므로 콜백은 가볍게 유지해야 한다.
+    """
+    with _observers_lock:
+        _query_listeners.append(callback)
+
+
+def _notify(profile: RequestQueryProfile):
+    for callback in list(_observers):
+        try:
+            callback(profile)
+        except Exception as e:
+            logger.warning(f"SQL 프로파일 구독자 처리 실패: {e}")
+
+
+def install_sql_profiler(engine):
+    """엔진에 쿼리 계측 이벤트 등록 (비동기 엔진은 engine.sync_engine 전달)"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds = time.perf_counter() - conn.info["query_start_time"].pop()
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(statement, seconds)
+        for callback in _query_listeners:
+            try:
+                callback(statement, parameters, seconds, profile, conn)
+            except Exception as e:
+                logger.warning(f"쿼리 리스너 처리 실패: {e}")
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # 실패한 쿼리는 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start_time"):
+            connection.info["query_start_time"].pop()
+
+
+def _log_profile(profile: RequestQueryProfile):
+    repeated = profile.repeated()
+    for row in repeated:
+        logger.warning(
+            f"N+1 의심: {profile.method} {profile.path} - 같은 쿼리 {row['count']}회 ({row['total_ms']}ms): "
+            f"{row['fingerprint'][:300]}"
+        )
+    if SQL_QUERY_COUNT_WARN_THRESHOLD and profile.query_count >= SQL_QUERY_COUNT_WARN_THRESHOLD:
+        logger.warning(
+            f"쿼리 과다: {profile.method} {profile.path} - {profile.query_count}회, DB {profile.db_seconds * 1000:.1f}ms"
+        )
+    elif profile.query_count:
+        logger.debug(
+            f"SQL: {profile.method} {profile.path} - {profile.query_count}회, DB {profile.db_seconds * 1000:.1f}ms"
+        )
+
+
+class SQLProfilerMiddleware:
+    """요청마다 쿼리 프로파일을 만들고 Server-Timing 헤더와 로그로 내보내는 ASGI 미들웨어
+
+    스트리밍 응답처럼 헤더 전송 이후에 실행된 쿼리는 헤더에는 반영되지 않고 로그/구독자에만 반영된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not SQL_PROFILE_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestQueryProfile(scope.get("method", ""), scope.get("path", ""), scope)
+        token = _current_profile.set(profile)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_profile.reset(token)
+            _log_profile(profile)
+            _notify(profile)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def query_budget(max_queries: int, path: Optional[str] = None):
+    """블록 안에서 실행된 쿼리 수가 max_queries를 넘으면 QueryBudgetExceeded 발생
+
+    직접 호출한 코드의 쿼리와, 블록 안에서 처리된 HTTP 요청(미들웨어 경유, path 지정 시 해당 경로만)의 쿼리를 합산한다.
+
+    Yields:
+        집계용 RequestQueryProfile
+    """
+    total = RequestQueryProfile(path=path or "")
+
+    def collect(profile: RequestQueryProfile):
+        if path is None or profile.path == path:
+            total.query_count += profile.query_count
+            total.db_seconds += profile.db_seconds
+            total.fingerprints.update(profile.fingerprints)
+            for key, seconds in profile.fingerprint_seconds.items():
+                total.fingerprint_seconds[key] = total.fingerprint_seconds.get(key, 0.0) + seconds
+
+    token = _current_profile.set(total)
+    add_observer(collect)
+    try:
+        yield total
+    finally:
+        remove_observer(collect)
+        _current_profile.reset(token)
+
+    if total.query_count > max_queries:
+        top = "\n".join(
+            f"  {count}x {key[:200]}" for key, count in total.fingerprints.most_common(5)
+        )
+        raise QueryBudgetExceeded(
+            f"쿼리 수 한도 초과{f' ({path})' if path else ''}: {total.query_count} > {max_queries}\n{top}"
+        )
@@ -0,0 +1,90 @@
+"""
+워커 콜드 스타트 시간 측정
+
+새 인터프리터에서 `import main`(앱 생성, 라우터 등록까지)에 걸리는 시간을 여러 번 측정한다.
+--max-seconds를 지정하면 중앙값이 기준을 넘을 때 종료 코드 1을 반환하므로 배포 전 점검에 사용할 수 있다.
+
+사용법:
+    python -m utils.startup_benchmark --runs 5 --max-seconds 3 --top 15
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_MEASURE_CODE = (
+    "import time; started = time.perf_counter(); import main; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def measure_startup(import_time: bool = False) -> Tuple[float, str]:
+    """새 프로세스에서 main 모듈 임포트 시간(초) 측정
+
+    Returns:
+        (소요 시간(초), -X importtime 출력 (import_time=True일 때))
+    """
+    command = [sys.executable]
+    if import_time:
+        command += ["-X", "importtime"]
+    command += ["-c", _MEASURE_CODE]
+
+    result = subprocess.run(command, cwd=BASE_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"main 임포트 실패:\n{result.stderr[-2000:]}")
+    return float(result.stdout.strip().splitlines()[-1]), result.stderr
+
+
+def slowest_imports(import_time_output: str, top: int) -> List[Tuple[str, float]]:
+    """-X importtime 출력에서 누적 시간이 큰 모듈 목록 (모듈명, ms)"""
+    rows = []
+    for line in import_time_output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # 형식: "import time:   self [us] | cumulative | 모듈명"
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        rows.append((parts[2].strip(), int(parts[1]) / 1000))
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top]
+
+
+def run_benchmark(runs: int = 5) -> dict:
+    """콜드 스타트 시간을 runs회 측정하여 통계 반환"""
+    samples = [measure_startup()[0] for _ in range(runs)]
+    return {
+        "runs": runs,
+        "min_ms": round(min(samples) * 1000, 1),
+        "median_ms": round(statistics.median(samples) * 1000, 1),
+        "max_ms": round(max(samples) * 1000, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="워커 콜드 스타트 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수")
+    parser.add_argument("--max-seconds", type=float, default=None, help="중앙값 허용 한도(초), 초과 시 종료 코드 1")
+    parser.add_argument("--top", type=int, default=0, help="임포트 시간이 큰 모듈 N개 출력")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.runs)
+    print(f"콜드 스타트 ({report['runs']}회): min {report['min_ms']}ms / median {report['median_ms']}ms / max {report['max_ms']}ms")
+
+    if args.top:
+        _, import_time_output = measure_startup(import_time=True)
+        print(f"임포트 시간 상위 {args.top}개 모듈 (누적):")
+        for name, ms in slowest_imports(import_time_output, args.top):
+            print(f"  {ms:>9.1f}ms  {name}")
+
+    if args.max_seconds is not None and report["median_ms"] > args.max_seconds * 1000:
+        print(f"콜드 스타트가 한도 {args.max_seconds}s를 초과했습니다")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+"""
+학생 검색 (pg_trgm GIN 인덱스 + 일본어 표기 정규화)
+
+get_students의 ilike('%x%')는 앞쪽 와일드카드 때문에 B-tree 인덱스를 사용할 수 없다.
+검색어와 대상 컬럼을 같은 규칙(NFKC로 반각/전각 통일 → 가타카나를 히라가나로 → 소문자)으로 정규화하고,
+정규화된 식에 만든 pg_trgm GIN 인덱스(마이그레이션 0006)로 부분 일치/유사 일치 후보를 찾은 뒤
+이름 > 카타카나 > 국적/이메일 > 방/건물/등급 순으로 가중치를 두어 순위를 매긴다.
+
+벤치마크 (로컬 DB 전용, 시드 학생은 이메일 도메인 BENCH_EMAIL_DOMAIN으로 구분):
+    python -m utils.student_search --seed 50000
+    python -m utils.student_search --bench "やまだ" "ﾔﾏﾀﾞ" "nguyen" "101"
+    python -m utils.student_search --cleanup
+"""
+import argparse
+import statistics
+import time
+import unicodedata
+from typing import List, Optional
+
+from sqlalchemy import case, func, or_, select, union
+from sqlalchemy.orm import Session, joinedload
+
+# 가타카나(ァ..ヶ) → 히라가나(ぁ..ゖ)
+_KATAKANA_TO_HIRAGANA = {code: code - 0x60 for code in range(0x30A1, 0x30F7)}
+
+# 이 길이 이상의 검색어만 유사 일치(오타 허용)를 함께 사용 (짧은 검색어는 트라이그램이 부족함)
+FUZZY_MIN_LENGTH = 3
+
+BENCH_EMAIL_DOMAIN = "@bench.invalid"
+
+
+def normalize_search_text(value: Optional[str]) -> str:
+    """DB 함수 search_normalize()와 같은 규칙의 파이썬 구현"""
+    if not value:
+        return ""
+    return unicodedata.normalize("NFKC", value).translate(_KATAKANA_TO_HIRAGANA).lower().strip()
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def student_search_document(Student):
+    """인덱스 idx_students_search_trgm과 동일한 식"""
+    return func.students_search_document(Student.name, Student.name_katakana, Student.nationality, Student.email)
+
+
+def build_search_query(db: Session, q: str, limit: int = 20,
+                       student_type: Optional[str] = None, status: Optional[str] = None):
+    """검색어에 일치하는 학생을 점수 순으로 조회하는 쿼리
+
+    후보는 테이블별 인덱스를 각각 사용할 수 있도록 UNION으로 모은다
+    (학생 본문 / 방 번호 / 건물 이름 / 등급 이름). OR로 묶으면 인덱스를 사용할 수 없다.
+
+    Returns:
+        (Student, score) 행을 반환하는 Query
+    """
+    from models import Building, Grade, Room, Student
+
+    term = normalize_search_text(q)
+    pattern = f"%{_escape_like(term)}%"
+    document = student_search_document(Student)
+
+    document_match = document.like(pattern)
+    if len(term) >= FUZZY_MIN_LENGTH:
+        # 단어 유사도(document %> term, 즉 term <% document) 일치도 후보에 포함 (오타/장음 차이 허용)
+        document_match = or_(document_match, document.op("%>")(term))
+
+    candidates = union(
+        select(Student.id).where(document_match),
+        select(Student.id).join(Room, Student.current_room_id == Room.id)
+        .where(func.search_normalize(Room.room_number).like(pattern)),
+        select(Student.id).join(Room, Student.current_room_id == Room.id)
+        .join(Building, Room.building_id == Building.id)
+        .where(func.search_normalize(Building.name).like(pattern)),
+        select(Student.id).join(Grade, Student.grade_id == Grade.id)
+        .where(func.search_normalize(Grade.name).like(pattern)),
+    ).subquery()
+
+    def field_score(column, weight: float):
+        normalized = func.search_normalize(column)
+        return weight * (
+            func.word_similarity(term, normalized)
+            + case((normalized == term, 1.0), else_=0.0)
+            + case((normalized.like(f"{_escape_like(term)}%"), 0.5), else_=0.0)
+        )
+
+    score = func.greatest(
+        field_score(Student.name, 1.0),
+        field_score(Student.name_katakana, 1.0),
+        field_score(Student.nationality, 0.6),
+        field_score(Student.email, 0.6),
+        field_score(Room.room_number, 0.5),
+        field_score(Building.name, 0.4),
+        field_score(Grade.name, 0.4),
+    ).label("score")
+
+    query = db.query(Student, score).options(
+        joinedload(Student.grade),
+        joinedload(Student.current_room).joinedload(Room.building),
+    ).join(candidates, candidates.c.id == Student.id) \
+        .outerjoin(Room, Student.current_room_id == Room.id) \
+        .outerjoin(Building, Room.building_id == Building.id) \
+        .outerjoin(Grade, Student.grade_id == Grade.id)
+
+    if student_type and student_type != "ALL":
+        query = query.filter(Student.student_type == student_type)
+    if status:
+        query = query.filter(Student.status == status)
+
+    return query.order_by(score.desc(), Student.name.asc(), Student.id.asc()).limit(limit)
+
+
+def serialize_search_result(student, score: float) -> dict:
+    return {
+        "id": str(student.id),
+        "name": student.name,
+        "name_katakana": student.name_katakana,
+        "nationality": student.nationality,
+        "email": student.email,
+        "status": student.status,
+        "student_type": student.student_type,
+        "grade": {"name": student.grade.name} if student.grade else None,
+        "current_room": {
+            "room_number": student.current_room.room_number,
+            "building_name": student.current_room.building.name
+        } if student.current_room and student.current_room.building else None,
+        "score": round(float(score or 0), 4),
+    }
+
+
+# --- 벤치마크 ---
+
+def seed_students(db: Session, count: int) -> float:
+    """벤치마크용 학생 생성 (이름/카타카나/국적 조합을 generate_series로 DB 안에서 생성)"""
+    from sqlalchemy import text
+
+    started = time.perf_counter()
+    db.execute(text("""
+        INSERT INTO students (id, name, name_katakana, nationality, email, status, student_type, created_at)
+        SELECT
+            gen_random_uuid(),
+            (ARRAY['NGUYEN VAN', 'TRAN THI', 'YAMADA', 'SATO', 'PHAM', 'LE', 'SUZUKI', 'TANAKA'])[1 + g % 8]
+                || ' ' || (ARRAY['AN', 'BINH', 'HANA', 'TARO', 'LINH', 'MAI', 'KENJI', 'DUC'])[1 + (g / 8) % 8] || ' ' || g,
+            (ARRAY['グエン ヴァン', 'チャン ティ', 'ヤマダ', 'サトウ', 'ファム', 'レ', 'スズキ', 'タナカ'])[1 + g % 8]
+                || ' ' || (ARRAY['アン', 'ビン', 'ハナ', 'タロウ', 'リン', 'マイ', 'ケンジ', 'ドゥック'])[1 + (g / 8) % 8],
+            (ARRAY['ベトナム', 'インドネシア', 'フィリピン', 'ミャンマー', 'ネパール'])[1 + g % 5],
+            'student' || g || :domain,
+            'ACTIVE',
+            'GENERAL',
+            now()
+        FROM generate_series(1, :count) g
+    """), {"count": count, "domain": BENCH_EMAIL_DOMAIN})
+    db.commit()
+    db.execute(text("ANALYZE students"))
+    db.commit()
+    return time.perf_counter() - started
+
+
+def cleanup_students(db: Session) -> int:
+    from sqlalchemy import text
+
+    result = db.execute(text("DELETE FROM students WHERE email LIKE :pattern"), {"pattern": f"%{BENCH_EMAIL_DOMAIN}"})
+    db.commit()
+    return result.rowcount
+
+
+def _legacy_query(db: Session, q: str, limit: int):
+    """기존 get_students 방식 (ilike '%x%' OR 조합)"""
+    from models import Building, Grade, Room, Student
+
+    pattern = f"%{q}%"
+    return db.query(Student).outerjoin(Room, Student.current_room_id == Room.id) \
+        .outerjoin(Building, Room.building_id == Building.id) \
+        .outerjoin(Grade, Student.grade_id == Grade.id) \
+        .filter(or_(
+            Student.name.ilike(pattern), Student.name_katakana.ilike(pattern), Student.nationality.ilike(pattern),
+            Student.email.ilike(pattern), Building.name.ilike(pattern), Room.room_number.ilike(pattern),
+            Grade.name.ilike(pattern),
+        )).limit(limit)
+
+
+def run_benchmark(db: Session, terms: List[str], runs: int = 5, limit: int = 20) -> List[dict]:
+    """검색어별 기존 ilike 방식과 trigram 검색의 실행 시간(ms, 중앙값) 비교"""
+    from utils.query_plans import explain, used_indexes
+
+    results = []
+    for term in terms:
+        row = {"term": term}
+        for label, build in (("ilike", lambda: _legacy_query(db, term, limit)),
+                             ("trigram", lambda: build_search_query(db, term, limit))):
+            samples = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                rows = build().all()
+                samples.append((time.perf_counter() - started) * 1000)
+            row[f"{label}_ms"] = round(statistics.median(samples), 2)
+            row[f"{label}_rows"] = len(rows)
+        plan = explain(db, build_search_query(db, term, limit), analyze=True, allow_seqscan=True)
+        row["trigram_indexes"] = sorted(set(used_indexes(plan["Plan"])))
+        results.append(row)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학생 검색 시드/벤치마크 (로컬 DB 전용)")
+    parser.add_argument("--seed", type=int, default=0, help="벤치마크용 학생 N명 생성")
+    parser.add_argument("--bench", nargs="*", default=None, help="검색어 목록 (지정 시 벤치마크 실행)")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--cleanup", action="store_true", help="벤치마크용 학생 삭제")
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    from database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        if args.seed:
+            seconds = seed_students(db, args.seed)
+            print(f"학생 {args.seed}명 생성: {seconds:.1f}s")
+        if args.bench is not None:
+            terms = args.bench or ["やまだ", "ﾔﾏﾀﾞ", "タナカ タロウ", "nguyen", "vietnam", "ベトナム", "student12345"]
+            for row in run_benchmark(db, terms, runs=args.runs):
+                print(
+                    f"{row['term']!r:>20}: ilike {row['ilike_ms']:>8}ms ({row['ilike_rows']}건) / "
+                    f"trigram {row['trigram_ms']:>8}ms ({row['trigram_rows']}건), 인덱스 {row['trigram_indexes'] or '-'}"
+                )
+        if args.cleanup:
+            print(f"벤치마크 학생 {cleanup_students(db)}명 삭제")
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()